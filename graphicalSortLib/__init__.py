@@ -1,5 +1,9 @@
 """
 Graphical sorting visualizer package that can be imported and executed with ``graphicalSortLib.run()``.
+
+Importing the package does not import ``tkinter``: the GUI is loaded on the
+first ``run()`` call or ``SortingVisualizerApp`` access, so headless code
+such as ``graphicalSortLib.core`` works without Tcl/Tk.
 """
 
 from __future__ import annotations
@@ -7,11 +11,13 @@ from __future__ import annotations
 import os
 import sys
 import threading
-import tkinter as _tk
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    import tkinter as _tk
 
-from .app import SortingVisualizerApp
+    from .app import SortingVisualizerApp
 
 __all__ = ["run", "SortingVisualizerApp"]
 
@@ -21,10 +27,20 @@ _lock = threading.Lock()
 _tcl_configured = False
 
 
+def __getattr__(name):
+    if name == "SortingVisualizerApp":
+        from .app import SortingVisualizerApp
+
+        return SortingVisualizerApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _create_tk_root() -> _tk.Tk:
     """
     Build a Tk root, retrying once with an explicit Tcl/Tk path discovery if needed.
     """
+    import tkinter as _tk
+
     try:
         return _tk.Tk()
     except _tk.TclError as exc:
@@ -50,6 +66,8 @@ def _ensure_tcl_runtime(force: bool = False) -> None:
     global _tcl_configured
     if _tcl_configured and not force:
         return
+    import tkinter as _tk
+
     for env_name, prefix, version_hint in (
         ("TCL_LIBRARY", "tcl", getattr(_tk, "TclVersion", 8.6)),
         ("TK_LIBRARY", "tk", getattr(_tk, "TkVersion", 8.6)),
@@ -104,6 +122,8 @@ def _version_suffixes(version_hint: float) -> list[str]:
 
 
 def _library_search_dirs() -> Iterable[Path]:
+    import tkinter as _tk
+
     tk_module_path = Path(_tk.__file__).resolve()
     python_root = tk_module_path.parent.parent.parent
     base_candidates: list[Path] = []
@@ -156,6 +176,10 @@ def run() -> SortingVisualizerApp:
     Multiple invocations focus the existing window so user code can call run()
     repeatedly without spawning duplicate Tk roots.
     """
+    import tkinter as _tk
+
+    from .app import SortingVisualizerApp
+
     global _root, _app
     app_instance: Optional[SortingVisualizerApp] = None
     with _lock:
@@ -0,0 +1,255 @@
+"""
+Command line entry point: ``python -m graphicalSortLib [command]``.
+
+Without a command the GUI is launched.
+"""
+
+import argparse
+import sys
+
+
+def _csv_list(text):
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def _input_values(args):
+    if args.input:
+        from .arrayfile import load_array
+
+        return list(load_array(args.input))
+    from .bench import generate_input
+
+    return generate_input(args.size, args.distribution, args.seed)
+
+
+def _cmd_record(args):
+    from .trace import record
+
+    values = _input_values(args)
+    if args.sorted:
+        values.sort()
+    reader = record(
+        args.output,
+        args.algorithm,
+        values,
+        target=args.target,
+        compress=not args.no_compress,
+    )
+    print(f"Recorded {reader.total_steps} steps of {reader.name} to {args.output} in {reader.elapsed:.3f}s.")
+    return 0
+
+
+def _cmd_bench(args):
+    from .bench import DISTRIBUTIONS, format_table, run_matrix, write_csv, write_json
+
+    for distribution in args.distributions:
+        if distribution not in DISTRIBUTIONS:
+            print(f"Unknown distribution {distribution!r}; choose from {', '.join(DISTRIBUTIONS)}.")
+            return 2
+    rows = run_matrix(
+        args.algorithms,
+        args.sizes,
+        args.distributions,
+        seed=args.seed,
+        warmup=max(0, args.warmup),
+        repeat=max(1, args.repeat),
+        timeout=args.timeout,
+        jobs=args.jobs,
+        vectorized=args.vectorized,
+    )
+    print(format_table(rows))
+    if args.json_path:
+        write_json(rows, args.json_path)
+    if args.csv_path:
+        write_csv(rows, args.csv_path)
+    return 0
+
+
+def _cmd_scaling(args):
+    from .bench import DISTRIBUTIONS, SCALING_FIELDS, format_scaling_table, run_scaling, write_csv, write_json
+
+    if args.distribution not in DISTRIBUTIONS:
+        print(f"Unknown distribution {args.distribution!r}; choose from {', '.join(DISTRIBUTIONS)}.")
+        return 2
+    rows = run_scaling(
+        args.algorithms,
+        args.size,
+        args.workers,
+        args.distribution,
+        seed=args.seed,
+        warmup=max(0, args.warmup),
+        repeat=max(1, args.repeat),
+    )
+    print(format_scaling_table(rows))
+    if args.json_path:
+        write_json(rows, args.json_path)
+    if args.csv_path:
+        write_csv(rows, args.csv_path, SCALING_FIELDS)
+    return 0
+
+
+def _cmd_export(args):
+    from .export import export_run
+
+    values = _input_values(args)
+    if args.sorted:
+        values.sort()
+    try:
+        result = export_run(
+            args.output,
+            args.algorithm,
+            values,
+            format=args.format,
+            width=args.width,
+            height=args.height,
+            frames=args.frames,
+            fps=args.fps,
+            theme=args.theme,
+            target=args.target,
+            seed=args.seed,
+            envelope=args.envelope,
+            workers=args.workers,
+        )
+    except ValueError as exc:
+        print(exc)
+        return 2
+    print(
+        f"Exported {result.steps} steps of {args.algorithm} as {result.frames} {result.format} frames "
+        f"({result.duplicates} duplicates merged) to {result.path} in {result.elapsed:.2f}s."
+    )
+    return 0
+
+
+def _cmd_profile(args):
+    from .core import search, sort
+    from .profiling import ProfileOptions, format_report
+    from .registry import SEARCH, algorithm_info
+
+    try:
+        info = algorithm_info(args.algorithm)
+    except KeyError:
+        info = None
+    if info is None:
+        print(f"Unknown algorithm: {args.algorithm}")
+        return 2
+    values = _input_values(args)
+    if args.sorted:
+        values.sort()
+    options = ProfileOptions(args.output_dir, cpu=not args.no_cpu, memory=not args.no_memory)
+    try:
+        if info.kind == SEARCH:
+            target = args.target if args.target is not None else (values[len(values) // 2] if values else 0)
+            stats = search(values, target, args.algorithm, profile=options)
+        else:
+            stats = sort(values, args.algorithm, seed=args.seed, profile=options)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    print(format_report(stats.profile))
+    return 0
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(prog="python -m graphicalSortLib")
+    commands = parser.add_subparsers(dest="command")
+
+    record_parser = commands.add_parser("record", help="Run an algorithm headless and record a trace file.")
+    record_parser.add_argument("algorithm", help='Algorithm name, e.g. "Quick Sort".')
+    record_parser.add_argument("output", help="Trace file to write.")
+    record_parser.add_argument(
+        "--input", default=None, help="Read the array from a .txt, .csv, .i32, .i64 or .npy file instead."
+    )
+    record_parser.add_argument("--size", type=int, default=1000)
+    record_parser.add_argument("--seed", type=int, default=None)
+    record_parser.add_argument("--distribution", default="random", help="Input distribution (see bench).")
+    record_parser.add_argument("--sorted", action="store_true", help="Sort the input first (needed for Binary Search).")
+    record_parser.add_argument("--target", type=int, default=None, help="Search target.")
+    record_parser.add_argument("--no-compress", action="store_true", help="Write uncompressed chunks.")
+    record_parser.set_defaults(handler=_cmd_record)
+
+    bench_parser = commands.add_parser("bench", help="Benchmark algorithms headless across sizes and inputs.")
+    bench_parser.add_argument("--algorithms", type=_csv_list, default=None, help="Comma separated names (default: all).")
+    bench_parser.add_argument("--sizes", type=lambda text: [int(size) for size in _csv_list(text)], default=[100, 1000])
+    bench_parser.add_argument("--distributions", type=_csv_list, default=["random"])
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("--repeat", type=int, default=5)
+    bench_parser.add_argument("--timeout", type=float, default=10.0, help="Per-run budget in seconds.")
+    bench_parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the matrix.")
+    bench_parser.add_argument(
+        "--vectorized", action="store_true", help="Time the NumPy versions of the sorts that have one."
+    )
+    bench_parser.add_argument("--json", dest="json_path", default=None, help="Write results as JSON.")
+    bench_parser.add_argument("--csv", dest="csv_path", default=None, help="Write results as CSV.")
+    bench_parser.set_defaults(handler=_cmd_bench)
+
+    scaling_parser = commands.add_parser("scaling", help="Measure multi-core speedup for 1, 2, 4, 8... workers.")
+    scaling_parser.add_argument(
+        "--algorithms", type=_csv_list, default=None, help="Comma separated names (default: all multi-core sorts)."
+    )
+    scaling_parser.add_argument("--size", type=int, default=1_000_000)
+    scaling_parser.add_argument(
+        "--workers", type=lambda text: [int(count) for count in _csv_list(text)], default=[1, 2, 4, 8]
+    )
+    scaling_parser.add_argument("--distribution", default="random")
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument("--warmup", type=int, default=1)
+    scaling_parser.add_argument("--repeat", type=int, default=3)
+    scaling_parser.add_argument("--json", dest="json_path", default=None, help="Write results as JSON.")
+    scaling_parser.add_argument("--csv", dest="csv_path", default=None, help="Write results as CSV.")
+    scaling_parser.set_defaults(handler=_cmd_scaling)
+
+    export_parser = commands.add_parser("export", help="Render a run headless to a GIF, APNG or PNG sequence.")
+    export_parser.add_argument("algorithm", help='Algorithm name, e.g. "Quick Sort".')
+    export_parser.add_argument(
+        "output", help="A .gif or .png (animated PNG) file, or a directory for a PNG sequence."
+    )
+    export_parser.add_argument("--format", choices=("gif", "apng", "png"), default=None, help="Override the format.")
+    export_parser.add_argument(
+        "--input", default=None, help="Read the array from a .txt, .csv, .i32, .i64 or .npy file instead."
+    )
+    export_parser.add_argument("--size", type=int, default=200)
+    export_parser.add_argument("--seed", type=int, default=None)
+    export_parser.add_argument("--distribution", default="random", help="Input distribution (see bench).")
+    export_parser.add_argument("--sorted", action="store_true", help="Sort the input first (needed for Binary Search).")
+    export_parser.add_argument("--target", type=int, default=None, help="Search target.")
+    export_parser.add_argument("--width", type=int, default=640)
+    export_parser.add_argument("--height", type=int, default=360)
+    export_parser.add_argument("--frames", type=int, default=300, help="Target frame count.")
+    export_parser.add_argument("--fps", type=float, default=30)
+    export_parser.add_argument("--theme", default="dark", help="dark or light.")
+    export_parser.add_argument("--envelope", action="store_true", help="Draw min-max envelopes when bars are merged.")
+    export_parser.add_argument("--workers", type=int, default=None, help="Encoder processes (default: CPU count).")
+    export_parser.set_defaults(handler=_cmd_export)
+
+    profile_parser = commands.add_parser(
+        "profile", help="Run an algorithm headless under cProfile and tracemalloc and write the reports."
+    )
+    profile_parser.add_argument("algorithm", help='Algorithm name, e.g. "Quick Sort".')
+    profile_parser.add_argument("--output-dir", default=".", help="Where to write <algorithm>.pstats and .profile.json.")
+    profile_parser.add_argument(
+        "--input", default=None, help="Read the array from a .txt, .csv, .i32, .i64 or .npy file instead."
+    )
+    profile_parser.add_argument("--size", type=int, default=10_000)
+    profile_parser.add_argument("--seed", type=int, default=None)
+    profile_parser.add_argument("--distribution", default="random", help="Input distribution (see bench).")
+    profile_parser.add_argument("--sorted", action="store_true", help="Sort the input first (needed for Binary Search).")
+    profile_parser.add_argument("--target", type=int, default=None, help="Search target (default: the middle value).")
+    profile_parser.add_argument("--no-cpu", action="store_true", help="Skip cProfile.")
+    profile_parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc.")
+    profile_parser.set_defaults(handler=_cmd_profile)
+    return parser
+
+
+def main(argv=None):
+    args = _build_parser().parse_args(argv)
+    if args.command is None:
+        from . import run
+
+        run()
+        return 0
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
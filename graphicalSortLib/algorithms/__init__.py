@@ -1,8 +1,16 @@
-from .binary_search import binary_search, is_non_decreasing
-from .linear_search import linear_search
+from .binary_search import binary_search, binary_search_steps, is_non_decreasing
+from .events import Cancelled, StepDriver, StepSink, as_sink, drive
+from .linear_search import linear_search, linear_search_steps
 
 __all__ = [
+    "Cancelled",
+    "StepDriver",
+    "StepSink",
+    "as_sink",
     "binary_search",
+    "binary_search_steps",
+    "drive",
     "is_non_decreasing",
     "linear_search",
+    "linear_search_steps",
 ]
@@ -1,14 +1,13 @@
-def binary_insertion_sort(array, visualizer):
-    def binary_search(arr, val, start, end, visualizer):
-        while start < end:
-            # Visualisiere den Bereich, der untersucht wird
-            colors = ["green" if i < start else "yellow" if start <= i < end else "blue" for i in range(len(arr))]
-            visualizer(arr, colors)
+from .events import COMPARE, MARK, STATE_SORTED, WRITE, as_sink, drive
+
 
+def binary_insertion_sort_steps(array):
+    def binary_search(arr, key_index, start, end):
+        val = arr[key_index]
+        while start < end:
             mid = (start + end) // 2
             # Visualisiere das Element, das gerade geprüft wird
-            colors[mid] = "red"
-            visualizer(arr, colors)
+            yield COMPARE, mid, key_index, 0
 
             if arr[mid] < val:
                 start = mid + 1
@@ -18,25 +17,25 @@ def binary_insertion_sort(array, visualizer):
         return start
 
     n = len(array)
+    if n:
+        yield MARK, 0, 1, STATE_SORTED
     for i in range(1, n):
-        # Visualisiere den aktuellen Zustand des Arrays
-        colors = ["green" if j < i else "blue" for j in range(n)]
-        colors[i] = "red"  # Das aktuelle Element zum Einfügen
-        visualizer(array, colors)
-
         val = array[i]
         # Finde die Position des aktuellen Elements mit Binary Search und visualisiere
-        pos = binary_search(array, val, 0, i, visualizer)
+        pos = yield from binary_search(array, i, 0, i)
 
         # Schiebe Elemente, um Platz zu schaffen
         for j in range(i, pos, -1):
             array[j] = array[j - 1]
+            yield WRITE, j, array[j], 0
 
         array[pos] = val
-
-        # Visualisiere den Zustand nach dem Einfügen
-        colors = ["green" if j <= i else "blue" for j in range(n)]
-        visualizer(array, colors)
+        yield WRITE, pos, val, 0
+        yield MARK, i, i + 1, STATE_SORTED
 
     # Markiere das gesamte Array als sortiert
-    visualizer(array, ["green"] * n)
+    yield MARK, 0, n, STATE_SORTED
+
+
+def binary_insertion_sort(array, visualizer):
+    drive(binary_insertion_sort_steps(array), as_sink(array, visualizer))
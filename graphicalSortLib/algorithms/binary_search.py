@@ -1,10 +1,38 @@
 from typing import Callable, Optional
 
+from .events import COMPARE, MARK, STATE_DEFAULT, STATE_RANGE, STATE_SORTED, STATE_VISITED, as_sink, drive
+
 
 def is_non_decreasing(values) -> bool:
     return all(values[idx] <= values[idx + 1] for idx in range(len(values) - 1))
 
 
+def binary_search_steps(array, target):
+    """Step generator for ``binary_search``; returns the found index or -1."""
+    low = 0
+    high = len(array) - 1
+    yield MARK, low, high + 1, STATE_RANGE
+
+    while low <= high:
+        mid = (low + high) // 2
+        yield COMPARE, mid, -1, 0
+
+        if array[mid] == target:
+            yield MARK, mid, mid + 1, STATE_SORTED
+            return mid
+
+        # Only the discarded part is reset, so marking stays O(n) over the whole search.
+        if array[mid] < target:
+            yield MARK, low, mid + 1, STATE_DEFAULT
+            low = mid + 1
+        else:
+            yield MARK, mid, high + 1, STATE_DEFAULT
+            high = mid - 1
+
+    yield MARK, 0, len(array), STATE_VISITED
+    return -1
+
+
 def binary_search(
     array,
     target,
@@ -20,31 +48,16 @@ def binary_search(
     """
     Visual binary search over a sorted array.
 
+    ``visualizer`` is either a ``StepSink`` or a legacy ``visualizer(colors)`` callback.
+
     Returns a tuple ``(index, colors)`` where ``index`` is:
     - found index if value exists
     - -1 if value does not exist
     - None if cancelled via ``should_stop``
     """
-    low = 0
-    high = len(array) - 1
-
-    while low <= high:
-        if should_stop and should_stop():
-            return None, [default_color] * len(array)
-
-        mid = (low + high) // 2
-        colors = [default_color] * len(array)
-        colors[low : high + 1] = [range_color] * (high - low + 1)
-        colors[mid] = current_color
-        visualizer(colors)
-
-        if array[mid] == target:
-            colors[mid] = found_color
-            return mid, colors
-
-        if array[mid] < target:
-            low = mid + 1
-        else:
-            high = mid - 1
-
-    return -1, [visited_color] * len(array)
+    palette = (default_color, found_color, range_color, current_color, current_color, visited_color)
+    sink = as_sink(array, visualizer, palette, pass_array=False)
+    index = drive(binary_search_steps(array, target), sink, should_stop)
+    if index is None:
+        return None, [default_color] * len(array)
+    return index, sink.colors(palette)
@@ -1,12 +1,18 @@
-def bubble_sort(array, visualizer):
+from .events import COMPARE, MARK, STATE_SORTED, SWAP, as_sink, drive
+
+
+def bubble_sort_steps(array):
     n = len(array)
     for i in range(n):
         for j in range(0, n - i - 1):
-            colors = ["blue"] * n
-            colors[j] = "red"
-            colors[j + 1] = "yellow"
+            yield COMPARE, j, j + 1, 0
             if array[j] > array[j + 1]:
                 array[j], array[j + 1] = array[j + 1], array[j]
-            visualizer(array, colors)
-        visualizer(array, ["green"] * (n - i - 1) + ["blue"] * (i + 1))
-    visualizer(array, ["green"] * n)
+                yield SWAP, j, j + 1, 0
+        # Das größte Element ist jetzt am Ende des Durchlaufs
+        yield MARK, n - i - 1, n - i, STATE_SORTED
+    yield MARK, 0, n, STATE_SORTED
+
+
+def bubble_sort(array, visualizer):
+    drive(bubble_sort_steps(array), as_sink(array, visualizer))
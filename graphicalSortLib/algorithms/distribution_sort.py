@@ -0,0 +1,265 @@
+"""
+Non-comparison sorts for integers: counting, LSD/MSD radix and bucket sort.
+
+They distribute values by key instead of comparing them, so they run in
+O(n + k) (counting sort, ``k`` the value range) or O(d * (n + b)) (radix
+sort, ``d`` digits in base ``b``). Negative values are handled by sorting
+``value - min``.
+
+The step generators show the distribution: reading a value into its
+counter or bucket marks it visited, and after each pass the written-back
+buckets are drawn as bands in the partition colors. Radix sorts default
+to base 10 so the digit passes are easy to follow.
+
+With NumPy installed, ``counting_sort_numpy`` and ``radix_sort_numpy``
+are vectorized versions for headless runs and benchmarks; they return a
+new sorted ``ndarray`` and produce no steps.
+"""
+
+from .events import (
+    AUX,
+    COMPARE,
+    MARK,
+    STATE_RANGE,
+    STATE_SORTED,
+    STATE_VISITED,
+    WRITE,
+    as_sink,
+    drive,
+    partition_state,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+# Counting sort allocates one counter per possible value; refuse ranges above this.
+MAX_COUNTING_RANGE = 1 << 22
+DEFAULT_RADIX = 10
+# Bucket sort aims for this many values per bucket.
+BUCKET_LOAD = 4
+
+
+def _key_range(array):
+    lo = min(array)
+    return lo, max(array) - lo + 1
+
+
+def _write_back(array, start, output, counts):
+    """Copy ``output`` into ``array[start:]`` bucket by bucket, leaving each bucket as a band."""
+    pos = start
+    band = 0
+    for count in counts:
+        if not count:
+            continue
+        for _ in range(count):
+            array[pos] = output[pos - start]
+            yield WRITE, pos, array[pos], 0
+            pos += 1
+        yield MARK, pos - count, pos, partition_state(band)
+        band += 1
+
+
+def counting_sort_steps(array):
+    """Steps of counting sort; raises ``ValueError`` up front if the value range exceeds ``MAX_COUNTING_RANGE``."""
+    lo, k = _key_range(array) if len(array) > 1 else (0, 0)
+    if k > MAX_COUNTING_RANGE:
+        raise ValueError(
+            f"Counting sort needs one counter per value; the range {k:,} is above {MAX_COUNTING_RANGE:,}. "
+            "Use a radix sort instead."
+        )
+    return _counting_sort_steps(array, lo, k)
+
+
+def _counting_sort_steps(array, lo, k):
+    n = len(array)
+    if n > 1:
+        counts = [0] * k
+        for i in range(n):
+            counts[array[i] - lo] += 1
+            yield MARK, i, i + 1, STATE_VISITED
+        yield AUX, n, n, 0
+
+        pos = 0
+        band = 0
+        for offset, count in enumerate(counts):
+            if not count:
+                continue
+            value = lo + offset
+            for _ in range(count):
+                array[pos] = value
+                yield WRITE, pos, value, 0
+                pos += 1
+            yield MARK, pos - count, pos, partition_state(band)
+            band += 1
+        yield AUX, k, 0, 0
+    yield MARK, 0, n, STATE_SORTED
+
+
+def radix_lsd_sort_steps(array, radix=DEFAULT_RADIX):
+    """Least significant digit first: one stable distribution pass per digit."""
+    n = len(array)
+    if n > 1:
+        lo, k = _key_range(array)
+        exp = 1
+        while True:
+            counts = [0] * radix
+            for i in range(n):
+                counts[(array[i] - lo) // exp % radix] += 1
+                yield MARK, i, i + 1, STATE_VISITED
+            starts = [0] * radix
+            for digit in range(1, radix):
+                starts[digit] = starts[digit - 1] + counts[digit - 1]
+            output = [0] * n
+            for value in array:
+                digit = (value - lo) // exp % radix
+                output[starts[digit]] = value
+                starts[digit] += 1
+            yield AUX, n + radix, 2 * n + radix, 0
+            yield from _write_back(array, 0, output, counts)
+            yield AUX, n, 0, 0
+            exp *= radix
+            if exp >= k:
+                break
+    yield MARK, 0, n, STATE_SORTED
+
+
+def radix_msd_sort_steps(array, radix=DEFAULT_RADIX):
+    """Most significant digit first: distribute by the top digit, then each bucket by the next."""
+    n = len(array)
+    if n > 1:
+        lo, k = _key_range(array)
+        top = 1
+        while top * radix < k:
+            top *= radix
+        # Explicit stack like merge sort; buckets are pushed right to left so they are handled left to right.
+        stack = [(0, n, top)]
+        while stack:
+            start, stop, exp = stack.pop()
+            if stop - start < 2 or exp == 0:
+                yield MARK, start, stop, STATE_SORTED
+                continue
+            yield MARK, start, stop, STATE_RANGE
+            counts = [0] * radix
+            for i in range(start, stop):
+                counts[(array[i] - lo) // exp % radix] += 1
+                yield MARK, i, i + 1, STATE_VISITED
+            starts = [0] * radix
+            for digit in range(1, radix):
+                starts[digit] = starts[digit - 1] + counts[digit - 1]
+            output = [0] * (stop - start)
+            for i in range(start, stop):
+                digit = (array[i] - lo) // exp % radix
+                output[starts[digit]] = array[i]
+                starts[digit] += 1
+            size = stop - start
+            yield AUX, size + radix, 2 * size + radix, 0
+            yield from _write_back(array, start, output, counts)
+            yield AUX, size, 0, 0
+            bucket_stop = stop
+            for count in reversed(counts):
+                if count:
+                    stack.append((bucket_stop - count, bucket_stop, exp // radix))
+                    bucket_stop -= count
+    yield MARK, 0, n, STATE_SORTED
+
+
+def bucket_sort_steps(array):
+    """Distribute into about ``n / BUCKET_LOAD`` equal-width buckets, then insertion sort each bucket in place."""
+    n = len(array)
+    if n > 1:
+        lo, k = _key_range(array)
+        bucket_count = max(1, n // BUCKET_LOAD)
+        buckets = [[] for _ in range(bucket_count)]
+        for i in range(n):
+            buckets[(array[i] - lo) * bucket_count // k].append(array[i])
+            yield MARK, i, i + 1, STATE_VISITED
+        yield AUX, 0, n, 0
+
+        output = [value for bucket in buckets for value in bucket]
+        counts = [len(bucket) for bucket in buckets]
+        yield from _write_back(array, 0, output, counts)
+        yield AUX, n, 0, 0
+
+        start = 0
+        for count in counts:
+            stop = start + count
+            for i in range(start + 1, stop):
+                key = array[i]
+                j = i - 1
+                while j >= start:
+                    yield COMPARE, j + 1, j, 0
+                    if not key < array[j]:
+                        break
+                    array[j + 1] = array[j]
+                    yield WRITE, j + 1, array[j], 0
+                    j -= 1
+                array[j + 1] = key
+                yield WRITE, j + 1, key, 0
+            if count:
+                yield MARK, start, stop, STATE_SORTED
+            start = stop
+    yield MARK, 0, n, STATE_SORTED
+
+
+def counting_sort(array, visualizer):
+    drive(counting_sort_steps(array), as_sink(array, visualizer))
+
+
+def radix_lsd_sort(array, visualizer):
+    drive(radix_lsd_sort_steps(array), as_sink(array, visualizer))
+
+
+def radix_msd_sort(array, visualizer):
+    drive(radix_msd_sort_steps(array), as_sink(array, visualizer))
+
+
+def bucket_sort(array, visualizer):
+    drive(bucket_sort_steps(array), as_sink(array, visualizer))
+
+
+def _as_keys(values):
+    if np is None:
+        raise RuntimeError("The vectorized sorts need NumPy.")
+    data = np.asarray(values)
+    if data.dtype.kind not in "iu":
+        data = data.astype(np.int64)
+    lo = int(data.min()) if data.size else 0
+    return data, lo
+
+
+def counting_sort_numpy(values):
+    """Vectorized counting sort: one ``bincount`` and one ``repeat``."""
+    data, lo = _as_keys(values)
+    if data.size < 2:
+        return data.copy()
+    k = int(data.max()) - lo + 1
+    if k > MAX_COUNTING_RANGE:
+        raise ValueError(f"Counting sort range {k:,} is above {MAX_COUNTING_RANGE:,}.")
+    counts = np.bincount(data - lo, minlength=k)
+    return np.repeat(np.arange(lo, lo + k, dtype=data.dtype), counts)
+
+
+def radix_sort_numpy(values, bits=8):
+    """
+    Vectorized LSD radix sort on ``bits``-wide digits (a byte by default).
+
+    Each pass is a stable ``argsort`` of one digit, which NumPy runs as a
+    radix sort itself for 8 and 16-bit keys, so every pass is O(n).
+    """
+    data, lo = _as_keys(values)
+    if data.size < 2:
+        return data.copy()
+    keys = (data - lo).astype(np.uint64)
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    mask = np.uint64((1 << bits) - 1)
+    span = int(keys.max())
+    shift = 0
+    while True:
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+        keys = keys[np.argsort(digits, kind="stable")]
+        shift += bits
+        if span >> shift == 0:
+            break
+    return (keys.astype(np.int64) + lo).astype(data.dtype)
@@ -0,0 +1,257 @@
+"""
+Compact step events shared by all algorithms and their consumers.
+
+Algorithms mutate the array themselves and describe every step with a small
+typed event instead of rebuilding a full ``colors`` list. A ``StepSink`` keeps
+the per-bar state, so each event costs O(1) (``mark`` costs O(hi - lo)).
+Every sink also counts the operations it sees in an ``OpCounter``.
+
+Each algorithm is written as a generator (``*_steps``) that yields
+``(kind, a, b, c)`` tuples after mutating the array and returns its result.
+``drive`` feeds such a generator into a sink in one go; the app instead
+pulls a batch of steps per frame on the Tk main loop.
+"""
+
+import time
+from array import array
+from itertools import islice
+from typing import Callable, Optional, Sequence
+
+COMPARE = 0
+SWAP = 1
+WRITE = 2
+MARK = 3
+# Bulk auxiliary-buffer accesses ``(AUX, reads, writes, 0)``; counted, never passed to ``on_step``.
+AUX = 4
+
+STATE_DEFAULT = 0
+STATE_SORTED = 1
+STATE_RANGE = 2
+STATE_CURRENT = 3
+STATE_PIVOT = 4
+STATE_VISITED = 5
+# Partitions or buckets shown side by side use ``partition_state(i)``, cycling through PARTITION_STATES colors.
+STATE_PARTITION = 6
+PARTITION_STATES = 4
+
+STATE_COUNT = STATE_PARTITION + PARTITION_STATES
+
+# Colors used by the legacy ``visualizer(array, colors)`` callbacks.
+LEGACY_PALETTE = ("blue", "green", "yellow", "red", "yellow", "gray", "purple", "orange", "cyan", "magenta")
+
+_NO_HIGHLIGHT = ()
+
+
+def pack_values(values, typecodes=("i", "q")):
+    """
+    Store integers in an ``array`` of the first typecode that holds them all
+    (``'i'`` takes 4 bytes per value instead of a list's pointer plus int
+    object), else in a list. ``values`` may be any iterable; it is read once.
+    """
+    if not isinstance(values, (list, tuple, range, array)):
+        # Each typecode attempt needs the whole input, not what an earlier one left of an iterator.
+        values = list(values)
+    for typecode in typecodes:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+    return list(values)
+
+
+def partition_state(index):
+    """Bar state for the ``index``-th partition or bucket."""
+    return STATE_PARTITION + index % PARTITION_STATES
+
+
+class Cancelled(Exception):
+    """Raised from a step hook to abort the running algorithm immediately."""
+
+
+class OpCounter:
+    """Exact operation counts of one run; plain integer slots so counting stays cheap."""
+
+    __slots__ = ("comparisons", "swaps", "writes", "aux_reads", "aux_writes")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.aux_reads = 0
+        self.aux_writes = 0
+
+    @property
+    def total(self):
+        return self.comparisons + self.swaps + self.writes + self.aux_reads + self.aux_writes
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class StepSink:
+    """
+    Receives step events from an algorithm and keeps the bar state.
+
+    ``states`` holds one persistent state per bar (set by ``mark``), while
+    ``compare``/``swap``/``write`` set a transient highlight that is replaced
+    by the next event. Subclasses override ``on_step`` to react to events.
+    Accesses to auxiliary buffers are reported in bulk through ``aux``; they
+    are only counted and never reach ``on_step``.
+    """
+
+    def __init__(self, array):
+        self.array = array
+        self.states = bytearray(len(array))
+        self.highlight = _NO_HIGHLIGHT
+        self.counter = OpCounter()
+
+    def compare(self, i, j=-1):
+        self.counter.comparisons += 1
+        self.highlight = (i, j)
+        self.on_step(COMPARE, i, j, 0)
+
+    def swap(self, i, j):
+        self.counter.swaps += 1
+        self.highlight = (i, j)
+        self.on_step(SWAP, i, j, 0)
+
+    def write(self, i, value):
+        self.counter.writes += 1
+        self.highlight = (i, -1)
+        self.on_step(WRITE, i, value, 0)
+
+    def aux(self, reads=0, writes=0):
+        counter = self.counter
+        counter.aux_reads += reads
+        counter.aux_writes += writes
+
+    def mark(self, lo, hi, state):
+        """Set the persistent state of bars ``lo`` (inclusive) to ``hi`` (exclusive)."""
+        if hi > lo:
+            self.states[lo:hi] = bytes((state,)) * (hi - lo)
+        self.highlight = _NO_HIGHLIGHT
+        self.on_step(MARK, lo, hi, state)
+
+    def on_step(self, kind, a, b, c):
+        pass
+
+    def colors(self, palette: Sequence[str]) -> list[str]:
+        """Resolve the current bar states (plus highlight) into a color list."""
+        colors = [palette[state] for state in self.states]
+        highlight = self.highlight
+        if highlight:
+            first, second = highlight
+            if second >= 0:
+                colors[second] = palette[STATE_PIVOT]
+            if first >= 0:
+                colors[first] = palette[STATE_CURRENT]
+        return colors
+
+
+class LegacyVisualizerSink(StepSink):
+    """Adapter that replays events into a ``visualizer(array, colors)`` callback."""
+
+    def __init__(self, array, visualizer, palette: Sequence[str] = LEGACY_PALETTE, pass_array=True):
+        super().__init__(array)
+        self.visualizer = visualizer
+        self.palette = palette
+        self.pass_array = pass_array
+
+    def on_step(self, kind, a, b, c):
+        colors = self.colors(self.palette)
+        if self.pass_array:
+            self.visualizer(self.array, colors)
+        else:
+            self.visualizer(colors)
+
+
+def as_sink(
+    array,
+    visualizer: Optional[Callable] = None,
+    palette: Sequence[str] = LEGACY_PALETTE,
+    pass_array=True,
+) -> StepSink:
+    """Return ``visualizer`` if it already is a sink, otherwise wrap the callback."""
+    if isinstance(visualizer, StepSink):
+        return visualizer
+    if visualizer is None:
+        return StepSink(array)
+    return LegacyVisualizerSink(array, visualizer, palette, pass_array)
+
+
+def drive(steps, sink: StepSink, should_stop: Optional[Callable[[], bool]] = None):
+    """
+    Run a step generator to completion, applying every step to ``sink``.
+
+    Returns the generator's return value, or ``None`` if ``should_stop``
+    returned true before a step.
+    """
+    driver = StepDriver(steps, sink)
+    try:
+        if should_stop is None:
+            driver.advance()
+        else:
+            while not driver.done:
+                if should_stop():
+                    return None
+                driver.advance(1)
+    finally:
+        driver.close()
+    return driver.result
+
+
+class StepDriver:
+    """
+    Applies the steps of a generator to a sink in batches.
+
+    ``advance`` pulls at most ``limit`` steps (all when ``None``) and stops
+    early once ``deadline`` (a ``time.perf_counter`` value) has passed. When
+    the generator is exhausted ``done`` is set and ``result`` holds its
+    return value.
+    """
+
+    # The deadline is checked once per this many steps.
+    DEADLINE_STRIDE = 256
+
+    def __init__(self, steps, sink: StepSink):
+        self.sink = sink
+        self.result = None
+        self.done = False
+        self.steps = 0
+        self._events = self._capture(steps)
+
+    def _capture(self, steps):
+        self.result = yield from steps
+        self.done = True
+
+    def advance(self, limit: Optional[int] = None, deadline: Optional[float] = None) -> int:
+        """Apply up to ``limit`` steps and return how many were applied."""
+        sink = self.sink
+        compare, swap, write, mark, aux = sink.compare, sink.swap, sink.write, sink.mark, sink.aux
+        events = self._events
+        taken = 0
+        while not self.done and (limit is None or taken < limit):
+            batch = self.DEADLINE_STRIDE if deadline is not None else limit
+            if limit is not None:
+                batch = min(batch, limit - taken)
+            count = 0
+            for kind, a, b, c in islice(events, batch):
+                count += 1
+                if kind == COMPARE:
+                    compare(a, b)
+                elif kind == SWAP:
+                    swap(a, b)
+                elif kind == WRITE:
+                    write(a, b)
+                elif kind == MARK:
+                    mark(a, b, c)
+                else:
+                    aux(a, b)
+            taken += count
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.steps += taken
+        return taken
+
+    def close(self):
+        self._events.close()
@@ -1,34 +1,43 @@
-def heap_sort(array, visualizer):
+from .events import COMPARE, MARK, STATE_SORTED, SWAP, as_sink, drive
+
+
+def heap_sort_steps(array):
     n = len(array)
-    sorted_indices = set()  # Track der sortierten Indizes
 
     def heapify(arr, n, i):
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
+        # Iterativ, damit jeder Schritt nur eine Generator-Ebene durchläuft
+        while True:
+            largest = i
+            left = 2 * i + 1
+            right = 2 * i + 2
 
-        if left < n and arr[left] > arr[largest]:
-            largest = left
-        if right < n and arr[right] > arr[largest]:
-            largest = right
+            if left < n:
+                yield COMPARE, left, largest, 0
+                if arr[left] > arr[largest]:
+                    largest = left
+            if right < n:
+                yield COMPARE, right, largest, 0
+                if arr[right] > arr[largest]:
+                    largest = right
 
-        if largest != i:
+            if largest == i:
+                return
             arr[i], arr[largest] = arr[largest], arr[i]
-            heapify(arr, n, largest)
-
-        colors = ["green" if x in sorted_indices else "blue" for x in range(len(arr))]
-        colors[largest] = "red"  # Bewegung
-        visualizer(arr, colors)
+            yield SWAP, largest, i, 0  # Bewegung
+            i = largest
 
     for i in range(n // 2 - 1, -1, -1):
-        heapify(array, n, i)
+        yield from heapify(array, n, i)
 
     for i in range(n - 1, 0, -1):
         array[i], array[0] = array[0], array[i]
-        sorted_indices.add(i)  # Markiere den Bereich als sortiert
-        heapify(array, i, 0)
-        colors = ["green" if x in sorted_indices else "blue" for x in range(len(array))]
-        visualizer(array, colors)
+        yield SWAP, i, 0, 0
+        yield MARK, i, i + 1, STATE_SORTED  # Markiere den Bereich als sortiert
+        yield from heapify(array, i, 0)
 
-    sorted_indices.add(0)  # Markiere die Wurzel am Ende als sortiert
-    visualizer(array, ["green"] * len(array))
+    # Markiere die Wurzel am Ende als sortiert
+    yield MARK, 0, n, STATE_SORTED
+
+
+def heap_sort(array, visualizer):
+    drive(heap_sort_steps(array), as_sink(array, visualizer))
@@ -1,14 +1,25 @@
-def insertion_sort(array, visualizer):
-    for i in range(1, len(array)):
+from .events import COMPARE, MARK, STATE_SORTED, WRITE, as_sink, drive
+
+
+def insertion_sort_steps(array):
+    n = len(array)
+    if n:
+        yield MARK, 0, 1, STATE_SORTED
+    for i in range(1, n):
         key = array[i]
         j = i - 1
-        while j >= 0 and key < array[j]:
-            colors = ["blue"] * len(array)
-            colors[j] = "yellow"  # Vergleich
-            colors[j + 1] = "red"  # Bewegung
+        while j >= 0:
+            yield COMPARE, j + 1, j, 0  # Vergleich
+            if not key < array[j]:
+                break
             array[j + 1] = array[j]
+            yield WRITE, j + 1, array[j], 0  # Bewegung
             j -= 1
-            visualizer(array, colors)
         array[j + 1] = key
-        visualizer(array, ["green"] * (i + 1) + ["blue"] * (len(array) - i - 1))
-    visualizer(array, ["green"] * len(array))
+        yield WRITE, j + 1, key, 0
+        yield MARK, i, i + 1, STATE_SORTED
+    yield MARK, 0, n, STATE_SORTED
+
+
+def insertion_sort(array, visualizer):
+    drive(insertion_sort_steps(array), as_sink(array, visualizer))
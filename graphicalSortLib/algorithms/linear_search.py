@@ -1,5 +1,21 @@
 from typing import Callable, Optional
 
+from .events import COMPARE, MARK, STATE_SORTED, STATE_VISITED, as_sink, drive
+
+
+def linear_search_steps(array, target):
+    """Step generator for ``linear_search``; returns the found index or -1."""
+    for idx, value in enumerate(array):
+        yield COMPARE, idx, -1, 0
+
+        if value == target:
+            yield MARK, idx, idx + 1, STATE_SORTED
+            return idx
+
+        yield MARK, idx, idx + 1, STATE_VISITED
+
+    return -1
+
 
 def linear_search(
     array,
@@ -15,26 +31,14 @@ def linear_search(
     """
     Visual linear search.
 
+    ``visualizer`` is either a ``StepSink`` or a legacy ``visualizer(colors)`` callback.
+
     Returns a tuple ``(index, colors)`` where ``index`` is:
     - found index if value exists
     - -1 if value does not exist
     - None if cancelled via ``should_stop``
     """
-    colors = [default_color] * len(array)
-
-    for idx, value in enumerate(array):
-        if should_stop and should_stop():
-            return None, colors
-
-        if idx > 0 and colors[idx - 1] != found_color:
-            colors[idx - 1] = visited_color
-        colors[idx] = current_color
-        visualizer(colors)
-
-        if value == target:
-            colors[idx] = found_color
-            return idx, colors
-
-        colors[idx] = visited_color
-
-    return -1, colors
+    palette = (default_color, found_color, current_color, current_color, current_color, visited_color)
+    sink = as_sink(array, visualizer, palette, pass_array=False)
+    index = drive(linear_search_steps(array, target), sink, should_stop)
+    return index, sink.colors(palette)
@@ -1,47 +1,57 @@
-def merge_sort(array, visualizer):
+from .events import AUX, COMPARE, MARK, STATE_DEFAULT, STATE_RANGE, STATE_SORTED, WRITE, as_sink, drive
+
+
+def merge_sort_steps(array):
     def merge(left, mid, right):
         left_part = array[left:mid + 1]
         right_part = array[mid + 1:right + 1]
+        yield MARK, left, right + 1, STATE_RANGE
 
         i = j = 0
         k = left
         while i < len(left_part) and j < len(right_part):
-            colors = ["blue"] * len(array)
-            for x in range(left, right + 1):
-                colors[x] = "yellow"
-            if left + i < len(array):
-                colors[left + i] = "red"
-            if mid + 1 + j < len(array):
-                colors[mid + 1 + j] = "red"
-            visualizer(array, colors)
-
+            yield COMPARE, left + i, mid + 1 + j, 0
             if left_part[i] <= right_part[j]:
                 array[k] = left_part[i]
                 i += 1
             else:
                 array[k] = right_part[j]
                 j += 1
+            yield WRITE, k, array[k], 0
             k += 1
-            visualizer(array, colors)
+        # Jeder Schritt oben liest zwei Hilfswerte für den Vergleich und einen zum Kopieren
+        aux_reads = 3 * (i + j) + (len(left_part) - i) + (len(right_part) - j)
+        yield AUX, aux_reads, len(left_part) + len(right_part), 0
 
         while i < len(left_part):
             array[k] = left_part[i]
+            yield WRITE, k, array[k], 0
             i += 1
             k += 1
-            visualizer(array, colors)
 
         while j < len(right_part):
             array[k] = right_part[j]
+            yield WRITE, k, array[k], 0
             j += 1
             k += 1
-            visualizer(array, colors)
 
-    def merge_sort_recursive(left, right):
-        if left < right:
-            mid = (left + right) // 2
-            merge_sort_recursive(left, mid)
-            merge_sort_recursive(mid + 1, right)
-            merge(left, mid, right)
+        yield MARK, left, right + 1, STATE_DEFAULT
 
-    merge_sort_recursive(0, len(array) - 1)
-    visualizer(array, ["green"] * len(array))
+    # Expliziter Stapel statt Rekursion: jede Generator-Ebene würde jeden Schritt weiterreichen
+    stack = [(0, len(array) - 1, False)]
+    while stack:
+        left, right, halves_sorted = stack.pop()
+        if left >= right:
+            continue
+        mid = (left + right) // 2
+        if halves_sorted:
+            yield from merge(left, mid, right)
+        else:
+            stack.append((left, right, True))
+            stack.append((mid + 1, right, False))
+            stack.append((left, mid, False))
+    yield MARK, 0, len(array), STATE_SORTED
+
+
+def merge_sort(array, visualizer):
+    drive(merge_sort_steps(array), as_sink(array, visualizer))
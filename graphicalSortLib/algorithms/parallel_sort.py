@@ -0,0 +1,261 @@
+"""
+Parallel merge sort and sample sort.
+
+The step generators show how the parallel versions split the work: every
+partition gets its own color and the steps of partitions that would run at
+the same time are interleaved round-robin. Parallel merge sort sorts
+``partitions`` slices side by side and then merges them pairwise, each
+level of the merge tree again side by side. Sample sort picks splitters
+from a regular sample, distributes every value into the bucket between two
+splitters (colored by its destination) and then sorts the buckets side by
+side.
+
+``merge_sort_multicore`` and ``sample_sort_multicore`` are the real
+multi-core versions for headless runs: they sort in place using a
+``ProcessPoolExecutor`` and produce no steps. Slices travel to the workers
+as ``array('q')``, which pickles as one memory copy. Sample sort sorts
+each slice before splitting it at the splitters, because cutting a sorted
+slice takes a few binary searches while bucketing it value by value would
+be a slow Python loop.
+"""
+
+import os
+from array import array as _array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+
+from .events import (
+    AUX,
+    COMPARE,
+    MARK,
+    PARTITION_STATES,
+    STATE_CURRENT,
+    STATE_SORTED,
+    WRITE,
+    as_sink,
+    drive,
+    pack_values,
+    partition_state,
+)
+
+DEFAULT_PARTITIONS = PARTITION_STATES
+# Sample sort draws this many samples per bucket to choose its splitters.
+SAMPLE_OVERSAMPLING = 8
+# Slices travel as one typecode, so merged runs never need converting.
+_SLICE_TYPECODES = ("q",)
+# Below this many values the multi-core versions sort in-process; shipping the data costs more.
+MIN_PARALLEL_SIZE = 1 << 14
+
+
+def _bounds(n, parts):
+    return [n * i // parts for i in range(parts + 1)]
+
+
+def _interleave(generators):
+    """Round-robin one step from each generator, like partitions being worked on at the same time."""
+    active = deque(generators)
+    while active:
+        steps = active.popleft()
+        try:
+            step = next(steps)
+        except StopIteration:
+            continue
+        yield step
+        active.append(steps)
+
+
+def _merge_range_steps(array, lo, mid, hi, state):
+    """Merge the sorted runs ``array[lo:mid]`` and ``array[mid:hi]``; leaves the range in ``state``."""
+    left_part = array[lo:mid]
+    right_part = array[mid:hi]
+    i = j = 0
+    k = lo
+    while i < len(left_part) and j < len(right_part):
+        yield COMPARE, lo + i, mid + j, 0
+        if left_part[i] <= right_part[j]:
+            array[k] = left_part[i]
+            i += 1
+        else:
+            array[k] = right_part[j]
+            j += 1
+        yield WRITE, k, array[k], 0
+        k += 1
+    aux_reads = 3 * (i + j) + (len(left_part) - i) + (len(right_part) - j)
+    yield AUX, aux_reads, len(left_part) + len(right_part), 0
+    for value in chain(left_part[i:], right_part[j:]):
+        array[k] = value
+        yield WRITE, k, value, 0
+        k += 1
+    yield MARK, lo, hi, state
+
+
+def _merge_sort_range_steps(array, lo, hi, state):
+    """Bottom-up merge sort of ``array[lo:hi]``."""
+    width = 1
+    while width < hi - lo:
+        for start in range(lo, hi, 2 * width):
+            mid = min(start + width, hi)
+            stop = min(start + 2 * width, hi)
+            if mid < stop:
+                yield from _merge_range_steps(array, start, mid, stop, state)
+        width *= 2
+
+
+def parallel_merge_sort_steps(array, partitions=DEFAULT_PARTITIONS):
+    n = len(array)
+    parts = max(1, min(partitions, n))
+    bounds = _bounds(n, parts)
+    for index in range(parts):
+        yield MARK, bounds[index], bounds[index + 1], partition_state(index)
+    yield from _interleave(
+        _merge_sort_range_steps(array, bounds[index], bounds[index + 1], partition_state(index))
+        for index in range(parts)
+    )
+
+    # Merge tree: each merged run keeps the color of its left half.
+    runs = [(bounds[index], bounds[index + 1], index) for index in range(parts)]
+    while len(runs) > 1:
+        merges = []
+        merged_runs = []
+        for pair in range(0, len(runs) - 1, 2):
+            (lo, mid, color), (_, hi, _) = runs[pair], runs[pair + 1]
+            merges.append(_merge_range_steps(array, lo, mid, hi, partition_state(color)))
+            merged_runs.append((lo, hi, color))
+        if len(runs) % 2:
+            merged_runs.append(runs[-1])
+        yield from _interleave(merges)
+        runs = merged_runs
+    yield MARK, 0, n, STATE_SORTED
+
+
+def parallel_sample_sort_steps(array, partitions=DEFAULT_PARTITIONS):
+    n = len(array)
+    parts = max(1, min(partitions, n))
+    bounds = [0, n]
+    if parts > 1:
+        # A regular sample rather than a random one, so the pacing probe sees the same run.
+        stride = max(1, n // (parts * SAMPLE_OVERSAMPLING))
+        for i in range(0, n, stride):
+            yield MARK, i, i + 1, STATE_CURRENT
+        sample = sorted(array[::stride])
+        splitters = [sample[len(sample) * index // parts] for index in range(1, parts)]
+        yield AUX, len(sample), len(sample), 0
+
+        buckets = [[] for _ in range(parts)]
+        for i in range(n):
+            bucket = bisect_right(splitters, array[i])
+            buckets[bucket].append(array[i])
+            yield MARK, i, i + 1, partition_state(bucket)
+        # Every value is looked up among the splitters and appended to its bucket.
+        yield AUX, n * len(splitters).bit_length(), n, 0
+
+        pos = 0
+        bounds = [0]
+        for index, bucket in enumerate(buckets):
+            for value in bucket:
+                array[pos] = value
+                yield WRITE, pos, value, 0
+                pos += 1
+            yield MARK, bounds[-1], pos, partition_state(index)
+            bounds.append(pos)
+        yield AUX, n, 0, 0
+
+    yield from _interleave(
+        _merge_sort_range_steps(array, bounds[index], bounds[index + 1], partition_state(index))
+        for index in range(len(bounds) - 1)
+    )
+    yield MARK, 0, n, STATE_SORTED
+
+
+def parallel_merge_sort(array, visualizer):
+    drive(parallel_merge_sort_steps(array), as_sink(array, visualizer))
+
+
+def parallel_sample_sort(array, visualizer):
+    drive(parallel_sample_sort_steps(array), as_sink(array, visualizer))
+
+
+def _store(array, values):
+    if isinstance(array, _array):
+        array[:] = _array(array.typecode, values)
+    else:
+        array[:] = values
+
+
+def _sort_slice(values):
+    return pack_values(sorted(values), _SLICE_TYPECODES)
+
+
+def _merge_runs(*runs):
+    # Timsort finds the sorted runs and merges them without comparing more than a merge would.
+    return pack_values(sorted(chain(*runs)), _SLICE_TYPECODES)
+
+
+def _split_slice(values, splitters):
+    ordered = sorted(values)
+    cuts = [0] + [bisect_right(ordered, splitter) for splitter in splitters] + [len(ordered)]
+    return [pack_values(ordered[start:stop], _SLICE_TYPECODES) for start, stop in zip(cuts, cuts[1:])]
+
+
+def _run_on_pool(work, workers, executor):
+    if executor is not None:
+        return work(executor)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return work(pool)
+
+
+def merge_sort_multicore(array, workers=None, executor=None):
+    """
+    Sort ``array`` in place: ``workers`` slices are sorted on a process pool,
+    then merged pairwise in parallel; the last merge runs in this process.
+
+    Pass ``executor`` to reuse a running pool; otherwise one is started for
+    the call. ``workers`` defaults to the CPU count.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(array)
+    if workers <= 1 or n < MIN_PARALLEL_SIZE:
+        _store(array, sorted(array))
+        return
+    bounds = _bounds(n, workers)
+    slices = [pack_values(array[bounds[index]:bounds[index + 1]], _SLICE_TYPECODES) for index in range(workers)]
+
+    def work(pool):
+        runs = list(pool.map(_sort_slice, slices))
+        while len(runs) > 2:
+            merged = list(pool.map(_merge_runs, runs[0:-1:2], runs[1::2]))
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        return runs
+
+    _store(array, sorted(chain(*_run_on_pool(work, workers, executor))))
+
+
+def sample_sort_multicore(array, workers=None, executor=None):
+    """
+    Sort ``array`` in place with sample sort on a process pool.
+
+    Splitters come from a regular sample. Each worker sorts one slice and
+    cuts it at the splitters; then each worker merges the pieces of one
+    bucket, and the buckets are concatenated. ``workers`` and ``executor``
+    are as in ``merge_sort_multicore``.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(array)
+    if workers <= 1 or n < MIN_PARALLEL_SIZE:
+        _store(array, sorted(array))
+        return
+    stride = max(1, n // (workers * SAMPLE_OVERSAMPLING))
+    sample = sorted(array[::stride])
+    splitters = [sample[len(sample) * index // workers] for index in range(1, workers)]
+    bounds = _bounds(n, workers)
+    slices = [pack_values(array[bounds[index]:bounds[index + 1]], _SLICE_TYPECODES) for index in range(workers)]
+
+    def work(pool):
+        pieces = list(pool.map(_split_slice, slices, repeat(splitters)))
+        return list(pool.map(_merge_runs, *pieces))
+
+    _store(array, chain.from_iterable(_run_on_pool(work, workers, executor)))
@@ -1,35 +1,36 @@
-def quick_sort(array, visualizer):
-    sorted_indices = set()  # Speichert alle fertig sortierten Indizes
+from .events import COMPARE, MARK, STATE_DEFAULT, STATE_PIVOT, STATE_SORTED, SWAP, as_sink, drive
 
-    def partition(low, high):
-        pivot = array[high]
-        i = low - 1
-        for j in range(low, high):
-            if array[j] < pivot:
-                i += 1
-                array[i], array[j] = array[j], array[i]
-            # Farben aktualisieren
-            colors = ["green" if idx in sorted_indices else "blue" for idx in range(len(array))]
-            colors[high] = "yellow"  # Pivot-Element
-            colors[j] = "red"  # Vergleichsindex
-            colors[i] = "yellow"  # Bereich in Bearbeitung
-            visualizer(array, colors)
-        array[i + 1], array[high] = array[high], array[i + 1]
-        return i + 1
 
-    def quick_sort_recursive(low, high):
+def quick_sort_steps(array):
+    # Expliziter Stapel statt Rekursion: jede Generator-Ebene würde jeden Schritt weiterreichen
+    stack = [(0, len(array) - 1)]
+    while stack:
+        low, high = stack.pop()
         if low < high:
-            pivot_index = partition(low, high)
+            pivot = array[high]
+            yield MARK, high, high + 1, STATE_PIVOT  # Pivot-Element
+            i = low - 1
+            for j in range(low, high):
+                yield COMPARE, j, high, 0  # Vergleichsindex
+                if array[j] < pivot:
+                    i += 1
+                    array[i], array[j] = array[j], array[i]
+                    yield SWAP, i, j, 0
+            array[i + 1], array[high] = array[high], array[i + 1]
+            yield SWAP, i + 1, high, 0
+            yield MARK, high, high + 1, STATE_DEFAULT
+            pivot_index = i + 1
             # Markiere das Pivot-Element als sortiert
-            sorted_indices.add(pivot_index)
-            # Sortiere die Teilbereiche
-            quick_sort_recursive(low, pivot_index - 1)
-            quick_sort_recursive(pivot_index + 1, high)
-            # Nach der Rekursion: Linken und rechten Teilbereich als sortiert markieren
-            sorted_indices.update(range(low, high + 1))
+            yield MARK, pivot_index, pivot_index + 1, STATE_SORTED
+            # Sortiere die Teilbereiche (links zuerst, also rechts zuerst auf den Stapel)
+            stack.append((pivot_index + 1, high))
+            stack.append((low, pivot_index - 1))
+        elif low == high:
+            # Einzelne Elemente sind bereits sortiert
+            yield MARK, low, low + 1, STATE_SORTED
+
+    yield MARK, 0, len(array), STATE_SORTED  # Endzustand grün
 
-            colors = ["green" if idx in sorted_indices else "blue" for idx in range(len(array))]
-            visualizer(array, colors)
 
-    quick_sort_recursive(0, len(array) - 1)
-    visualizer(array, ["green"] * len(array))  # Endzustand grün
+def quick_sort(array, visualizer):
+    drive(quick_sort_steps(array), as_sink(array, visualizer))
@@ -0,0 +1,226 @@
+"""
+Randomized "sorts": bogo, bozo and bogobogo sort.
+
+All three take a seeded ``random.Random`` and stop after ``max_attempts``
+attempts or ``time_budget`` seconds, whichever comes first, so runs are
+bounded and reproducible. Each returns a ``RandomizedSortReport`` with the
+number of attempts next to the expected number for the input; the ``*_steps``
+generators return the same report. When the budget runs out the array is
+left in its last (unsorted) order.
+"""
+
+import math
+import random
+import time
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from .events import COMPARE, MARK, STATE_SORTED, SWAP, as_sink, drive
+
+DEFAULT_MAX_ATTEMPTS = 100_000
+
+
+class RandomizedSortReport(NamedTuple):
+    algorithm: str
+    attempts: int
+    expected_attempts: int
+    sorted: bool
+    elapsed: float
+
+
+def distinct_permutations(values) -> int:
+    """Number of distinct orderings of ``values`` (duplicates are indistinguishable)."""
+    count = math.factorial(len(values))
+    for multiplicity in Counter(values).values():
+        count //= math.factorial(multiplicity)
+    return count
+
+
+def expected_attempts(values) -> int:
+    """
+    Expected attempts to sort ``values`` from a uniformly random order.
+
+    Bogo sort needs ``P - 1`` shuffles on average for ``P`` distinct orderings
+    and bozo sort roughly as many swaps. Bogobogo sort's prefix recursion
+    ``E(k) = k * E(k - 1) + k - 1`` solves to the same ``n! - 1`` for
+    distinct values.
+    """
+    return distinct_permutations(values) - 1
+
+
+class _OutOfBudget(Exception):
+    pass
+
+
+class _Budget:
+    def __init__(self, max_attempts, time_budget):
+        self.max_attempts = max_attempts
+        self.started = time.perf_counter()
+        self.deadline = None if time_budget is None else self.started + time_budget
+        self.attempts = 0
+
+    def spend(self):
+        """Account for one attempt; raises ``_OutOfBudget`` once the budget is used up."""
+        if self.max_attempts is not None and self.attempts >= self.max_attempts:
+            raise _OutOfBudget()
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _OutOfBudget()
+        self.attempts += 1
+
+    def report(self, algorithm, values, done):
+        elapsed = time.perf_counter() - self.started
+        return RandomizedSortReport(algorithm, self.attempts, expected_attempts(values), done, elapsed)
+
+
+def _shuffle(array, rng, length):
+    # Fisher-Yates, damit jeder Tausch als Ereignis sichtbar ist
+    for i in range(length - 1, 0, -1):
+        j = rng.randrange(i + 1)
+        array[i], array[j] = array[j], array[i]
+        yield SWAP, i, j, 0
+
+
+def _matches(array, reference):
+    # Vergleich mit der vorab sortierten Kopie, bricht beim ersten Fehler ab
+    for i, expected in enumerate(reference):
+        yield COMPARE, i, -1, 0
+        if array[i] != expected:
+            return False
+    return True
+
+
+def _finish(array, budget, algorithm, reference, done):
+    if done:
+        yield MARK, 0, len(array), STATE_SORTED
+    return budget.report(algorithm, reference, done)
+
+
+def bogosort_steps(
+    array,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+):
+    """Shuffle the whole array until it matches its sorted copy."""
+    rng = random.Random(seed)
+    reference = sorted(array)
+    budget = _Budget(max_attempts, time_budget)
+    done = yield from _matches(array, reference)
+    try:
+        while not done:
+            budget.spend()
+            yield from _shuffle(array, rng, len(array))
+            done = yield from _matches(array, reference)
+    except _OutOfBudget:
+        pass
+    return (yield from _finish(array, budget, "bogo", reference, done))
+
+
+def bozosort_steps(
+    array,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+):
+    """Swap two random elements until the array matches its sorted copy."""
+    rng = random.Random(seed)
+    reference = sorted(array)
+    budget = _Budget(max_attempts, time_budget)
+    length = len(array)
+    # Nur die zwei getauschten Positionen können sich ändern: Fehlstände mitzählen
+    mismatches = sum(1 for value, expected in zip(array, reference) if value != expected)
+    try:
+        while mismatches:
+            budget.spend()
+            i = rng.randrange(length)
+            j = rng.randrange(length)
+            if i == j:
+                continue
+            mismatches -= (array[i] != reference[i]) + (array[j] != reference[j])
+            array[i], array[j] = array[j], array[i]
+            yield SWAP, i, j, 0
+            yield COMPARE, i, -1, 0
+            yield COMPARE, j, -1, 0
+            mismatches += (array[i] != reference[i]) + (array[j] != reference[j])
+    except _OutOfBudget:
+        pass
+    return (yield from _finish(array, budget, "bozo", reference, not mismatches))
+
+
+def bogobogosort_steps(
+    array,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+):
+    """
+    Bogobogo sort the first ``k - 1`` elements, then check element ``k``.
+
+    If the prefix of length ``k`` is not sorted, it is shuffled and the
+    prefix of length ``k - 1`` is bogobogo sorted again. Every prefix
+    shuffle counts as one attempt.
+    """
+    rng = random.Random(seed)
+    budget = _Budget(max_attempts, time_budget)
+
+    def sort_prefix(length):
+        if length < 2:
+            return
+        yield from sort_prefix(length - 1)
+        while True:
+            yield COMPARE, length - 1, length - 2, 0
+            if array[length - 1] >= array[length - 2]:
+                return
+            budget.spend()
+            yield from _shuffle(array, rng, length)
+            yield from sort_prefix(length - 1)
+
+    try:
+        yield from sort_prefix(len(array))
+        done = True
+    except _OutOfBudget:
+        done = False
+    return (yield from _finish(array, budget, "bogobogo", array, done))
+
+
+def bogosort(
+    array,
+    visualizer=None,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+) -> RandomizedSortReport:
+    steps = bogosort_steps(array, seed=seed, max_attempts=max_attempts, time_budget=time_budget)
+    return drive(steps, as_sink(array, visualizer))
+
+
+def bozosort(
+    array,
+    visualizer=None,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+) -> RandomizedSortReport:
+    steps = bozosort_steps(array, seed=seed, max_attempts=max_attempts, time_budget=time_budget)
+    return drive(steps, as_sink(array, visualizer))
+
+
+def bogobogosort(
+    array,
+    visualizer=None,
+    *,
+    seed=None,
+    max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+    time_budget: Optional[float] = None,
+) -> RandomizedSortReport:
+    steps = bogobogosort_steps(array, seed=seed, max_attempts=max_attempts, time_budget=time_budget)
+    return drive(steps, as_sink(array, visualizer))
+
+
+RANDOMIZED_SORTS = (bogosort, bozosort, bogobogosort)
+RANDOMIZED_SORT_STEPS = (bogosort_steps, bozosort_steps, bogobogosort_steps)
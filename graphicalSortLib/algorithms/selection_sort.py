@@ -1,13 +1,20 @@
-def selection_sort(array, visualizer):
-    for i in range(len(array)):
+from .events import COMPARE, MARK, STATE_SORTED, SWAP, as_sink, drive
+
+
+def selection_sort_steps(array):
+    n = len(array)
+    for i in range(n):
         min_idx = i
-        for j in range(i + 1, len(array)):
-            colors = ["blue"] * len(array)
-            colors[min_idx] = "yellow"
-            colors[j] = "red"
+        for j in range(i + 1, n):
+            yield COMPARE, j, min_idx, 0
             if array[j] < array[min_idx]:
                 min_idx = j
-            visualizer(array, colors)
-        array[i], array[min_idx] = array[min_idx], array[i]
-        visualizer(array, ["green"] * (i + 1) + ["blue"] * (len(array) - i - 1))
-    visualizer(array, ["green"] * len(array))
+        if min_idx != i:
+            array[i], array[min_idx] = array[min_idx], array[i]
+            yield SWAP, i, min_idx, 0
+        yield MARK, i, i + 1, STATE_SORTED
+    yield MARK, 0, n, STATE_SORTED
+
+
+def selection_sort(array, visualizer):
+    drive(selection_sort_steps(array), as_sink(array, visualizer))
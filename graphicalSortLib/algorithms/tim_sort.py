@@ -1,57 +1,63 @@
-def tim_sort(array, visualizer):
+from .events import AUX, COMPARE, MARK, STATE_DEFAULT, STATE_RANGE, STATE_SORTED, WRITE, as_sink, drive
+
+
+def tim_sort_steps(array):
     RUN = 32
 
     def insertion_sort(arr, left, right):
+        yield MARK, left, right + 1, STATE_RANGE  # Bereich in Bearbeitung
         for i in range(left + 1, right + 1):
             key = arr[i]
             j = i - 1
-            while j >= left and arr[j] > key:
+            while j >= left:
+                yield COMPARE, j + 1, j, 0
+                if not arr[j] > key:
+                    break
                 arr[j + 1] = arr[j]
+                yield WRITE, j + 1, arr[j], 0  # Bewegung
                 j -= 1
-                colors = ["blue"] * len(arr)
-                for x in range(left, i + 1):
-                    colors[x] = "yellow"  # Bereich in Bearbeitung
-                colors[j + 1] = "red"  # Bewegung
-                visualizer(arr, colors)
             arr[j + 1] = key
-        visualizer(arr, ["blue"] * len(arr))
+            yield WRITE, j + 1, key, 0
+        yield MARK, left, right + 1, STATE_DEFAULT
 
     def merge(arr, left, mid, right):
         left_part = arr[left:mid + 1]
         right_part = arr[mid + 1:right + 1]
+        yield MARK, left, right + 1, STATE_RANGE
         i = j = 0
         k = left
 
         while i < len(left_part) and j < len(right_part):
-            colors = ["blue"] * len(arr)
-            for x in range(left, right + 1):
-                colors[x] = "yellow"
-            colors[k] = "red"  # Einfügeposition
-            visualizer(arr, colors)
-
+            yield COMPARE, left + i, mid + 1 + j, 0
             if left_part[i] <= right_part[j]:
                 arr[k] = left_part[i]
                 i += 1
             else:
                 arr[k] = right_part[j]
                 j += 1
+            yield WRITE, k, arr[k], 0  # Einfügeposition
             k += 1
+        # Jeder Schritt oben liest zwei Hilfswerte für den Vergleich und einen zum Kopieren
+        aux_reads = 3 * (i + j) + (len(left_part) - i) + (len(right_part) - j)
+        yield AUX, aux_reads, len(left_part) + len(right_part), 0
 
         while i < len(left_part):
             arr[k] = left_part[i]
+            yield WRITE, k, arr[k], 0
             i += 1
             k += 1
 
         while j < len(right_part):
             arr[k] = right_part[j]
+            yield WRITE, k, arr[k], 0
             j += 1
             k += 1
 
-        visualizer(arr, ["green" if left <= x <= right else "blue" for x in range(len(arr))])
+        yield MARK, left, right + 1, STATE_SORTED
 
     n = len(array)
     for i in range(0, n, RUN):
-        insertion_sort(array, i, min(i + RUN - 1, n - 1))
+        yield from insertion_sort(array, i, min(i + RUN - 1, n - 1))
 
     size = RUN
     while size < n:
@@ -59,7 +65,11 @@ def tim_sort(array, visualizer):
             mid = min(left + size - 1, n - 1)
             right = min(left + 2 * size - 1, n - 1)
             if mid < right:
-                merge(array, left, mid, right)
+                yield from merge(array, left, mid, right)
         size *= 2
 
-    visualizer(array, ["green"] * n)
+    yield MARK, 0, n, STATE_SORTED
+
+
+def tim_sort(array, visualizer):
+    drive(tim_sort_steps(array), as_sink(array, visualizer))
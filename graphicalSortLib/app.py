@@ -1,192 +1,103 @@
+import functools
 import json
-import math
 import random
-import threading
+import time
 import tkinter as tk
 import webbrowser
+from array import array
 from pathlib import Path
-from tkinter import messagebox, ttk
+from tkinter import filedialog, messagebox, ttk
 
 
 SETTINGS_PATH = Path.home() / ".graphical_sort_lib_settings.json"
-
-_THEME_PALETTES = {
-    "dark": {
-        "APP_BG": "#0F131A",
-        "PANEL_BG": "#171D26",
-        "PANEL_BORDER": "#2A3240",
-        "CANVAS_BG": "#0B1016",
-        "TEXT_COLOR": "#E6EDF3",
-        "MUTED_TEXT": "#9AA7B8",
-        "INPUT_BG": "#111827",
-        "BUTTON_BG": "#243041",
-        "BUTTON_ACTIVE_BG": "#33465E",
-        "START_BUTTON_BG": "#1F5F3B",
-        "START_BUTTON_ACTIVE_BG": "#2A7A4C",
-        "STOP_BUTTON_BG": "#5F2531",
-        "STOP_BUTTON_ACTIVE_BG": "#7A3342",
-        "ACCENT_COLOR": "#3DA5FF",
-        "LINK_COLOR": "#7DC4FF",
-        "DEFAULT_BAR_COLOR": "#4F8FF7",
-        "SORTED_BAR_COLOR": "#37D67A",
-        "SEARCH_RANGE_COLOR": "#2C6CA8",
-        "SEARCH_CURRENT_COLOR": "#F4C542",
-        "SEARCH_VISITED_COLOR": "#5B6472",
-        "WARNING_COLOR": "#FFB454",
-        "ERROR_COLOR": "#FF6B6B",
-    },
-    "light": {
-        "APP_BG": "#F3F6FB",
-        "PANEL_BG": "#FFFFFF",
-        "PANEL_BORDER": "#CBD5E1",
-        "CANVAS_BG": "#EAF0F8",
-        "TEXT_COLOR": "#1F2937",
-        "MUTED_TEXT": "#4B5563",
-        "INPUT_BG": "#FFFFFF",
-        "BUTTON_BG": "#E2E8F0",
-        "BUTTON_ACTIVE_BG": "#CBD5E1",
-        "START_BUTTON_BG": "#2F855A",
-        "START_BUTTON_ACTIVE_BG": "#38A169",
-        "STOP_BUTTON_BG": "#C53030",
-        "STOP_BUTTON_ACTIVE_BG": "#E53E3E",
-        "ACCENT_COLOR": "#2563EB",
-        "LINK_COLOR": "#1D4ED8",
-        "DEFAULT_BAR_COLOR": "#2D6DAF",
-        "SORTED_BAR_COLOR": "#2F9E44",
-        "SEARCH_RANGE_COLOR": "#8CB8E8",
-        "SEARCH_CURRENT_COLOR": "#E3B341",
-        "SEARCH_VISITED_COLOR": "#94A3B8",
-        "WARNING_COLOR": "#B7791F",
-        "ERROR_COLOR": "#C53030",
-    },
-}
+PROFILE_DIR = Path.home() / "graphical_sort_lib_profiles"
 
 
 def _set_theme_colors(theme_name):
-    palette = _THEME_PALETTES.get(theme_name, _THEME_PALETTES["dark"])
-    globals().update(palette)
-
-
-_set_theme_colors("dark")
-
-
-def _adaptive_delay(length, base_delay, baseline=200):
-    """Drop the delay as arrays grow so the framerate is never throttled."""
-    normalized_delay = max(0.0, base_delay)
-    if normalized_delay == 0.0 or length <= 0:
-        return 0.0
-    if length <= baseline:
-        return normalized_delay
-    over = max(0, length - baseline)
-    span = baseline if baseline > 0 else 1
-    factor = max(0.0, 1 - over / span)
-    return normalized_delay * factor
-
-
-def _frame_skip_interval(length, base=50, visible_capacity=None, estimated_ops=None):
-    """Return how many updates to skip to keep rendering responsive."""
-    capacity = visible_capacity if visible_capacity and visible_capacity > 0 else base
-    if capacity <= 0:
-        capacity = 1
-    scale_size = estimated_ops if estimated_ops and estimated_ops > 0 else length
-    if scale_size <= 0:
-        return 1
-    if scale_size <= capacity:
-        return 1
-    return max(1, math.ceil(scale_size / capacity))
-
-
-def _downsample(values, colors, max_samples, default_color):
-    """Reduce the dataset so each rendered bar stays at least 1px wide."""
-    length = len(values)
-    if max_samples is None or max_samples <= 0 or length <= max_samples:
-        return values, colors
-
-    chunk = max(1, -(-length // max_samples))
-    ds_values = []
-    ds_colors = []
-    for start in range(0, length, chunk):
-        end = min(length, start + chunk)
-        chunk_values = values[start:end]
-        chunk_colors = colors[start:end]
-        ds_values.append(max(chunk_values))
-        ds_color = default_color
-        for color in chunk_colors:
-            if color != default_color:
-                ds_color = color
-                break
-        ds_colors.append(ds_color)
-    return ds_values, ds_colors
-
-
-_N_LOG_N_ALGOS = {
-    "Quick Sort",
-    "Heap Sort",
-    "Tim Sort",
-    "Merge Sort",
-}
-
-_N_SQUARED_ALGOS = {
-    "Insertion Sort",
-    "Selection Sort",
-    "Bubble Sort",
-    "Binary Insertion Sort",
-}
-
-_SORT_ALGORITHMS = [
-    "Quick Sort",
-    "Heap Sort",
-    "Tim Sort",
-    "Insertion Sort",
-    "Merge Sort",
-    "Selection Sort",
-    "Bubble Sort",
-    "Bogo Sort",
-    "Binary Insertion Sort",
+    global _theme_colors
+    _theme_colors = _THEME_PALETTES.get(theme_name, _THEME_PALETTES["dark"])
+    globals().update(_theme_colors)
+
+
+def _sort_palette():
+    """Theme colors indexed by the bar states of ``algorithms.events``."""
+    return sort_palette(_theme_colors)
+
+
+def _search_palette():
+    return search_palette(_theme_colors)
+
+
+_REPLAY_TICK_MS = 16
+_RENDER_TICK_MS = 16
+# Paced runs dry-run their steps on a copy for up to this long, in slices of _PROBE_SLICE_S.
+_PROBE_BUDGET_S = 0.5
+_PROBE_SLICE_S = 0.008
+# Unpaced runs step for at least this long per frame, even when rendering eats the frame budget.
+_MIN_STEP_BATCH_S = 0.002
+_COUNTER_REFRESH_S = 0.25
+_HUD_MARGIN_PX = 10
+# From this many visible bars on, frames are drawn into one image instead of rectangles.
+_RASTER_BAR_THRESHOLD = 512
+# Race mode: lanes per race and each lane's label strip and bottom gap in pixels.
+_RACE_MIN_LANES = 2
+_RACE_MAX_LANES = 9
+_RACE_LABEL_PX = 18
+_RACE_GAP_PX = 4
+_ARRAY_FILETYPES = [
+    ("Text, one number per line", "*.txt"),
+    ("CSV", "*.csv"),
+    ("int32 binary", "*.i32 *.int32"),
+    ("int64 binary", "*.i64 *.int64 *.bin"),
+    ("NumPy array", "*.npy"),
+    ("All files", "*.*"),
 ]
 
-_SEARCH_ALGORITHMS = [
-    "Linear Search",
-    "Binary Search",
-]
+
+def _format_rate(value):
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 1_000:
+        return f"{value / 1_000:.1f}k"
+    return f"{value:.0f}"
 
 
-def _estimate_total_operations(algorithm_name, length):
-    """Estimate how many visualization updates the sort may trigger."""
-    if length <= 0:
-        return 0
-    n = max(1, length)
-    if algorithm_name in _N_LOG_N_ALGOS:
-        return n * math.log2(n)
-    if algorithm_name in _N_SQUARED_ALGOS:
-        return n * n
-    if algorithm_name == "Bogo Sort":
-        return n**3
-    return n
+def _format_counts(counter):
+    text = f"{counter.comparisons:,} comparisons · {counter.swaps:,} swaps · {counter.writes:,} writes"
+    if counter.aux_reads or counter.aux_writes:
+        text += f" · {counter.aux_reads:,}/{counter.aux_writes:,} aux reads/writes"
+    return text
 
 
-def _estimate_search_operations(algorithm_name, length):
-    if length <= 0:
-        return 0
-    if algorithm_name == "Linear Search":
-        return length
-    if algorithm_name == "Binary Search":
-        return max(1, int(math.log2(max(1, length))) + 1)
-    return length
+def _format_attempts(count):
+    if count < 1_000_000:
+        return f"{count:,}"
+    return f"10^{len(str(count)) - 1}"
 
 
 if __package__:
-    from .algorithms.binary_search import binary_search, is_non_decreasing
-    from .algorithms.binary_insertion_sort import binary_insertion_sort
-    from .algorithms.bogo_sort import bogosort
-    from .algorithms.bubble_sort import bubble_sort
-    from .algorithms.heap_sort import heap_sort
-    from .algorithms.insertion_sort import insertion_sort
-    from .algorithms.linear_search import linear_search
-    from .algorithms.merge_sort import merge_sort
-    from .algorithms.quick_sort import quick_sort
-    from .algorithms.selection_sort import selection_sort
-    from .algorithms.tim_sort import tim_sort
+    from .algorithms.binary_search import is_non_decreasing
+    from .algorithms.events import (
+        COMPARE,
+        MARK,
+        STATE_SORTED,
+        StepDriver,
+        StepSink,
+        pack_values,
+    )
+    from .algorithms.randomized_sort import RandomizedSortReport
+    from .arrayfile import ArrayFileError, open_array, save_array
+    from .downsample import display_bars
+    from .framestats import FrameStats, TclCallCounter
+    from .pacing import PacingController
+    from .profiling import ProfileOptions, RunProfiler, format_summary
+    from .raster import column_layout, column_spans, render_ppm, render_stacked_ppm
+    from .registry import SEARCH, SORT, algorithm_info, algorithm_names, estimate_steps, load_steps
+    from .replay import TraceReplay
+    from .themes import THEME_PALETTES as _THEME_PALETTES
+    from .themes import search_palette, sort_palette
+    from .trace import KIND_SEARCH, TraceFormatError
+    from .workers import StreamDriver, WorkerPool
 else:
     import os
     import sys
@@ -196,35 +107,92 @@ else:
     if _PROJECT_ROOT not in sys.path:
         sys.path.insert(0, _PROJECT_ROOT)
 
-    from graphicalSortLib.algorithms.binary_search import binary_search, is_non_decreasing
-    from graphicalSortLib.algorithms.binary_insertion_sort import binary_insertion_sort
-    from graphicalSortLib.algorithms.bogo_sort import bogosort
-    from graphicalSortLib.algorithms.bubble_sort import bubble_sort
-    from graphicalSortLib.algorithms.heap_sort import heap_sort
-    from graphicalSortLib.algorithms.insertion_sort import insertion_sort
-    from graphicalSortLib.algorithms.linear_search import linear_search
-    from graphicalSortLib.algorithms.merge_sort import merge_sort
-    from graphicalSortLib.algorithms.quick_sort import quick_sort
-    from graphicalSortLib.algorithms.selection_sort import selection_sort
-    from graphicalSortLib.algorithms.tim_sort import tim_sort
-
-
-_SORTING_ALGORITHM_MAP = {
-    "Quick Sort": quick_sort,
-    "Heap Sort": heap_sort,
-    "Tim Sort": tim_sort,
-    "Insertion Sort": insertion_sort,
-    "Merge Sort": merge_sort,
-    "Selection Sort": selection_sort,
-    "Bubble Sort": bubble_sort,
-    "Bogo Sort": bogosort,
-    "Binary Insertion Sort": binary_insertion_sort,
-}
-
-_SEARCH_ALGORITHM_MAP = {
-    "Linear Search": linear_search,
-    "Binary Search": binary_search,
-}
+    from graphicalSortLib.algorithms.binary_search import is_non_decreasing
+    from graphicalSortLib.algorithms.events import (
+        COMPARE,
+        MARK,
+        STATE_SORTED,
+        StepDriver,
+        StepSink,
+        pack_values,
+    )
+    from graphicalSortLib.algorithms.randomized_sort import RandomizedSortReport
+    from graphicalSortLib.arrayfile import ArrayFileError, open_array, save_array
+    from graphicalSortLib.downsample import display_bars
+    from graphicalSortLib.framestats import FrameStats, TclCallCounter
+    from graphicalSortLib.pacing import PacingController
+    from graphicalSortLib.profiling import ProfileOptions, RunProfiler, format_summary
+    from graphicalSortLib.raster import column_layout, column_spans, render_ppm, render_stacked_ppm
+    from graphicalSortLib.registry import SEARCH, SORT, algorithm_info, algorithm_names, estimate_steps, load_steps
+    from graphicalSortLib.replay import TraceReplay
+    from graphicalSortLib.themes import THEME_PALETTES as _THEME_PALETTES
+    from graphicalSortLib.themes import search_palette, sort_palette
+    from graphicalSortLib.trace import KIND_SEARCH, TraceFormatError
+    from graphicalSortLib.workers import StreamDriver, WorkerPool
+
+
+_set_theme_colors("dark")
+
+
+class _AppStepSink(StepSink):
+    """
+    Keeps the bar state of a running visualization.
+
+    The algorithm runs as a step generator on the Tk main loop: every render
+    tick pulls a batch of steps through ``driver`` and draws one frame, so
+    there is no worker thread. Paced runs first dry-run the same steps on a
+    copy through ``probe`` to learn the run length.
+    """
+
+    def __init__(self, app, palette, pacing, print_array=False, estimated_ops=0):
+        super().__init__(app.array)
+        self.estimated_ops = estimated_ops
+        self.palette = palette
+        self.pacing = pacing
+        self.paced = pacing.paced
+        self.print_array = print_array
+        self.driver = None
+        self.probe = None
+        self.probe_started = 0.0
+        self.paused_at = None
+        # A RunProfiler when the run is profiled; started once the probe is done.
+        self.profiler = None
+        # Maps the generator's return value to (status text, status color, redraw final state).
+        self.finish = None
+        self.outcome = None
+
+    def on_step(self, kind, a, b, c):
+        if self.print_array and kind != COMPARE and kind != MARK:
+            print("Current Array:", list(self.array))
+
+
+class _RaceLane:
+    """One algorithm of a race, running on its own copy of the array, in-process or in a worker from ``pool``."""
+
+    def __init__(self, name, values, make_steps, pool=None, seed=None):
+        self.name = name
+        # Shown in the lane label of randomized sorts, so a run can be repeated.
+        self.seed = seed
+        self.values = values
+        self.sink = StepSink(values)
+        # Created here even for workers, so input errors are raised in this process.
+        steps = make_steps(values)
+        if pool is None:
+            self.driver = StepDriver(steps, self.sink)
+        else:
+            steps.close()
+            self.driver = pool.stream(make_steps, values, self.sink)
+        # Wall time spent inside this lane's own steps; for workers, their compute time once done.
+        self.elapsed = 0.0
+        self.place = None
+        self.stopped = False
+
+    @property
+    def sorted(self):
+        result = self.driver.result
+        if isinstance(result, RandomizedSortReport):
+            return result.sorted
+        return self.driver.done
 
 
 class SortingVisualizerApp:
@@ -234,33 +202,69 @@ class SortingVisualizerApp:
         self._settings = self._load_settings()
         self.current_theme = "dark"
         self.theme_mode = tk.StringVar(value="dark")
+        self.envelope_view = tk.BooleanVar(value=self._settings["envelope"])
+        self.show_hud = tk.BooleanVar(value=self._settings["hud"])
         self._apply_theme(self._settings.get("theme", "dark"))
         self.root.configure(bg=APP_BG)
         self.root.geometry("1120x700")
         self.root.minsize(920, 580)
 
-        self.array = []
-        self.algorithm = tk.StringVar(value=_SORT_ALGORITHMS[0])
+        self.array = array("i")
+        self.algorithm = tk.StringVar(value=algorithm_names(SORT)[0])
         self.visualization_mode = tk.StringVar(value="sort")
         self.array_size = tk.IntVar(value=50)
         self.custom_array = tk.StringVar()
         self.search_target = tk.StringVar()
+        self.seed = tk.StringVar()
         self.delay = tk.DoubleVar(value=0.1)
-        self.stop_sorting = False
-        self.sorting_thread = None
+        self.duration = tk.DoubleVar(value=0.0)
+        self.use_workers = tk.BooleanVar(value=False)
+        self.profile_runs = tk.BooleanVar(value=False)
+        self._worker_pool = None
+        self._active_sink = None
+        self._render_job = None
+        self._run_started = 0.0
+        self._readout_mark = (0.0, 0)
+        self._race = None
+        self._race_job = None
+        self._race_pacing = None
+        self._race_started = 0.0
+        self._race_readout_time = 0.0
         self.array_mode = tk.StringVar(value="generate")
         self.output_after_swap = tk.BooleanVar(value=False)
+        self.replay_speed = tk.IntVar(value=1)
+        self.replay_position = tk.IntVar(value=0)
+        self._replay = None
+        self._replay_job = None
         self.status_text = tk.StringVar(value="Ready")
         self.status_color = MUTED_TEXT
-        self.rectangles = []
+        self.ops_text = tk.StringVar(value="")
+        self._frame_stats = FrameStats()
+        self._hud_time = 0.0
+        self._downsample_s = 0.0
+        self._reset_bar_pool()
 
         self._configure_styles()
         self.create_widgets()
         self.setup_plot()
         self._add_signature()
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_destroy(self, event):
+        if event.widget is self.root and self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+
+    def _workers(self):
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool()
+        return self._worker_pool
+
+    def _is_busy(self):
+        return self._active_sink is not None or self._race_job is not None
 
     def _load_settings(self):
-        default = {"theme": "dark"}
+        default = {"theme": "dark", "envelope": False, "hud": False}
         if not SETTINGS_PATH.is_file():
             return default
         try:
@@ -272,7 +276,11 @@ class SortingVisualizerApp:
         theme = data.get("theme", "dark")
         if theme not in _THEME_PALETTES:
             theme = "dark"
-        return {"theme": theme}
+        return {
+            "theme": theme,
+            "envelope": bool(data.get("envelope", False)),
+            "hud": bool(data.get("hud", False)),
+        }
 
     def _save_settings(self):
         try:
@@ -294,25 +302,43 @@ class SortingVisualizerApp:
         requested_theme = self.theme_mode.get()
         if requested_theme == self.current_theme:
             return
-        if self.sorting_thread and self.sorting_thread.is_alive():
+        if self._is_busy():
             messagebox.showinfo("Busy", "Please stop the current visualization before changing theme.")
             self.theme_mode.set(self.current_theme)
             return
         self._apply_theme(requested_theme, persist=True)
         self._rebuild_ui()
 
+    def _on_envelope_change(self):
+        self._settings["envelope"] = self.envelope_view.get()
+        self._save_settings()
+        self._redraw()
+
+    def _on_hud_change(self):
+        self._settings["hud"] = self.show_hud.get()
+        self._save_settings()
+        self._draw_hud(force=True)
+
+    def _on_workers_change(self):
+        # Worker runs compute their steps in another process, out of reach of the profilers.
+        if self.use_workers.get():
+            self.profile_runs.set(False)
+            self.profile_check.configure(state=tk.DISABLED)
+        else:
+            self.profile_check.configure(state=tk.NORMAL)
+
     def _rebuild_ui(self):
         if hasattr(self, "main_frame"):
             self.main_frame.destroy()
         if hasattr(self, "signature_label"):
             self.signature_label.destroy()
-        self.rectangles = []
+        self._reset_bar_pool()
         self.root.configure(bg=APP_BG)
         self._configure_styles()
         self.create_widgets()
         self.setup_plot()
         self._add_signature()
-        self.update_plot()
+        self._redraw()
 
     def _configure_styles(self):
         style = ttk.Style(self.root)
@@ -390,9 +416,6 @@ class SortingVisualizerApp:
         if hasattr(self, "status_label"):
             self.status_label.configure(fg=color)
 
-    def _set_status_async(self, text, color=None):
-        self.root.after(0, lambda: self._set_status(text, color))
-
     def _add_signature(self):
         label = tk.Label(
             self.root,
@@ -505,6 +528,35 @@ class SortingVisualizerApp:
             command=self._on_theme_change,
             **radio_style,
         ).pack(side=tk.LEFT)
+        tk.Checkbutton(
+            mode_frame,
+            text="Min/max envelope",
+            variable=self.envelope_view,
+            command=self._on_envelope_change,
+            **radio_style,
+        ).pack(side=tk.LEFT, padx=(24, 0))
+        tk.Checkbutton(
+            mode_frame,
+            text="Run in worker process",
+            variable=self.use_workers,
+            command=self._on_workers_change,
+            **radio_style,
+        ).pack(side=tk.LEFT, padx=(12, 0))
+        tk.Checkbutton(
+            mode_frame,
+            text="Performance HUD",
+            variable=self.show_hud,
+            command=self._on_hud_change,
+            **radio_style,
+        ).pack(side=tk.LEFT, padx=(12, 0))
+        self.profile_check = tk.Checkbutton(
+            mode_frame,
+            text="Profile runs",
+            variable=self.profile_runs,
+            **radio_style,
+        )
+        self.profile_check.pack(side=tk.LEFT, padx=(12, 0))
+        self._on_workers_change()
 
         self.array_size_label = tk.Label(self.controls_frame, text="Array Size:", **label_style)
         self.array_size_entry = tk.Entry(self.controls_frame, textvariable=self.array_size, width=8)
@@ -533,6 +585,11 @@ class SortingVisualizerApp:
             "Apply Custom Array",
             self.use_custom_array,
         )
+        self.load_array_button = self._make_button(
+            self.controls_frame,
+            "Load File...",
+            self.load_array_file,
+        )
 
         self.algorithm_label = tk.Label(self.controls_frame, text="Sorting Algorithm:", **label_style)
         self.algorithm_label.grid(row=2, column=0, padx=(12, 6), pady=6, sticky="w")
@@ -542,14 +599,21 @@ class SortingVisualizerApp:
             state="readonly",
             width=28,
             style="Theme.TCombobox",
-            values=_SORT_ALGORITHMS,
+            values=algorithm_names(SORT),
         )
         self.algo_menu.grid(row=2, column=1, padx=6, pady=6, sticky="w")
         self.algo_menu.current(0)
+        self.algo_menu.bind("<<ComboboxSelected>>", lambda _event: self._update_algorithm_info(), add="+")
+        self.algorithm_info_label = tk.Label(self.controls_frame, text="", **label_style)
+        self.algorithm_info_label.grid(row=2, column=4, columnspan=2, padx=6, pady=6, sticky="w")
+        self._update_algorithm_info()
 
         self.search_target_label = tk.Label(self.controls_frame, text="Target:", **label_style)
         self.search_target_entry = tk.Entry(self.controls_frame, textvariable=self.search_target, width=12)
         self._style_entry(self.search_target_entry)
+        self.seed_label = tk.Label(self.controls_frame, text="Seed (blank = random):", **label_style)
+        self.seed_entry = tk.Entry(self.controls_frame, textvariable=self.seed, width=12)
+        self._style_entry(self.seed_entry)
 
         tk.Label(self.controls_frame, text="Animation Delay (s):", **label_style).grid(
             row=3, column=0, padx=(12, 6), pady=6, sticky="w"
@@ -557,6 +621,12 @@ class SortingVisualizerApp:
         self.delay_entry = tk.Entry(self.controls_frame, textvariable=self.delay, width=8)
         self._style_entry(self.delay_entry)
         self.delay_entry.grid(row=3, column=1, padx=6, pady=6, sticky="w")
+        tk.Label(self.controls_frame, text="Run Duration (s, 0 = auto):", **label_style).grid(
+            row=3, column=2, padx=(12, 6), pady=6, sticky="w"
+        )
+        self.duration_entry = tk.Entry(self.controls_frame, textvariable=self.duration, width=8)
+        self._style_entry(self.duration_entry)
+        self.duration_entry.grid(row=3, column=3, padx=6, pady=6, sticky="w")
 
         self.output_checkbox = tk.Checkbutton(
             self.controls_frame,
@@ -571,7 +641,7 @@ class SortingVisualizerApp:
             selectcolor=INPUT_BG,
             highlightthickness=0,
         )
-        self.output_checkbox.grid(row=3, column=2, columnspan=2, padx=6, pady=6, sticky="w")
+        self.output_checkbox.grid(row=3, column=4, columnspan=2, padx=6, pady=6, sticky="w")
 
         buttons_frame = tk.Frame(self.controls_frame, bg=PANEL_BG)
         buttons_frame.grid(row=4, column=0, columnspan=6, padx=12, pady=(4, 4), sticky="w")
@@ -595,6 +665,29 @@ class SortingVisualizerApp:
             active_fg="#F8FAFC",
         )
         self.stop_button.pack(side=tk.LEFT)
+        self.pause_button = self._make_button(buttons_frame, "Pause", self.toggle_pause)
+        self.pause_button.pack(side=tk.LEFT, padx=(8, 0))
+        self.step_button = self._make_button(buttons_frame, "Step", self.step_once)
+        self.step_button.pack(side=tk.LEFT, padx=(8, 0))
+        self._set_run_controls(self._active_sink is not None)
+        self.load_trace_button = self._make_button(
+            buttons_frame,
+            "Load Trace",
+            self.load_trace,
+        )
+        self.load_trace_button.pack(side=tk.LEFT, padx=(8, 0))
+        self.save_array_button = self._make_button(
+            buttons_frame,
+            "Save Array...",
+            self.save_array_file,
+        )
+        self.save_array_button.pack(side=tk.LEFT, padx=(8, 0))
+        self.race_button = self._make_button(
+            buttons_frame,
+            "Race...",
+            self.open_race_dialog,
+        )
+        self.race_button.pack(side=tk.LEFT, padx=(8, 0))
 
         self.status_label = tk.Label(
             self.controls_frame,
@@ -603,7 +696,46 @@ class SortingVisualizerApp:
             fg=self.status_color,
             font=("Segoe UI", 10),
         )
-        self.status_label.grid(row=5, column=0, columnspan=6, padx=12, pady=(2, 10), sticky="w")
+        self.status_label.grid(row=5, column=0, columnspan=6, padx=12, pady=(2, 0), sticky="w")
+        self.ops_label = tk.Label(
+            self.controls_frame,
+            textvariable=self.ops_text,
+            bg=PANEL_BG,
+            fg=MUTED_TEXT,
+            font=("Segoe UI", 9),
+        )
+        self.ops_label.grid(row=6, column=0, columnspan=8, padx=12, pady=(0, 10), sticky="w")
+
+        self.replay_frame = tk.Frame(self.controls_frame, bg=PANEL_BG)
+        self.replay_play_button = self._make_button(
+            self.replay_frame,
+            "Play",
+            self.toggle_replay_playback,
+        )
+        self.replay_play_button.pack(side=tk.LEFT, padx=(0, 8))
+        tk.Label(self.replay_frame, text="Steps/Frame:", **label_style).pack(side=tk.LEFT, padx=(0, 6))
+        self.replay_speed_entry = tk.Entry(self.replay_frame, textvariable=self.replay_speed, width=8)
+        self._style_entry(self.replay_speed_entry)
+        self.replay_speed_entry.pack(side=tk.LEFT, padx=(0, 8))
+        self.replay_scale = tk.Scale(
+            self.replay_frame,
+            variable=self.replay_position,
+            orient=tk.HORIZONTAL,
+            from_=0,
+            to=0,
+            showvalue=False,
+            command=self._on_replay_scrub,
+            bg=PANEL_BG,
+            troughcolor=INPUT_BG,
+            activebackground=ACCENT_COLOR,
+            highlightthickness=0,
+            bd=0,
+        )
+        self.replay_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8))
+        self.replay_step_label = tk.Label(self.replay_frame, text="", **label_style)
+        self.replay_step_label.pack(side=tk.LEFT)
+        if self._replay is not None:
+            self._show_replay_controls()
 
         self.toggle_array_mode()
         self.toggle_visualization_mode()
@@ -619,27 +751,135 @@ class SortingVisualizerApp:
 
         self.canvas = tk.Canvas(plot_frame, height=400, bg=CANVAS_BG, highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-        self.canvas.bind("<Configure>", lambda _event: self.update_plot())
+        self.canvas.bind("<Configure>", lambda _event: self._redraw())
+        # Counts the Tcl commands of the canvas and of the raster image made on it, for the HUD.
+        self._tcl_calls = TclCallCounter.install(self.canvas)
+
+    def _redraw(self):
+        if self._replay is not None:
+            self._render_replay()
+        elif self._race is not None:
+            self._draw_race_frame()
+            self._update_race_labels(force=True)
+        else:
+            self.update_plot()
+        self._draw_hud(force=True)
+
+    def load_trace(self):
+        if self._is_busy():
+            messagebox.showinfo("Busy", "Please stop the current visualization before loading a trace.")
+            return
+        path = filedialog.askopenfilename(
+            title="Load Trace",
+            filetypes=[("Trace files", "*.gstrace"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            replay = TraceReplay.open(path)
+        except (OSError, TraceFormatError) as exc:
+            messagebox.showerror("Invalid Trace", str(exc))
+            return
+
+        self._close_replay()
+        self._replay = replay
+        self.array = replay.array
+        self._show_replay_controls()
+        self._render_replay()
+        if replay.reader.complete:
+            self._set_status(f"Loaded trace of {replay.reader.name} with {replay.total_steps} steps.", MUTED_TEXT)
+        else:
+            # A recorder that was killed leaves the chunks written so far.
+            self._set_status(
+                f"Loaded the first {replay.total_steps} steps of an unfinished {replay.reader.name} trace.",
+                WARNING_COLOR,
+            )
+
+    def _show_replay_controls(self):
+        self.replay_scale.configure(to=max(self._replay.total_steps, 0))
+        self.replay_position.set(self._replay.position)
+        self.replay_play_button.configure(text="Play" if self._replay_job is None else "Pause")
+        self.replay_frame.grid(row=7, column=0, columnspan=8, padx=12, pady=(0, 10), sticky="ew")
+
+    def _close_replay(self):
+        if self._replay is None:
+            return
+        self._pause_replay()
+        self._replay = None
+        self.replay_frame.grid_remove()
+
+    def _render_replay(self):
+        replay = self._replay
+        palette = _search_palette() if replay.reader.kind == KIND_SEARCH else _sort_palette()
+        self.update_plot(states=replay.sink.states, palette=palette, highlight=replay.sink.highlight)
+        self.replay_step_label.configure(text=f"Step {replay.position} / {replay.total_steps}")
+
+    def _on_replay_scrub(self, value):
+        if self._replay is None:
+            return
+        step = int(float(value))
+        if step == self._replay.position:
+            return
+        self._replay.seek(step)
+        self._render_replay()
+
+    def toggle_replay_playback(self):
+        if self._replay is None:
+            return
+        if self._replay_job is not None:
+            self._pause_replay()
+            return
+        self.replay_play_button.configure(text="Pause")
+        self._frame_stats.reset()
+        self._replay_job = self.root.after(0, self._replay_tick)
+
+    def _pause_replay(self):
+        if self._replay_job is not None:
+            self.root.after_cancel(self._replay_job)
+            self._replay_job = None
+        self.replay_play_button.configure(text="Play")
+
+    def _replay_tick(self):
+        self._replay_job = None
+        replay = self._replay
+        try:
+            speed = self.replay_speed.get()
+        except tk.TclError:
+            speed = 1
+        frame = self._begin_frame()
+        position = replay.position
+        replay.step(speed)
+        render_started = time.perf_counter()
+        self.replay_position.set(replay.position)
+        self._render_replay()
+        self._end_frame(frame, abs(replay.position - position), render_started)
+        if (speed >= 0 and replay.at_end) or (speed < 0 and replay.position == 0) or speed == 0:
+            self._pause_replay()
+            return
+        self._replay_job = self.root.after(_REPLAY_TICK_MS, self._replay_tick)
 
     def generate_array(self):
+        self._close_replay()
         size = self.array_size.get()
         if size <= 0:
             messagebox.showerror("Invalid Size", "Array size must be greater than 0.")
             return
-        self.array = list(range(1, size + 1))
+        self.array = pack_values(range(1, size + 1))
         self.update_plot()
         self._set_status(f"Generated sorted array with {size} elements.", MUTED_TEXT)
 
     def generate_random_array(self):
+        self._close_replay()
         size = self.array_size.get()
         if size <= 0:
             messagebox.showerror("Invalid Size", "Array size must be greater than 0.")
             return
-        self.array = [random.randint(1, size) for _ in range(size)]
+        self.array = pack_values(random.randint(1, size) for _ in range(size))
         self.update_plot()
         self._set_status(f"Generated random array with {size} elements.", MUTED_TEXT)
 
     def shuffle_array(self):
+        self._close_replay()
         if not self.array:
             messagebox.showinfo("No Array", "Please generate or provide an array first.")
             return
@@ -648,12 +888,13 @@ class SortingVisualizerApp:
         self._set_status("Array shuffled.", MUTED_TEXT)
 
     def use_custom_array(self):
+        self._close_replay()
         try:
             input_array = self.custom_array.get().strip().split()
             if not input_array:
                 messagebox.showerror("Invalid Input", "Please enter at least one integer.")
                 return
-            self.array = [int(x) for x in input_array]
+            self.array = pack_values(int(x) for x in input_array)
             self.update_plot()
             self._set_status(f"Loaded custom array with {len(self.array)} elements.", MUTED_TEXT)
         except ValueError:
@@ -662,59 +903,201 @@ class SortingVisualizerApp:
                 "Custom array must contain only integers separated by spaces.",
             )
 
-    def update_plot(self, colors=None):
+    def load_array_file(self):
+        """Load a text, CSV, binary or ``.npy`` file; a sampled preview is drawn while the rest is read."""
+        if self._is_busy():
+            messagebox.showinfo("Busy", "Please stop the current visualization before loading an array.")
+            return
+        path = filedialog.askopenfilename(title="Load Array", filetypes=_ARRAY_FILETYPES)
+        if not path:
+            return
+        try:
+            source = open_array(path)
+        except (OSError, ArrayFileError) as exc:
+            messagebox.showerror("Invalid Array File", str(exc))
+            return
+
+        self._close_replay()
+        previous = self.array
+        name = Path(path).name
+        with source:
+            preview = source.preview(max(1, self.canvas.winfo_width()))
+            if preview:
+                self.array = pack_values(preview)
+                self.update_plot()
+            size = f"{source.length:,} values" if source.length is not None else source.format
+            self._set_status(f"Loading {name} ({size}), showing a preview...", MUTED_TEXT)
+            self.root.update_idletasks()
+            try:
+                values = source.load()
+            except (OSError, ArrayFileError) as exc:
+                values = None
+                messagebox.showerror("Invalid Array File", str(exc))
+        if not values:
+            if values is not None:
+                messagebox.showerror("Invalid Array File", f"{name} contains no numbers.")
+            self.array = previous
+            self.update_plot()
+            self._set_status(f"Could not load {name}.", ERROR_COLOR)
+            return
+        self.array = values
+        self.update_plot()
+        self._set_status(f"Loaded {len(values):,} values from {name}.", MUTED_TEXT)
+
+    def save_array_file(self):
+        if not self.array:
+            messagebox.showinfo("No Array", "Please generate or provide an array first.")
+            return
+        path = filedialog.asksaveasfilename(title="Save Array", defaultextension=".txt", filetypes=_ARRAY_FILETYPES)
+        if not path:
+            return
+        try:
+            save_array(path, self.array)
+        except (OSError, ArrayFileError) as exc:
+            messagebox.showerror("Cannot Save Array", str(exc))
+            return
+        self._set_status(f"Saved {len(self.array):,} values to {Path(path).name}.", MUTED_TEXT)
+
+    def update_plot(self, states=None, palette=None, highlight=()):
+        """
+        Draw the array. Bar colors come from palette-index ``states`` plus a
+        sink's ``highlight``; ``palette`` turns indices into theme colors only
+        here, so no per-bar color list is ever built. Without states every
+        bar gets the default color.
+        """
         if not hasattr(self, "canvas"):
             return
+        if self._race is not None:
+            self._clear_race()
 
         if not self.array:
-            self.canvas.delete("all")
-            self.rectangles = []
+            self._hide_bars(0)
             return
 
-        if colors is None or len(colors) != len(self.array):
-            colors = [DEFAULT_BAR_COLOR] * len(self.array)
+        length = len(self.array)
+        if states is None or palette is None or len(states) != length:
+            states, palette = bytes(length), (DEFAULT_BAR_COLOR,)
+            highlight = ()
 
         width = max(self.canvas.winfo_width(), 1)
         height = max(self.canvas.winfo_height(), 1)
         capacity = self._visible_capacity()
         max_visible_bars = max(1, capacity if capacity else int(width))
-        display_values, display_colors = _downsample(
-            self.array,
-            colors,
-            max_visible_bars,
-            DEFAULT_BAR_COLOR,
+        downsample_started = time.perf_counter()
+        display_values, min_values, display_states, chunk = display_bars(
+            self.array, states, highlight, max_visible_bars, len(palette)
         )
+        self._downsample_s = time.perf_counter() - downsample_started
 
         max_value = max(display_values)
         if max_value == 0:
             max_value = 1
         display_len = len(display_values)
         bar_width = width / display_len
+        envelope = chunk > 1 and self.envelope_view.get()
+        scale = (height - 10) / max_value
 
-        def bar_coords(index, value):
-            x0 = index * bar_width
-            x1 = x0 + bar_width
-            bar_height = (value / max_value) * (height - 10)
-            y0 = height - bar_height
-            return x0, y0, x1, height
-
-        if len(self.rectangles) != display_len:
-            self.canvas.delete("all")
-            self.rectangles = []
-            for index, value in enumerate(display_values):
-                rect_id = self.canvas.create_rectangle(
-                    *bar_coords(index, value),
-                    fill=display_colors[index],
-                    outline="",
-                )
+        if display_len >= _RASTER_BAR_THRESHOLD:
+            self._hide_bars(0)
+            self._draw_raster(width, height, scale, display_values, min_values, display_states, palette, envelope)
+            self.canvas.update_idletasks()
+            return
+        self._hide_raster()
+
+        layout = (width, height, max_value, display_len, envelope)
+        if layout != self._bar_layout:
+            # Every bar moves when the canvas or the value scale changes.
+            self._bar_layout = layout
+            self._drawn_values = [None] * len(self.rectangles)
+        if palette != self._drawn_palette:
+            self._drawn_palette = palette
+            self._drawn_states = [None] * len(self.rectangles)
+        self._ensure_bar_pool(display_len)
+
+        canvas = self.canvas
+        rectangles = self.rectangles
+        drawn_values = self._drawn_values
+        drawn_states = self._drawn_states
+        for index in range(display_len):
+            value = display_values[index]
+            key = (value, min_values[index]) if envelope else value
+            if drawn_values[index] != key:
+                x0 = index * bar_width
+                top = height - value * scale
+                # The envelope spans each bucket's min..max, at least 1px tall.
+                bottom = max(top + 1, height - min_values[index] * scale) if envelope else height
+                canvas.coords(rectangles[index], x0, top, x0 + bar_width, bottom)
+                drawn_values[index] = key
+            state = display_states[index]
+            if drawn_states[index] != state:
+                canvas.itemconfig(rectangles[index], fill=palette[state])
+                drawn_states[index] = state
+        self._hide_bars(display_len)
+
+        canvas.update_idletasks()
+
+    def _reset_bar_pool(self):
+        self.rectangles = []
+        self._drawn_values = []
+        self._drawn_states = []
+        self._drawn_palette = None
+        self._shown_bars = 0
+        self._bar_layout = None
+        self._raster_photo = None
+        self._raster_item = None
+        self._rgb_cache = {}
+        self._race_labels = []
+        self._hud_items = None
+
+    def _draw_raster(self, width, height, scale, values, min_values, states, palette, envelope):
+        """Draw the bars into one ``PhotoImage`` instead of one rectangle item per bar."""
+        tops, bottoms, indices = column_spans(width, height, scale, values, min_values, states, envelope)
+        rgb_palette = [self._rgb(color) for color in palette]
+        ppm = render_ppm(width, height, tops, bottoms, indices, rgb_palette, self._rgb(CANVAS_BG))
+        self._show_raster(width, height, ppm)
+
+    def _show_raster(self, width, height, ppm):
+        photo = self._raster_photo
+        if photo is None or (photo.width(), photo.height()) != (width, height):
+            photo = self._raster_photo = tk.PhotoImage(master=self.canvas, width=width, height=height)
+            if self._raster_item is None:
+                self._raster_item = self.canvas.create_image(0, 0, anchor="nw", image=photo)
+                self._keep_hud_on_top()
+            else:
+                self.canvas.itemconfig(self._raster_item, image=photo)
+        photo.configure(data=ppm, format="PPM")
+        self.canvas.itemconfig(self._raster_item, state=tk.NORMAL)
+
+    def _hide_raster(self):
+        if self._raster_item is not None:
+            self.canvas.itemconfig(self._raster_item, state=tk.HIDDEN)
+
+    def _rgb(self, color):
+        """Resolve any Tk color to 8-bit ``(r, g, b)``; cached per color."""
+        rgb = self._rgb_cache.get(color)
+        if rgb is None:
+            rgb = tuple(channel >> 8 for channel in self.canvas.winfo_rgb(color))
+            self._rgb_cache[color] = rgb
+        return rgb
+
+    def _ensure_bar_pool(self, count):
+        """Grow the pool of rectangle items and show the first ``count`` of them."""
+        for index in range(self._shown_bars, min(count, len(self.rectangles))):
+            self.canvas.itemconfig(self.rectangles[index], state=tk.NORMAL)
+        if len(self.rectangles) < count:
+            while len(self.rectangles) < count:
+                rect_id = self.canvas.create_rectangle(0, 0, 0, 0, fill="", outline="")
                 self.rectangles.append(rect_id)
-        else:
-            for index, value in enumerate(display_values):
-                rect_id = self.rectangles[index]
-                self.canvas.coords(rect_id, *bar_coords(index, value))
-                self.canvas.itemconfig(rect_id, fill=display_colors[index])
+                self._drawn_values.append(None)
+                self._drawn_states.append(None)
+            self._keep_hud_on_top()
+        self._shown_bars = max(self._shown_bars, count)
 
-        self.canvas.update_idletasks()
+    def _hide_bars(self, count):
+        """Hide pooled items from index ``count`` on instead of deleting them."""
+        for index in range(count, self._shown_bars):
+            self.canvas.itemconfig(self.rectangles[index], state=tk.HIDDEN)
+        self._shown_bars = min(self._shown_bars, count)
 
     def _visible_capacity(self):
         if not hasattr(self, "canvas"):
@@ -724,19 +1107,274 @@ class SortingVisualizerApp:
             return None
         return max(1, int(width))
 
-    def _draw_visual_frame(self, colors, frame_state, total_ops):
-        frame_state["count"] += 1
-        skip_interval = _frame_skip_interval(
-            len(self.array),
-            visible_capacity=self._visible_capacity(),
+    def _create_run_sink(self, palette, total_ops, print_array=False):
+        """Build the step sink for a run from the delay and duration fields; ``None`` if they are invalid."""
+        try:
+            delay = self.delay.get()
+            duration = self.duration.get()
+        except tk.TclError:
+            messagebox.showerror("Invalid Timing", "Animation delay and duration must be numbers.")
+            return None
+        pacing = PacingController(
+            duration=duration,
+            delay=delay,
+            capacity=self._visible_capacity(),
+            fallback_total=total_ops,
+        )
+        return _AppStepSink(
+            self,
+            palette,
+            pacing,
+            print_array=print_array,
             estimated_ops=total_ops,
         )
-        if frame_state["count"] % skip_interval != 0:
+
+    def _start_run(self, make_steps, sink, finish, name):
+        """
+        Run ``make_steps(values)`` on the Tk main loop, or in a worker process
+        when enabled; ``finish`` maps its result to an outcome. With
+        **Profile runs** checked the run of algorithm ``name`` is profiled.
+        """
+        try:
+            # Algorithms check their input (e.g. counting sort's value range) when the generator is created.
+            steps = make_steps(self.array)
+        except ValueError as exc:
+            messagebox.showerror("Cannot Run Algorithm", str(exc))
+            self._set_status(str(exc), ERROR_COLOR)
+            return
+        self._active_sink = sink
+        sink.finish = finish
+        if self.profile_runs.get() and not self.use_workers.get():
+            sink.profiler = RunProfiler(name, ProfileOptions(str(PROFILE_DIR)))
+        if self.use_workers.get():
+            # The worker reports the exact step count when it finishes, so there is no probe.
+            steps.close()
+            sink.driver = self._workers().stream(make_steps, self.array, sink)
+            sink.pacing.begin(0, False)
+            self._start_profiler(sink)
+        elif sink.paced:
+            sink.driver = StepDriver(steps, sink)
+            probe_values = self.array[:]
+            sink.probe = StepDriver(make_steps(probe_values), StepSink(probe_values))
+            sink.probe_started = time.perf_counter()
+        else:
+            sink.driver = StepDriver(steps, sink)
+            sink.pacing.begin(0, False)
+            self._start_profiler(sink)
+        self._run_started = time.perf_counter()
+        self._readout_mark = (self._run_started, 0)
+        self._frame_stats.reset()
+        self.ops_text.set("")
+        self._set_run_controls(True)
+        self._render_job = self.root.after(_RENDER_TICK_MS, self._render_tick)
+
+    def _render_tick(self):
+        """Advance the active run by one batch of steps, draw a frame and reschedule."""
+        self._render_job = None
+        sink = self._active_sink
+        try:
+            self._render_frame(sink)
+        except Exception as exc:
+            self._abort_run(sink, exc)
+
+    def _render_frame(self, sink):
+        if sink.probe is not None:
+            self._probe_tick(sink)
+            self._render_job = self.root.after(1, self._render_tick)
+            return
+
+        pacing = sink.pacing
+        frame = self._begin_frame()
+        steps_before = sink.driver.steps
+        if sink.paced:
+            sink.driver.advance(pacing.skip)
+        else:
+            # Batch as many steps as the frame budget leaves after rendering.
+            budget = max(_MIN_STEP_BATCH_S, pacing.interval - pacing.render_time)
+            sink.driver.advance(deadline=time.perf_counter() + budget)
+        if isinstance(sink.driver, StreamDriver) and not pacing.exact_total and sink.driver.total is not None:
+            pacing.settle(sink.driver.total)
+        render_started = time.perf_counter()
+        self._draw_visual_frame(sink)
+        pacing.frame_done(sink.driver.steps, time.perf_counter() - render_started)
+        self._end_frame(frame, sink.driver.steps - steps_before, render_started)
+        self._update_ops_readout(sink)
+
+        if sink.driver.done:
+            self._finish_run(sink, sink.finish(sink.driver.result))
+            return
+        interval = max(1, int(pacing.interval * 1000)) if sink.paced else 1
+        self._render_job = self.root.after(interval, self._render_tick)
+
+    def _abort_run(self, sink, exc):
+        """Stop a run whose algorithm, worker, trace or drawing raised ``exc``, as **Stop** would, and report it."""
+        if sink.probe is not None:
+            sink.probe.close()
+        sink.driver.close()
+        if sink.profiler is not None:
+            # A failed run's profile would be misleading.
+            sink.profiler.cancel()
+        message = f"{type(exc).__name__}: {exc}"
+        self._finish_run(sink, (f"The run failed. {message}", ERROR_COLOR, False))
+        messagebox.showerror("Run Failed", message)
+
+    def _probe_tick(self, sink):
+        """Dry-run one slice of the probe; once it finishes or runs out of time, start pacing."""
+        probe = sink.probe
+        now = time.perf_counter()
+        probe.advance(deadline=now + _PROBE_SLICE_S)
+        if probe.done or now - sink.probe_started >= _PROBE_BUDGET_S:
+            probe.close()
+            sink.probe = None
+            sink.pacing.begin(probe.steps, probe.done)
+            # The probe's time is not part of the run.
+            self._run_started = time.perf_counter()
+            self._readout_mark = (self._run_started, 0)
+            self._start_profiler(sink)
+
+    def _start_profiler(self, sink):
+        if sink.profiler is not None:
+            sink.profiler.start()
+
+    def toggle_pause(self):
+        sink = self._active_sink
+        if sink is None:
+            return
+        if sink.paused_at is None:
+            sink.paused_at = time.perf_counter()
+            if self._render_job is not None:
+                self.root.after_cancel(self._render_job)
+                self._render_job = None
+            self.pause_button.configure(text="Resume")
+            self._set_status("Paused.", MUTED_TEXT)
+            return
+        paused = time.perf_counter() - sink.paused_at
+        sink.paused_at = None
+        sink.pacing.shift(paused)
+        if sink.probe is not None:
+            # Paused time does not count against the probe's budget either.
+            sink.probe_started += paused
+        self._run_started += paused
+        self.pause_button.configure(text="Pause")
+        self._set_status("Running...", MUTED_TEXT)
+        self._render_job = self.root.after(1, self._render_tick)
+
+    def step_once(self):
+        """Apply a single step of a paused run and draw it."""
+        sink = self._active_sink
+        if sink is None or sink.paused_at is None or sink.probe is not None:
+            return
+        try:
+            sink.driver.advance(1)
+            self._draw_visual_frame(sink)
+        except Exception as exc:
+            self._abort_run(sink, exc)
+            return
+        self._readout_mark = (0.0, 0)
+        self._update_ops_readout(sink)
+        if sink.driver.done:
+            self._finish_run(sink, sink.finish(sink.driver.result))
+
+    def _set_run_controls(self, running):
+        if not hasattr(self, "pause_button"):
+            return
+        state = tk.NORMAL if running else tk.DISABLED
+        self.pause_button.configure(text="Pause", state=state)
+        self.step_button.configure(state=state)
+
+    def _begin_frame(self):
+        """Start measuring a frame for the HUD; pass the result to ``_end_frame``."""
+        self._downsample_s = 0.0
+        return time.perf_counter(), self._tcl_calls.calls
+
+    def _end_frame(self, frame, steps, render_started):
+        """Record a frame that applied ``steps`` steps and started drawing at ``render_started``."""
+        started, tcl_before = frame
+        now = time.perf_counter()
+        self._frame_stats.record(
+            render_started - started,
+            self._downsample_s,
+            now - render_started,
+            steps,
+            self._tcl_calls.calls - tcl_before,
+            now,
+        )
+        self._draw_hud()
+
+    def _draw_hud(self, force=False):
+        """Show the frame stats in the canvas's top right corner, at most every ``_COUNTER_REFRESH_S`` seconds."""
+        canvas = self.canvas
+        if not self.show_hud.get():
+            if self._hud_items is not None:
+                canvas.delete("hud")
+                self._hud_items = None
+            return
+        now = time.perf_counter()
+        if not force and now - self._hud_time < _COUNTER_REFRESH_S:
             return
-        self.update_plot(colors)
-        self.root.update_idletasks()
-        frame_delay = _adaptive_delay(len(self.array), self.delay.get())
-        self.root.after(int(frame_delay * 1000))
+        self._hud_time = now
+        if self._hud_items is None:
+            self._hud_items = (
+                canvas.create_rectangle(0, 0, 0, 0, fill=PANEL_BG, outline=PANEL_BORDER, tags="hud"),
+                canvas.create_text(0, 0, anchor="ne", fill=TEXT_COLOR, font=("Consolas", 9), tags="hud"),
+            )
+        background, text = self._hud_items
+        canvas.coords(text, max(canvas.winfo_width(), 1) - _HUD_MARGIN_PX, _HUD_MARGIN_PX)
+        canvas.itemconfig(text, text=self._frame_stats.format())
+        x0, y0, x1, y1 = canvas.bbox(text)
+        canvas.coords(background, x0 - 6, y0 - 4, x1 + 6, y1 + 4)
+        canvas.tag_raise("hud")
+
+    def _keep_hud_on_top(self):
+        if self._hud_items is not None:
+            self.canvas.tag_raise("hud")
+
+    def _draw_visual_frame(self, sink):
+        self.update_plot(states=sink.states, palette=sink.palette, highlight=sink.highlight)
+
+    def _update_ops_readout(self, sink):
+        """Refresh the counter line at most every ``_COUNTER_REFRESH_S`` seconds."""
+        now = time.perf_counter()
+        last_time, last_total = self._readout_mark
+        if now - last_time < _COUNTER_REFRESH_S:
+            return
+        total = sink.counter.total
+        rate = (total - last_total) / (now - last_time)
+        self._readout_mark = (now, total)
+        self.ops_text.set(f"{_format_counts(sink.counter)} · {_format_rate(rate)} ops/s")
+
+    def _finish_run(self, sink, outcome):
+        self._active_sink = None
+        sink.outcome = outcome
+        self._set_run_controls(False)
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+        elapsed = max(time.perf_counter() - self._run_started, 1e-9)
+        counter = sink.counter
+        self.ops_text.set(
+            f"{_format_counts(counter)} in {elapsed:.2f}s "
+            f"({_format_rate(counter.total / elapsed)} ops/s, estimated {int(sink.estimated_ops):,} steps)"
+        )
+        profile_note = self._stop_profiler(sink)
+        if sink.outcome is None:
+            return
+        text, color, redraw = sink.outcome
+        if redraw:
+            self._draw_visual_frame(sink)
+        self._set_status(f"{text} {profile_note}" if profile_note else text, color)
+
+    def _stop_profiler(self, sink):
+        """Write the run's profile, if it has one, and return a note for the status line."""
+        profiler = sink.profiler
+        if profiler is None or not profiler.running:
+            # Stopped while probing: nothing was profiled.
+            return ""
+        try:
+            report = profiler.stop(sink.array, sink.counter)
+        except OSError as exc:
+            return f"Could not write the profile: {exc}"
+        return f"Profile ({format_summary(report)}) written to {PROFILE_DIR}."
 
     def toggle_array_mode(self):
         if self.array_mode.get() == "generate":
@@ -749,10 +1387,12 @@ class SortingVisualizerApp:
             self.custom_array_label.grid_remove()
             self.custom_array_entry.grid_remove()
             self.use_custom_array_button.grid_remove()
+            self.load_array_button.grid_remove()
         else:
             self.custom_array_label.grid(row=1, column=0, padx=(12, 6), pady=6, sticky="w")
             self.custom_array_entry.grid(row=1, column=1, columnspan=2, padx=6, pady=6, sticky="ew")
             self.use_custom_array_button.grid(row=1, column=3, padx=6, pady=6, sticky="w")
+            self.load_array_button.grid(row=1, column=4, padx=6, pady=6, sticky="w")
 
             self.array_size_label.grid_remove()
             self.array_size_entry.grid_remove()
@@ -764,66 +1404,101 @@ class SortingVisualizerApp:
         mode = self.visualization_mode.get()
         if mode == "sort":
             self.algorithm_label.configure(text="Sorting Algorithm:")
-            self.algo_menu.configure(values=_SORT_ALGORITHMS)
-            if self.algorithm.get() not in _SORT_ALGORITHMS:
-                self.algorithm.set(_SORT_ALGORITHMS[0])
+            sort_names = algorithm_names(SORT)
+            self.algo_menu.configure(values=sort_names)
+            if self.algorithm.get() not in sort_names:
+                self.algorithm.set(sort_names[0])
+            self._update_algorithm_info()
             self.start_button.configure(text="Start Sorting")
-            self.output_checkbox.grid(row=3, column=2, columnspan=2, padx=6, pady=6, sticky="w")
+            self.output_checkbox.grid(row=3, column=4, columnspan=2, padx=6, pady=6, sticky="w")
             self.search_target_label.grid_remove()
             self.search_target_entry.grid_remove()
+            self.seed_label.grid(row=2, column=2, padx=(12, 6), pady=6, sticky="w")
+            self.seed_entry.grid(row=2, column=3, padx=6, pady=6, sticky="w")
             self._set_status("Ready to sort.", MUTED_TEXT)
             return
 
         self.algorithm_label.configure(text="Search Algorithm:")
-        self.algo_menu.configure(values=_SEARCH_ALGORITHMS)
-        if self.algorithm.get() not in _SEARCH_ALGORITHMS:
-            self.algorithm.set(_SEARCH_ALGORITHMS[0])
+        search_names = algorithm_names(SEARCH)
+        self.algo_menu.configure(values=search_names)
+        if self.algorithm.get() not in search_names:
+            self.algorithm.set(search_names[0])
+        self._update_algorithm_info()
         self.start_button.configure(text="Start Search")
         self.output_checkbox.grid_remove()
+        self.seed_label.grid_remove()
+        self.seed_entry.grid_remove()
         self.search_target_label.grid(row=2, column=2, padx=(12, 6), pady=6, sticky="w")
         self.search_target_entry.grid(row=2, column=3, padx=6, pady=6, sticky="w")
         self._set_status("Ready to search.", MUTED_TEXT)
 
+    def _update_algorithm_info(self):
+        """Show the complexity metadata of the selected algorithm next to the menu."""
+        try:
+            text = algorithm_info(self.algorithm.get()).describe()
+        except KeyError:
+            text = ""
+        self.algorithm_info_label.configure(text=text)
+
     def start_action(self):
+        self._close_replay()
         if self.visualization_mode.get() == "search":
             self.start_search()
         else:
             self.start_sorting()
 
     def start_sorting(self):
-        self.stop_sorting = False
-        if self.sorting_thread and self.sorting_thread.is_alive():
+        if self._is_busy():
             return
         if not self.array:
             messagebox.showinfo("No Array", "Please generate or provide an array first.")
             return
 
         selected_algo_name = self.algorithm.get()
-        algorithm = _SORTING_ALGORITHM_MAP[selected_algo_name]
-        self._set_status(f"Sorting with {selected_algo_name}...", MUTED_TEXT)
-
-        def run_sorting():
-            frame_state = {"count": 0}
-            total_ops_estimate = _estimate_total_operations(selected_algo_name, len(self.array))
-
-            def visualizer(array, colors):
-                if self.stop_sorting:
-                    return
-                if self.output_after_swap.get():
-                    print("Current Array:", array)
-                self._draw_visual_frame(colors, frame_state, total_ops_estimate)
-
-            algorithm(self.array, visualizer)
-            if self.stop_sorting:
-                self._set_status_async("Sorting stopped.", WARNING_COLOR)
+        make_steps = load_steps(selected_algo_name)
+        seed = None
+        if algorithm_info(selected_algo_name).randomized:
+            seed = self._run_seed()
+            if seed is None:
                 return
-
-            self.update_plot([SORTED_BAR_COLOR] * len(self.array))
-            self._set_status_async("Sorting finished.", SORTED_BAR_COLOR)
+            # One seed per run, so the pacing probe sees the same attempts as the run.
+            make_steps = functools.partial(make_steps, seed=seed)
+        seed_note = "" if seed is None else f" (seed {seed})"
+
+        total_ops_estimate = estimate_steps(selected_algo_name, len(self.array))
+        sink = self._create_run_sink(
+            _sort_palette(),
+            total_ops_estimate,
+            print_array=self.output_after_swap.get(),
+        )
+        if sink is None:
+            return
+        self._set_status(f"Sorting with {selected_algo_name}{seed_note}...", MUTED_TEXT)
+
+        def finish(result):
+            if isinstance(result, RandomizedSortReport):
+                attempts = f"{result.attempts:,} attempts (expected about {_format_attempts(result.expected_attempts)})"
+                if not result.sorted:
+                    return (f"{selected_algo_name} gave up after {attempts}, seed {seed}.", WARNING_COLOR, False)
+                text = f"Sorting finished after {attempts}, seed {seed}."
+            else:
+                text = "Sorting finished."
             print("Finished Sorting")
+            sink.mark(0, len(sink.array), STATE_SORTED)
+            return (text, SORTED_BAR_COLOR, True)
 
-        self.sorting_thread = threading.Thread(target=run_sorting, daemon=True)
-        self.sorting_thread.start()
+        self._start_run(make_steps, sink, finish, selected_algo_name)
+
+    def _run_seed(self):
+        """The seed for a randomized sort: the seed entry, or a random one when it is blank; ``None`` if invalid."""
+        text = self.seed.get().strip()
+        if not text:
+            return random.randrange(1 << 32)
+        try:
+            return int(text)
+        except ValueError:
+            messagebox.showerror("Invalid Seed", "The seed must be an integer, or blank for a random one.")
+            return None
 
     def _parse_search_target(self):
         target = self.search_target.get().strip()
@@ -837,8 +1512,7 @@ class SortingVisualizerApp:
             return None
 
     def start_search(self):
-        self.stop_sorting = False
-        if self.sorting_thread and self.sorting_thread.is_alive():
+        if self._is_busy():
             return
         if not self.array:
             messagebox.showinfo("No Array", "Please generate or provide an array first.")
@@ -849,60 +1523,300 @@ class SortingVisualizerApp:
             return
 
         selected_search_name = self.algorithm.get()
-        if selected_search_name == "Binary Search" and not is_non_decreasing(self.array):
+        if algorithm_info(selected_search_name).requires_sorted and not is_non_decreasing(self.array):
             messagebox.showwarning(
-                "Binary Search Requires Sorted Array",
-                "Binary search only works on a sorted list. Sort the array first or use linear search.",
+                f"{selected_search_name} Requires Sorted Array",
+                f"{selected_search_name} only works on a sorted list. Sort the array first or use linear search.",
             )
-            self._set_status("Binary search aborted: array is not sorted.", WARNING_COLOR)
+            self._set_status(f"{selected_search_name} aborted: array is not sorted.", WARNING_COLOR)
             return
 
+        search_steps = load_steps(selected_search_name)
+        total_ops = estimate_steps(selected_search_name, len(self.array))
+        sink = self._create_run_sink(_search_palette(), total_ops)
+        if sink is None:
+            return
         self._set_status(f"Searching for {target} with {selected_search_name}...", MUTED_TEXT)
-        search_algorithm = _SEARCH_ALGORITHM_MAP[selected_search_name]
-
-        def run_search():
-            frame_state = {"count": 0}
-            total_ops = _estimate_search_operations(selected_search_name, len(self.array))
-
-            def visualizer(colors):
-                self._draw_visual_frame(colors, frame_state, total_ops)
-
-            search_kwargs = {
-                "default_color": DEFAULT_BAR_COLOR,
-                "current_color": SEARCH_CURRENT_COLOR,
-                "visited_color": SEARCH_VISITED_COLOR,
-                "found_color": SORTED_BAR_COLOR,
-            }
-            if selected_search_name == "Binary Search":
-                search_kwargs["range_color"] = SEARCH_RANGE_COLOR
-
-            result_idx, final_colors = search_algorithm(
-                self.array,
-                target,
-                visualizer,
-                should_stop=lambda: self.stop_sorting,
-                **search_kwargs,
-            )
 
-            self.update_plot(final_colors)
+        def finish(result_idx):
+            if result_idx >= 0:
+                return (f"Found {target} at index {result_idx}.", SORTED_BAR_COLOR, True)
+            return (f"{target} not found.", ERROR_COLOR, True)
+
+        self._start_run(functools.partial(search_steps, target=target), sink, finish, selected_search_name)
 
-            if result_idx is None:
-                self._set_status_async("Search stopped.", WARNING_COLOR)
+    def open_race_dialog(self):
+        if self._is_busy():
+            messagebox.showinfo("Busy", "Please stop the current visualization before starting a race.")
+            return
+        if self.visualization_mode.get() != "sort":
+            messagebox.showinfo("Race Mode", "Race mode compares sorting algorithms. Switch the task to Sort first.")
+            return
+        if not self.array:
+            messagebox.showinfo("No Array", "Please generate or provide an array first.")
+            return
+
+        sort_names = algorithm_names(SORT)
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Race Algorithms")
+        dialog.configure(bg=PANEL_BG)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        tk.Label(
+            dialog,
+            text=f"Pick {_RACE_MIN_LANES} to {_RACE_MAX_LANES} algorithms to run on the current array:",
+            bg=PANEL_BG,
+            fg=MUTED_TEXT,
+        ).pack(anchor="w", padx=12, pady=(12, 6))
+        listbox = tk.Listbox(
+            dialog,
+            selectmode=tk.MULTIPLE,
+            exportselection=False,
+            height=len(sort_names),
+            bg=INPUT_BG,
+            fg=TEXT_COLOR,
+            selectbackground=ACCENT_COLOR,
+            selectforeground=TEXT_COLOR,
+            relief=tk.FLAT,
+            bd=0,
+            highlightthickness=1,
+            highlightbackground=PANEL_BORDER,
+        )
+        for name in sort_names:
+            listbox.insert(tk.END, name)
+        if self.algorithm.get() in sort_names:
+            listbox.selection_set(sort_names.index(self.algorithm.get()))
+        listbox.pack(fill=tk.X, padx=12)
+
+        def start():
+            names = [sort_names[index] for index in listbox.curselection()]
+            if not _RACE_MIN_LANES <= len(names) <= _RACE_MAX_LANES:
+                messagebox.showerror(
+                    "Race Mode",
+                    f"Please pick between {_RACE_MIN_LANES} and {_RACE_MAX_LANES} algorithms.",
+                    parent=dialog,
+                )
                 return
+            dialog.destroy()
+            self.start_race(names)
 
-            if result_idx >= 0:
-                self._set_status_async(f"Found {target} at index {result_idx}.", SORTED_BAR_COLOR)
-            else:
-                self._set_status_async(f"{target} not found.", ERROR_COLOR)
+        buttons_frame = tk.Frame(dialog, bg=PANEL_BG)
+        buttons_frame.pack(anchor="e", padx=12, pady=12)
+        self._make_button(
+            buttons_frame,
+            "Start Race",
+            start,
+            bg=START_BUTTON_BG,
+            active_bg=START_BUTTON_ACTIVE_BG,
+            fg="#F8FAFC",
+            active_fg="#F8FAFC",
+        ).pack(side=tk.LEFT, padx=(0, 8))
+        self._make_button(buttons_frame, "Cancel", dialog.destroy).pack(side=tk.LEFT)
+        dialog.grab_set()
+
+    def start_race(self, names):
+        """
+        Run the sorts in ``names`` side by side on identical copies of the array.
+
+        Every lane gets its own driver and counters, but a single render tick
+        advances all of them and draws all lanes into one image.
+        """
+        if self._is_busy() or not self.array:
+            return
+        self._close_replay()
+        # Randomized sorts share one seed, so racing two of them compares like with like.
+        seed = None
+        if any(algorithm_info(name).randomized for name in names):
+            seed = self._run_seed()
+            if seed is None:
+                return
+        # With workers every lane is computed on its own core while the lanes are drawn.
+        pool = self._workers() if self.use_workers.get() else None
+        lanes = []
+        for name in names:
+            make_steps = load_steps(name)
+            lane_seed = seed if algorithm_info(name).randomized else None
+            if lane_seed is not None:
+                make_steps = functools.partial(make_steps, seed=lane_seed)
+            try:
+                lanes.append(_RaceLane(name, self.array[:], make_steps, pool, lane_seed))
+            except ValueError as exc:
+                for lane in lanes:
+                    lane.driver.close()
+                messagebox.showerror("Race Mode", f"{name}: {exc}")
+                return
+
+        self._clear_race()
+        self._race = lanes
+        self._race_pacing = PacingController()
+        self._race_pacing.begin(0, False)
+        self._race_started = time.perf_counter()
+        self._race_readout_time = 0.0
+        self._frame_stats.reset()
+        self._hide_bars(0)
+        self.ops_text.set("")
+        self._set_status(f"Racing {', '.join(names)}...", MUTED_TEXT)
+        self._race_job = self.root.after(_RENDER_TICK_MS, self._race_tick)
+
+    def _race_tick(self):
+        """Give every running lane an equal share of one frame's step budget, then draw all lanes once."""
+        self._race_job = None
+        try:
+            self._race_frame()
+        except Exception as exc:
+            message = f"{type(exc).__name__}: {exc}"
+            self._finish_race(stopped=True)
+            self._set_status(f"The race failed. {message}", ERROR_COLOR)
+            messagebox.showerror("Race Failed", message)
+
+    def _race_frame(self):
+        pacing = self._race_pacing
+        running = [lane for lane in self._race if not lane.driver.done]
+        frame = self._begin_frame()
+        steps_before = sum(lane.driver.steps for lane in self._race)
+        # Equal wall time per lane, so the finish order reflects each algorithm's real throughput.
+        share = max(_MIN_STEP_BATCH_S, pacing.interval - pacing.render_time) / len(running)
+        for lane in running:
+            started = time.perf_counter()
+            lane.driver.advance(deadline=started + share)
+            lane.elapsed += time.perf_counter() - started
+            if lane.driver.done and isinstance(lane.driver, StreamDriver):
+                lane.elapsed = lane.driver.elapsed
+            if lane.driver.done and lane.sorted:
+                lane.sink.mark(0, len(lane.values), STATE_SORTED)
+
+        render_started = time.perf_counter()
+        self._draw_race_frame()
+        steps = sum(lane.driver.steps for lane in self._race)
+        pacing.frame_done(steps, time.perf_counter() - render_started)
+        self._end_frame(frame, steps - steps_before, render_started)
+        self._update_race_labels()
+
+        if all(lane.driver.done for lane in self._race):
+            self._finish_race()
+            return
+        self._race_job = self.root.after(1, self._race_tick)
 
-        self.sorting_thread = threading.Thread(target=run_search, daemon=True)
-        self.sorting_thread.start()
+    def _draw_race_frame(self):
+        """Stack one bar chart per lane into a single image, so N lanes cost one image update."""
+        lanes = self._race
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        palette = _sort_palette()
+        pitch = height // len(lanes)
+        base = max(_RACE_LABEL_PX + 1, pitch - _RACE_GAP_PX)
+        max_value = max(max(lanes[0].values), 1)
+        scale = (base - _RACE_LABEL_PX) / max_value
+
+        bands = []
+        downsample_started = time.perf_counter()
+        downsample_s = 0.0
+        for lane in lanes:
+            sink = lane.sink
+            values, _, states, _ = display_bars(lane.values, sink.states, sink.highlight, width, len(palette))
+            downsample_s += time.perf_counter() - downsample_started
+            columns = column_layout(width, len(values))
+            tops = [base - int(values[bar] * scale) for bar in columns]
+            bands.append((pitch, tops, [base] * width, [states[bar] for bar in columns]))
+            downsample_started = time.perf_counter()
+        self._downsample_s = downsample_s
+        leftover = height - pitch * len(lanes)
+        if leftover > 0:
+            bands.append((leftover, [0] * width, [0] * width, [0] * width))
+
+        rgb_palette = [self._rgb(color) for color in palette]
+        self._show_raster(width, height, render_stacked_ppm(width, bands, rgb_palette, self._rgb(CANVAS_BG)))
+        for index, item in enumerate(self._race_labels):
+            self.canvas.coords(item, 6, index * pitch + 2)
+        self.canvas.update_idletasks()
+
+    def _update_race_labels(self, force=False):
+        """Refresh every lane's counter label at most every ``_COUNTER_REFRESH_S`` seconds."""
+        now = time.perf_counter()
+        if not force and now - self._race_readout_time < _COUNTER_REFRESH_S:
+            return
+        self._race_readout_time = now
+        pitch = max(self.canvas.winfo_height(), 1) // len(self._race)
+        while len(self._race_labels) < len(self._race):
+            index = len(self._race_labels)
+            self._race_labels.append(
+                self.canvas.create_text(
+                    6,
+                    index * pitch + 2,
+                    anchor="nw",
+                    fill=TEXT_COLOR,
+                    font=("Segoe UI", 9),
+                )
+            )
+        for lane, item in zip(self._race, self._race_labels):
+            self.canvas.itemconfig(item, text=self._race_lane_text(lane))
+
+    def _race_lane_text(self, lane):
+        counter = lane.sink.counter
+        name = lane.name if lane.seed is None else f"{lane.name} (seed {lane.seed})"
+        counts = _format_counts(counter)
+        rate = _format_rate(counter.total / max(lane.elapsed, 1e-9))
+        if lane.place is not None:
+            return f"#{lane.place} {name} · {counts} in {lane.elapsed:.2f}s ({rate} ops/s)"
+        if lane.stopped:
+            return f"{name} · stopped · {counts}"
+        if not lane.driver.done:
+            return f"{name} · {counts} · {rate} ops/s"
+        if lane.sorted:
+            return f"{name} · finished · {counts} in {lane.elapsed:.2f}s ({rate} ops/s)"
+        return f"{name} · gave up after {lane.driver.result.attempts:,} attempts · {counts}"
+
+    def _finish_race(self, stopped=False):
+        if self._race_job is not None:
+            self.root.after_cancel(self._race_job)
+            self._race_job = None
+        lanes = self._race
+        for lane in lanes:
+            if not lane.driver.done:
+                lane.driver.close()
+                lane.stopped = True
+        finishers = sorted((lane for lane in lanes if lane.sorted), key=lambda lane: lane.elapsed)
+        for place, lane in enumerate(finishers, 1):
+            lane.place = place
+        self._draw_race_frame()
+        self._update_race_labels(force=True)
+
+        elapsed = time.perf_counter() - self._race_started
+        total = sum(lane.sink.counter.total for lane in lanes)
+        self.ops_text.set(f"{total:,} operations across {len(lanes)} lanes in {elapsed:.2f}s")
+        ranking = ", ".join(f"{lane.place}. {lane.name} ({lane.elapsed:.2f}s)" for lane in finishers)
+        if stopped:
+            self._set_status(f"Race stopped. {ranking}" if ranking else "Race stopped.", WARNING_COLOR)
+        elif len(finishers) < len(lanes):
+            self._set_status(f"Race finished, not every lane sorted. {ranking}", WARNING_COLOR)
+        else:
+            self._set_status(f"Race finished: {ranking}.", SORTED_BAR_COLOR)
+
+    def _clear_race(self):
+        """Drop the race lanes and their labels; a running race is stopped first."""
+        if self._race_job is not None:
+            self.root.after_cancel(self._race_job)
+            self._race_job = None
+            for lane in self._race:
+                lane.driver.close()
+        for item in self._race_labels:
+            self.canvas.delete(item)
+        self._race_labels = []
+        self._race = None
 
     def stop_sorting_action(self):
-        self.stop_sorting = True
-        if self.sorting_thread and self.sorting_thread.is_alive():
-            self._set_status("Stopping...", WARNING_COLOR)
-            self.sorting_thread.join(0)
+        if self._race_job is not None:
+            self._finish_race(stopped=True)
+            return
+        sink = self._active_sink
+        if sink is None:
+            return
+        # Nothing runs outside the Tk main loop, so stopping only closes the generators.
+        if sink.probe is not None:
+            sink.probe.close()
+        sink.driver.close()
+        stopped = "Search stopped." if self.visualization_mode.get() == "search" else "Sorting stopped."
+        self._finish_run(sink, (stopped, WARNING_COLOR, False))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,251 @@
+"""
+Loading and saving arrays of integers as files.
+
+Supported formats:
+
+- ``text``: integers separated by whitespace, e.g. one per line.
+- ``csv``: integers separated by commas and/or newlines; a header line that
+  is not a number is skipped.
+- ``int32`` / ``int64``: raw little-endian binary, no header.
+- ``npy``: NumPy's ``.npy`` format with any integer dtype; NumPy itself is
+  not needed.
+
+``ArrayFile`` memory-maps the file, so opening even a 100M-element file
+only reads its header. ``preview`` reads a few evenly spaced values (for
+the text formats, the first number after evenly spaced byte offsets), which
+is enough to draw the array before ``load`` reads all of it. Binary loads
+are one copy of the mapped bytes into an ``array``.
+"""
+
+from __future__ import annotations
+
+import ast
+import mmap
+import re
+import struct
+import sys
+from array import array as _array
+from pathlib import Path
+from typing import Optional
+
+from .algorithms.events import pack_values
+
+FORMATS = ("text", "csv", "int32", "int64", "npy")
+
+SUFFIX_FORMATS = {
+    ".txt": "text",
+    ".csv": "csv",
+    ".i32": "int32",
+    ".int32": "int32",
+    ".i64": "int64",
+    ".int64": "int64",
+    ".bin": "int64",
+    ".npy": "npy",
+}
+
+_NPY_MAGIC = b"\x93NUMPY"
+# struct codes by .npy kind and item size.
+_NPY_CODES = {
+    ("i", 1): "b", ("i", 2): "h", ("i", 4): "i", ("i", 8): "q",
+    ("u", 1): "B", ("u", 2): "H", ("u", 4): "I", ("u", 8): "Q",
+}
+# A separator followed by a number, for sampling text files from the middle of a line.
+_NEXT_NUMBER = re.compile(rb"[\s,]+(-?\d+)")
+_FIRST_NUMBER = re.compile(rb"[\s,]*(-?\d+)")
+_TOKEN = re.compile(rb"[^\s,]+")
+_INTEGER = re.compile(rb"[+-]?\d+")
+
+
+class ArrayFileError(ValueError):
+    """Raised when a file cannot be read as an array of integers."""
+
+
+def detect_format(path) -> str:
+    """The format for ``path``'s suffix; raises ``ArrayFileError`` for unknown suffixes."""
+    suffix = Path(path).suffix.lower()
+    try:
+        return SUFFIX_FORMATS[suffix]
+    except KeyError:
+        raise ArrayFileError(
+            f"Cannot tell the format of {Path(path).name!r}; use one of {', '.join(sorted(SUFFIX_FORMATS))}."
+        ) from None
+
+
+class ArrayFile:
+    """
+    A memory-mapped array file.
+
+    ``length`` is known right away for the binary formats and ``None`` for
+    text until ``load`` has run. Use as a context manager or call ``close``.
+    """
+
+    def __init__(self, path, format: Optional[str] = None):
+        self.path = Path(path)
+        self.format = format or detect_format(path)
+        if self.format not in FORMATS:
+            raise ArrayFileError(f"Unknown array format {self.format!r}; choose from {', '.join(FORMATS)}.")
+        self.length = None
+        self._offset = 0
+        # Little-endian struct code of one value, binary formats only.
+        self._code = {"int32": "<i", "int64": "<q"}.get(self.format)
+        self._handle = self.path.open("rb")
+        try:
+            size = self.path.stat().st_size
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            if self.format == "npy":
+                self._read_npy_header()
+            if self._code is not None:
+                item = struct.calcsize(self._code)
+                if (len(self._map) - self._offset) % item:
+                    raise ArrayFileError(f"{self.path.name} is not a whole number of {item}-byte values.")
+                self.length = (len(self._map) - self._offset) // item
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = b""
+        self._handle.close()
+
+    def _read_npy_header(self):
+        data = self._map
+        if data[:6] != _NPY_MAGIC:
+            raise ArrayFileError(f"{self.path.name} is not a .npy file.")
+        major = data[6]
+        if major == 1:
+            (header_len,) = struct.unpack_from("<H", data, 8)
+            start = 10
+        else:
+            (header_len,) = struct.unpack_from("<I", data, 8)
+            start = 12
+        try:
+            header = ast.literal_eval(bytes(data[start:start + header_len]).decode("latin1"))
+            descr = header["descr"]
+            # Values load in file order, so a multi-dimensional array comes out flattened
+            # like numpy's ravel(order="K"): column by column when fortran_order is set.
+            count = 1
+            for dimension in header["shape"]:
+                count *= dimension
+        except (ValueError, SyntaxError, KeyError, TypeError):
+            raise ArrayFileError(f"{self.path.name} has a broken .npy header.") from None
+        code = None
+        if isinstance(descr, str) and descr[2:].isdigit():
+            order, kind, size = descr[0], descr[1], int(descr[2:])
+            code = _NPY_CODES.get((kind, size))
+        if code is None:
+            raise ArrayFileError(f"{self.path.name} holds {descr!r} values; only integer arrays can be loaded.")
+        # "|" means byte order does not apply (one-byte values).
+        self._code = (">" if order == ">" else "<") + code
+        self._offset = start + header_len
+        if len(data) - self._offset != count * size:
+            raise ArrayFileError(f"{self.path.name} is shorter than its .npy header says.")
+
+    def preview(self, samples: int) -> list[int]:
+        """Up to ``samples`` values spread evenly over the file, in file order."""
+        if samples <= 0:
+            return []
+        if self._code is not None:
+            item = struct.calcsize(self._code)
+            count = min(samples, self.length)
+            return [
+                struct.unpack_from(self._code, self._map, self._offset + item * (self.length * k // count))[0]
+                for k in range(count)
+            ]
+        data = self._map
+        values = []
+        for k in range(samples):
+            start = len(data) * k // samples
+            match = _FIRST_NUMBER.match(data) if k == 0 else None
+            match = match or _NEXT_NUMBER.search(data, start)
+            if match is not None:
+                values.append(int(match.group(1)))
+        return values
+
+    def load(self):
+        """
+        Read every value: an ``array('i')`` when they fit, else ``array('q')``
+        or a list, like the app's own arrays.
+        """
+        if self._code is not None:
+            code = self._code[1]
+            # struct and array share the integer codes.
+            values = _array(code)
+            # Views instead of slicing the map, so the bytes are copied once; released before close().
+            with memoryview(self._map) as view, view[self._offset:] as body:
+                values.frombytes(body)
+            if (self._code[0] == "<") != (sys.byteorder == "little"):
+                values.byteswap()
+            self.length = len(values)
+            return values if code in "iq" else pack_values(values)
+
+        # The tokens are read straight from the map, without a copy of the whole file.
+        tokens = _TOKEN.findall(self._map)
+        if self.format == "csv" and tokens and not _INTEGER.fullmatch(tokens[0]):
+            # Skip a header line.
+            end = self._map.find(b"\n")
+            tokens = tokens[len(_TOKEN.findall(self._map[:end] if end >= 0 else self._map)):]
+        try:
+            values = pack_values(list(map(int, tokens)))
+        except ValueError:
+            for token in tokens:
+                try:
+                    int(token)
+                except ValueError:
+                    raise ArrayFileError(
+                        f"{self.path.name}: {token.decode(errors='replace')!r} is not an integer."
+                    ) from None
+            raise
+        self.length = len(values)
+        return values
+
+
+def open_array(path, format: Optional[str] = None) -> ArrayFile:
+    """Open ``path`` without reading its values; see ``ArrayFile``."""
+    return ArrayFile(path, format)
+
+
+def load_array(path, format: Optional[str] = None):
+    """Read every value of ``path``; see ``ArrayFile.load``."""
+    with ArrayFile(path, format) as source:
+        return source.load()
+
+
+def save_array(path, values, format: Optional[str] = None) -> None:
+    """
+    Write ``values`` to ``path``. Text and CSV get one value per line; the
+    binary formats raise ``ArrayFileError`` for values that do not fit.
+    """
+    format = format or detect_format(path)
+    if format not in FORMATS:
+        raise ArrayFileError(f"Unknown array format {format!r}; choose from {', '.join(FORMATS)}.")
+    path = Path(path)
+    if format in ("text", "csv"):
+        with path.open("w", encoding="ascii", newline="\n") as handle:
+            handle.write("\n".join(map(str, values)))
+            handle.write("\n")
+        return
+
+    typecode = "i" if format == "int32" else "q"
+    try:
+        data = values if isinstance(values, _array) and values.typecode == typecode else _array(typecode, values)
+    except OverflowError:
+        raise ArrayFileError(f"The values do not fit in {format}; save as int64 or text.") from None
+    if sys.byteorder != "little":
+        data = _array(typecode, data)
+        data.byteswap()
+    with path.open("wb") as handle:
+        if format == "npy":
+            header = repr({"descr": "<i8", "fortran_order": False, "shape": (len(data),)}).encode("latin1")
+            # Version 1.0: the magic, version and length prefix plus the header end on a 64-byte boundary.
+            padding = -(len(_NPY_MAGIC) + 4 + len(header) + 1) % 64
+            header += b" " * padding + b"\n"
+            handle.write(_NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header)
+        data.tofile(handle)
@@ -0,0 +1,354 @@
+"""
+Headless benchmark matrix for the sort and search algorithms.
+
+Every (algorithm, size, distribution) cell is run with a step sink that does
+no rendering: ``warmup`` untimed runs, ``repeat`` timed runs (median and IQR
+are reported) and one extra run under ``tracemalloc`` for peak memory.
+Operation counts come from the sink's ``OpCounter``. Cells can be spread
+over a process pool. With ``vectorized`` (and NumPy installed), sorts that
+have a NumPy version are timed through it instead; those rows have no
+operation counts.
+
+``run_scaling`` times the multi-core sorts with 1, 2, 4, 8... worker
+processes and reports speedup and scaling efficiency against one worker.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+from .algorithms.events import Cancelled, StepSink, drive
+from .algorithms.randomized_sort import RandomizedSortReport
+from .registry import SORT, algorithm_info, load_multicore, load_steps, load_vectorized
+from .registry import algorithm_names as _registry_names
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "nearly_sorted", "few_unique")
+
+DEFAULT_WORKER_COUNTS = (1, 2, 4, 8)
+
+SCALING_FIELDS = ("algorithm", "size", "distribution", "workers", "runs", "median_s", "speedup", "efficiency")
+
+RESULT_FIELDS = (
+    "algorithm",
+    "kind",
+    "size",
+    "distribution",
+    "vectorized",
+    "status",
+    "runs",
+    "median_s",
+    "q1_s",
+    "q3_s",
+    "iqr_s",
+    "min_s",
+    "steps",
+    "comparisons",
+    "swaps",
+    "writes",
+    "aux_reads",
+    "aux_writes",
+    "attempts",
+    "expected_attempts",
+    "peak_kib",
+)
+
+# The deadline is only checked every this many steps to keep the sink cheap.
+_DEADLINE_STRIDE = 1 << 14
+
+
+def generate_input(size, distribution="random", seed=None):
+    """Build a benchmark input; ``random`` matches the app's ``Generate Random`` array."""
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randint(1, size) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(1, size + 1))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "nearly_sorted":
+        values = list(range(1, size + 1))
+        # Fewer than two values have nothing to swap.
+        for _ in range(max(1, size // 100) if size >= 2 else 0):
+            i = rng.randrange(size)
+            j = rng.randrange(size)
+            values[i], values[j] = values[j], values[i]
+        return values
+    if distribution == "few_unique":
+        return [rng.randint(1, 10) for _ in range(size)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+class _TimedSink(StepSink):
+    """No-op sink that only counts steps and enforces a wall-clock budget."""
+
+    def __init__(self, array, deadline):
+        super().__init__(array)
+        self.deadline = deadline
+        self.steps = 0
+
+    def on_step(self, kind, a, b, c):
+        self.steps += 1
+        if not self.steps % _DEADLINE_STRIDE and time.perf_counter() > self.deadline:
+            raise Cancelled()
+
+
+def algorithm_names() -> list[str]:
+    return _registry_names()
+
+
+def _run_once(make_steps, kind, values, target, sink):
+    if kind == SORT:
+        return drive(make_steps(values), sink)
+    return drive(make_steps(values, target), sink)
+
+
+def _run_vectorized(row, vectorized, base, warmup, repeat):
+    if np is None:
+        row["status"] = "no numpy"
+        return row
+    data = np.asarray(base)
+    timings = []
+    for run_index in range(warmup + repeat):
+        values = data.copy()
+        started = time.perf_counter()
+        vectorized(values)
+        elapsed = time.perf_counter() - started
+        if run_index >= warmup:
+            timings.append(elapsed)
+
+    values = data.copy()
+    tracemalloc.start()
+    try:
+        vectorized(values)
+    finally:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    _fill_timings(row, timings)
+    row.update(steps=0, comparisons=0, swaps=0, writes=0, aux_reads=0, aux_writes=0)
+    row["peak_kib"] = round(peak / 1024, 1)
+    return row
+
+
+def _fill_timings(row, timings):
+    row["runs"] = len(timings)
+    row["median_s"] = statistics.median(timings)
+    row["min_s"] = min(timings)
+    if len(timings) >= 2:
+        q1, _q2, q3 = statistics.quantiles(timings, n=4, method="inclusive")
+    else:
+        q1 = q3 = timings[0]
+    row["q1_s"] = q1
+    row["q3_s"] = q3
+    row["iqr_s"] = q3 - q1
+
+
+def run_cell(name, size, distribution="random", seed=0, warmup=1, repeat=5, timeout=10.0, vectorized=False) -> dict:
+    """Benchmark one matrix cell and return a result row."""
+    info = algorithm_info(name)
+    kind = info.kind
+    algorithm = load_steps(name)
+    if info.randomized:
+        # Same shuffles in every repeat, so the timings are comparable.
+        algorithm = functools.partial(algorithm, seed=seed)
+
+    base = generate_input(size, distribution, seed)
+    target = None
+    if kind == "search":
+        # Binary search needs sorted input; both searches look for a present value.
+        if info.requires_sorted:
+            base.sort()
+        target = base[random.Random(seed).randrange(size)] if size else 0
+
+    row = {field: None for field in RESULT_FIELDS}
+    row.update(algorithm=name, kind=kind, size=size, distribution=distribution, status="ok", runs=0)
+    fast = load_vectorized(name) if vectorized and kind == SORT else None
+    row["vectorized"] = fast is not None
+    if fast is not None:
+        return _run_vectorized(row, fast, base, warmup, repeat)
+
+    timings = []
+    for run_index in range(warmup + repeat):
+        values = list(base)
+        sink = _TimedSink(values, time.perf_counter() + timeout)
+        started = time.perf_counter()
+        try:
+            result = _run_once(algorithm, kind, values, target, sink)
+        except Cancelled:
+            row["status"] = "timeout"
+            return row
+        elapsed = time.perf_counter() - started
+        if isinstance(result, RandomizedSortReport):
+            row["attempts"] = result.attempts
+            row["expected_attempts"] = result.expected_attempts
+            if not result.sorted:
+                row["status"] = "budget"
+                return row
+        if run_index >= warmup:
+            timings.append(elapsed)
+
+    values = list(base)
+    sink = _TimedSink(values, time.perf_counter() + timeout)
+    tracemalloc.start()
+    try:
+        _run_once(algorithm, kind, values, target, sink)
+    except Cancelled:
+        row["status"] = "timeout"
+    finally:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    _fill_timings(row, timings)
+    row["steps"] = sink.steps
+    row.update(sink.counter.as_dict())
+    row["peak_kib"] = round(peak / 1024, 1)
+    return row
+
+
+def _run_cell_args(args):
+    return run_cell(*args)
+
+
+def run_matrix(
+    algorithms: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = (100, 1000),
+    distributions: Iterable[str] = ("random",),
+    *,
+    seed=0,
+    warmup=1,
+    repeat=5,
+    timeout=10.0,
+    jobs=1,
+    vectorized=False,
+) -> list[dict]:
+    """Run every cell of the matrix, optionally across ``jobs`` worker processes."""
+    names = list(algorithms) if algorithms is not None else algorithm_names()
+    known = set(algorithm_names())
+    for name in names:
+        if name not in known:
+            raise KeyError(f"Unknown algorithm: {name}")
+    cells = [
+        (name, size, distribution, seed, warmup, repeat, timeout, vectorized)
+        for name in names
+        for size in sizes
+        for distribution in distributions
+    ]
+    if jobs <= 1:
+        return [_run_cell_args(cell) for cell in cells]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_run_cell_args, cells))
+
+
+def run_scaling(
+    algorithms: Optional[Iterable[str]] = None,
+    size: int = 1_000_000,
+    worker_counts: Iterable[int] = DEFAULT_WORKER_COUNTS,
+    distribution: str = "random",
+    *,
+    seed=0,
+    warmup=1,
+    repeat=3,
+) -> list[dict]:
+    """
+    Time the multi-core sorts for every worker count on the same input.
+
+    One worker sorts in-process and is always measured as the baseline:
+    ``speedup`` is its median time over a row's median and ``efficiency``
+    the speedup per worker. Every worker count gets its own pool, started
+    before timing so process start-up is not measured.
+    """
+    names = list(algorithms) if algorithms is not None else [
+        name for name in algorithm_names() if algorithm_info(name).multicore is not None
+    ]
+    counts = sorted(set(worker_counts) | {1})
+    base = generate_input(size, distribution, seed)
+    rows = []
+    for name in names:
+        multicore = load_multicore(name)
+        if multicore is None:
+            raise ValueError(f"{name} has no multi-core version.")
+        baseline = None
+        for workers in counts:
+            executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+            try:
+                if executor is not None:
+                    list(executor.map(abs, range(workers)))
+                timings = []
+                for run_index in range(warmup + repeat):
+                    values = list(base)
+                    started = time.perf_counter()
+                    multicore(values, workers, executor)
+                    elapsed = time.perf_counter() - started
+                    if run_index >= warmup:
+                        timings.append(elapsed)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            median = statistics.median(timings)
+            if baseline is None:
+                baseline = median
+            speedup = baseline / median
+            rows.append(
+                {
+                    "algorithm": name,
+                    "size": size,
+                    "distribution": distribution,
+                    "workers": workers,
+                    "runs": len(timings),
+                    "median_s": median,
+                    "speedup": speedup,
+                    "efficiency": speedup / workers,
+                }
+            )
+    return rows
+
+
+def write_json(rows, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(rows, handle, indent=2)
+
+
+def write_csv(rows, path, fields=RESULT_FIELDS):
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_table(rows) -> str:
+    header = f"{'algorithm':<22}{'size':>9} {'distribution':<14}{'median ms':>11}{'iqr ms':>9}{'compares':>12}{'swaps':>11}{'writes':>11}{'peak KiB':>10}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        name = f"{row['algorithm']} (NumPy)" if row.get("vectorized") else row["algorithm"]
+        if row["status"] != "ok":
+            lines.append(f"{name:<22}{row['size']:>9} {row['distribution']:<14}{row['status']:>11}")
+            continue
+        lines.append(
+            f"{name:<22}{row['size']:>9} {row['distribution']:<14}"
+            f"{row['median_s'] * 1000:>11.3f}{row['iqr_s'] * 1000:>9.3f}"
+            f"{row['comparisons']:>12}{row['swaps']:>11}{row['writes']:>11}{row['peak_kib']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def format_scaling_table(rows) -> str:
+    header = f"{'algorithm':<22}{'size':>10} {'workers':>8}{'median ms':>12}{'speedup':>9}{'efficiency':>12}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['algorithm']:<22}{row['size']:>10} {row['workers']:>8}{row['median_s'] * 1000:>12.1f}"
+            f"{row['speedup']:>8.2f}x{row['efficiency']:>11.0%}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,167 @@
+"""
+Headless API for running the sorts and searches.
+
+This module never imports ``tkinter`` or ``matplotlib``, so it works on
+servers without Tcl/Tk and imports quickly:
+
+    from graphicalSortLib.core import sort
+
+    stats = sort([5, 3, 8, 1], "Quick Sort")
+    print(stats.values, stats.comparisons, stats.elapsed)
+
+Algorithms are looked up by name in ``registry``; only the module of the
+algorithm that is run gets imported. Algorithms with a NumPy or a
+multi-core version (see ``sort_vectorized`` and ``sort_parallel``) can
+also run without producing steps at all.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from .algorithms.events import StepDriver, StepSink
+from .registry import SEARCH, SORT, algorithm_info, load_multicore, load_steps, load_vectorized
+
+if TYPE_CHECKING:
+    from .profiling import ProfileOptions
+
+
+class RunStats(NamedTuple):
+    algorithm: str
+    values: Any
+    result: Any
+    steps: int
+    comparisons: int
+    swaps: int
+    writes: int
+    aux_reads: int
+    aux_writes: int
+    elapsed: float
+    # A profiling.ProfileReport when the run was profiled.
+    profile: Any = None
+
+
+class _CallbackSink(StepSink):
+    def __init__(self, array, on_step):
+        super().__init__(array)
+        self.on_step = on_step
+
+
+def _lookup(name, kind):
+    try:
+        info = algorithm_info(name)
+    except KeyError:
+        info = None
+    if info is None or info.kind != kind:
+        raise KeyError(f"Unknown {'sorting' if kind == SORT else 'search'} algorithm: {name}")
+    return info
+
+
+def _run(name, steps, values, on_step, profile):
+    sink = StepSink(values) if on_step is None else _CallbackSink(values, on_step)
+    driver = StepDriver(steps, sink)
+    profiler = None
+    if profile is not None:
+        # cProfile, pstats and tracemalloc are only imported for profiled runs.
+        from .profiling import RunProfiler
+
+        profiler = RunProfiler(name, profile)
+        profiler.start()
+    started = time.perf_counter()
+    try:
+        driver.advance()
+    except BaseException:
+        if profiler is not None:
+            profiler.cancel()
+        raise
+    finally:
+        driver.close()
+    elapsed = time.perf_counter() - started
+    report = None if profiler is None else profiler.stop(values, sink.counter)
+    return RunStats(name, values, driver.result, driver.steps, elapsed=elapsed, profile=report, **sink.counter.as_dict())
+
+
+def sort(
+    data,
+    name: str = "Quick Sort",
+    on_step: Optional[Callable[[int, int, int, int], None]] = None,
+    *,
+    seed: Optional[int] = None,
+    profile: Optional[ProfileOptions] = None,
+) -> RunStats:
+    """
+    Sort ``data`` with the algorithm called ``name`` and return its stats.
+
+    A list or ``array.array`` is sorted in place and returned as
+    ``stats.values``, so an array stays an array; any other iterable is
+    copied into a new list first. ``on_step`` is called as
+    ``on_step(kind, a, b, c)`` after every step (see ``algorithms.events``).
+    ``seed`` seeds the randomized sorts, whose ``RandomizedSortReport`` ends
+    up in ``stats.result``. With ``profile`` the run is wrapped in cProfile
+    and/or tracemalloc and ``stats.profile`` is the
+    ``profiling.ProfileReport``.
+    """
+    info = _lookup(name, SORT)
+    values = data if isinstance(data, (list, array)) else list(data)
+    make_steps = load_steps(name)
+    if info.randomized:
+        steps = make_steps(values, seed=seed)
+    else:
+        steps = make_steps(values)
+    return _run(name, steps, values, on_step, profile)
+
+
+def search(
+    data,
+    target: int,
+    name: str = "Linear Search",
+    on_step: Optional[Callable[[int, int, int, int], None]] = None,
+    *,
+    profile: Optional[ProfileOptions] = None,
+) -> RunStats:
+    """
+    Search ``data`` for ``target``; ``stats.result`` is the found index or
+    -1. ``profile`` is as in ``sort``.
+    """
+    _lookup(name, SEARCH)
+    values = data if isinstance(data, (list, array)) else list(data)
+    return _run(name, load_steps(name)(values, target), values, on_step, profile)
+
+
+def sort_vectorized(data, name: str = "Counting Sort") -> RunStats:
+    """
+    Sort ``data`` with the NumPy version of ``name``; needs NumPy.
+
+    ``stats.values`` is a new sorted ``ndarray``. No steps are produced, so
+    the step and operation counts are zero and only ``elapsed`` is measured.
+    """
+    _lookup(name, SORT)
+    vectorized = load_vectorized(name)
+    if vectorized is None:
+        raise ValueError(f"{name} has no vectorized version.")
+    started = time.perf_counter()
+    values = vectorized(data)
+    elapsed = time.perf_counter() - started
+    return RunStats(name, values, None, 0, 0, 0, 0, 0, 0, elapsed)
+
+
+def sort_parallel(data, name: str = "Parallel Merge Sort", workers: Optional[int] = None, executor=None) -> RunStats:
+    """
+    Sort ``data`` with the multi-core version of ``name`` on ``workers`` processes.
+
+    ``data`` is handled as in ``sort``. Pass ``executor`` (a
+    ``ProcessPoolExecutor``) to reuse running workers; otherwise a pool is
+    started for the call and its start-up time is part of ``elapsed``. As
+    with ``sort_vectorized`` only ``values`` and ``elapsed`` are filled in.
+    """
+    _lookup(name, SORT)
+    multicore = load_multicore(name)
+    if multicore is None:
+        raise ValueError(f"{name} has no multi-core version.")
+    values = data if isinstance(data, (list, array)) else list(data)
+    started = time.perf_counter()
+    multicore(values, workers, executor)
+    elapsed = time.perf_counter() - started
+    return RunStats(name, values, None, 0, 0, 0, 0, 0, 0, elapsed)
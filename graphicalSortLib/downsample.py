@@ -0,0 +1,105 @@
+"""
+Column downsampling of bar values and palette-index states.
+
+When an array has more bars than the canvas has pixel columns, consecutive
+bars are merged into buckets. Each bucket keeps the maximum value, the
+minimum value (for the envelope view) and its dominant state: the most
+frequent non-default state, or the default state when the whole bucket is
+default. With NumPy installed this is a handful of ``reduceat`` calls;
+without it the same result is computed chunk by chunk in pure Python.
+"""
+
+from __future__ import annotations
+
+from .algorithms.events import STATE_CURRENT, STATE_PIVOT
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+# Below this many values the pure-Python path is faster than converting to NumPy.
+_NUMPY_THRESHOLD = 4096
+
+
+def bucket_size(length, max_samples):
+    """Number of values merged into one bucket; 1 means no downsampling."""
+    if max_samples is None or max_samples <= 0 or length <= max_samples:
+        return 1
+    return -(-length // max_samples)
+
+
+def downsample(values, states, max_samples, state_count):
+    """
+    Merge ``values`` and ``states`` into at most ``max_samples`` buckets.
+
+    ``states`` is a bytes-like sequence of palette indices (0 is the default
+    state) and ``state_count`` the palette size. Returns
+    ``(maxima, minima, states)``; without downsampling the inputs are returned
+    unchanged, with ``minima`` equal to ``values``.
+    """
+    length = len(values)
+    chunk = bucket_size(length, max_samples)
+    if chunk == 1:
+        return values, values, states
+    if np is not None and length >= _NUMPY_THRESHOLD:
+        return _downsample_numpy(values, states, chunk, state_count)
+    return _downsample_python(values, states, chunk, state_count)
+
+
+def display_bars(values, states, highlight, max_samples, state_count):
+    """
+    Downsample a run's bars for drawing and apply its transient ``highlight``.
+
+    Returns ``(maxima, minima, states, chunk)``. A highlighted bar colors
+    the whole bucket it falls into: the first one ``STATE_CURRENT``, the
+    second ``STATE_PIVOT``.
+    """
+    chunk = bucket_size(len(values), max_samples)
+    maxima, minima, display_states = downsample(values, states, max_samples, state_count)
+    if highlight:
+        # Copy first: without downsampling these are the sink's own states.
+        display_states = bytearray(display_states)
+        first, second = highlight
+        if second >= 0:
+            display_states[second // chunk] = STATE_PIVOT
+        if first >= 0:
+            display_states[first // chunk] = STATE_CURRENT
+    return maxima, minima, display_states, chunk
+
+
+def _downsample_numpy(values, states, chunk, state_count):
+    data = np.asarray(values)
+    codes = states if isinstance(states, np.ndarray) else np.frombuffer(states, dtype=np.uint8)
+    starts = np.arange(0, len(data), chunk)
+    maxima = np.maximum.reduceat(data, starts)
+    minima = np.minimum.reduceat(data, starts)
+
+    # Row 0 (default) stays zero, so all-default buckets resolve to state 0.
+    counts = np.zeros((max(1, state_count), len(starts)), dtype=np.int64)
+    for state in range(1, state_count):
+        counts[state] = np.add.reduceat(codes == state, starts, dtype=np.int64)
+    dominant = counts.argmax(axis=0).astype(np.uint8)
+    return maxima.tolist(), minima.tolist(), dominant.tobytes()
+
+
+def _downsample_python(values, states, chunk, state_count):
+    states = bytes(states)
+    maxima = []
+    minima = []
+    dominant = bytearray()
+    for start in range(0, len(values), chunk):
+        end = start + chunk
+        chunk_values = values[start:end]
+        maxima.append(max(chunk_values))
+        minima.append(min(chunk_values))
+        chunk_states = states[start:end]
+        best_state = 0
+        best_count = 0
+        if chunk_states.count(0) != len(chunk_states):
+            for state in range(1, state_count):
+                count = chunk_states.count(state)
+                if count > best_count:
+                    best_state, best_count = state, count
+        dominant.append(best_state)
+    return maxima, minima, bytes(dominant)
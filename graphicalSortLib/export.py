@@ -0,0 +1,398 @@
+"""
+Headless export of a run as an animated GIF, an animated PNG or a PNG sequence.
+
+Frames are rendered without Tk from the same bar state the app draws: the
+run's ``StepSink`` states and highlight go through ``display_bars`` and
+``column_spans`` exactly as in ``update_plot``, and the colors come from
+the app's themes. A frame is one byte per pixel, so GIF and PNG store it as
+an indexed image.
+
+The run is first counted on a copy. The first frame is the input, and one
+more frame is captured every ``ceil(steps / (frames - 1))`` steps, so the
+animation has at most ``frames`` frames whatever the run length. Consecutive identical frames are merged
+into one longer frame, and GIF and APNG frames after the first only store
+the rectangle of columns that changed.
+
+Rasterizing and compressing run on a process pool: every task gets a
+contiguous batch of frames plus the frame before it, and returns encoded
+chunks that are written out in order.
+
+    python -m graphicalSortLib export "Quick Sort" quick.gif --size 200
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+import random
+import struct
+import time
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .algorithms.events import STATE_COUNT, StepDriver, StepSink
+from .downsample import display_bars
+from .raster import column_spans, render_indexed
+from .registry import SORT, algorithm_info, load_steps
+from .themes import THEME_PALETTES, search_palette, sort_palette
+
+FORMATS = ("gif", "apng", "png")
+DEFAULT_FRAMES = 300
+DEFAULT_FPS = 30
+# The sorted end state stays on screen this long before a GIF or APNG loops.
+FINAL_HOLD_S = 1.0
+# Each worker gets about this many batches, so a slow batch does not leave the others idle.
+BATCHES_PER_WORKER = 4
+# Below this many frames the pool costs more than it saves.
+MIN_PARALLEL_FRAMES = 32
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_GIF_MAX_CODE = 4096
+
+
+class ExportResult(NamedTuple):
+    path: Path
+    format: str
+    # Frames written after merging duplicates, and how many captured frames were merged away.
+    frames: int
+    duplicates: int
+    steps: int
+    elapsed: float
+
+
+def export_run(
+    path,
+    algorithm_name: str,
+    values,
+    *,
+    format: Optional[str] = None,
+    width: int = 640,
+    height: int = 360,
+    frames: int = DEFAULT_FRAMES,
+    fps: float = DEFAULT_FPS,
+    theme: str = "dark",
+    target: Optional[int] = None,
+    seed: Optional[int] = None,
+    envelope: bool = False,
+    workers: Optional[int] = None,
+    executor=None,
+) -> ExportResult:
+    """
+    Run ``algorithm_name`` on a copy of ``values`` and write it as an animation.
+
+    ``format`` is ``"gif"``, ``"apng"`` or ``"png"``; by default it follows
+    the suffix of ``path`` (``.gif``, ``.png``/``.apng``) and a path
+    without a suffix is a directory for a PNG sequence. ``frames`` is the
+    target frame count and ``fps`` the playback rate; GIF delays are whole
+    hundredths of a second, so GIFs play at most 100 frames per second.
+    Searches need a ``target``; randomized sorts use ``seed`` (a random one
+    by default).
+    ``workers`` and ``executor`` are as in ``core.sort_parallel``.
+    """
+    path = Path(path)
+    if format is None:
+        format = {".gif": "gif", ".png": "apng", ".apng": "apng", "": "png"}.get(path.suffix.lower())
+        if format is None:
+            raise ValueError(f"Cannot tell the export format from {path.name!r}; pass format=.")
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; choose from {', '.join(FORMATS)}.")
+    if width < 1 or height < 1 or fps <= 0:
+        raise ValueError("Width, height and fps must be positive.")
+    if frames < 2:
+        raise ValueError("An animation needs at least 2 frames.")
+    if theme not in THEME_PALETTES:
+        raise ValueError(f"Unknown theme {theme!r}; choose from {', '.join(THEME_PALETTES)}.")
+
+    values = list(values)
+    if not values:
+        raise ValueError("Nothing to export: the input is empty.")
+    info = algorithm_info(algorithm_name)
+    make_steps = load_steps(algorithm_name)
+    if info.kind == SORT:
+        if info.randomized:
+            # Both passes below must see the same shuffles.
+            make_steps = functools.partial(make_steps, seed=random.randrange(1 << 32) if seed is None else seed)
+        palette = sort_palette(THEME_PALETTES[theme])
+    else:
+        if target is None:
+            raise ValueError(f"{algorithm_name} needs a search target.")
+        make_steps = functools.partial(_search_steps, make_steps, target=target)
+        palette = search_palette(THEME_PALETTES[theme])
+    colors = [_hex_rgb(THEME_PALETTES[theme]["CANVAS_BG"])] + [_hex_rgb(color) for color in palette]
+
+    started = time.perf_counter()
+    snapshots, total = _capture(make_steps, values, width, height, frames, envelope)
+    frame_s = 1 / fps
+    unique, durations = _dedupe(snapshots, frame_s)
+    durations[-1] = max(durations[-1], FINAL_HOLD_S)
+
+    encoded = _encode_all(format, width, height, unique, workers, executor)
+    if format == "gif":
+        _write_gif(path, width, height, colors, encoded, durations)
+    elif format == "apng":
+        _write_apng(path, width, height, colors, encoded, durations)
+    else:
+        _write_sequence(path, width, height, colors, encoded, durations)
+    return ExportResult(path, format, len(unique), len(snapshots) - len(unique), total, time.perf_counter() - started)
+
+
+def _search_steps(make_steps, values, target):
+    return make_steps(values, target)
+
+
+def _hex_rgb(color):
+    return tuple(int(color[index:index + 2], 16) for index in (1, 3, 5))
+
+
+def _snapshot(sink, width, height, envelope):
+    """One frame as ``(tops, bottoms, indices)``, computed like ``update_plot`` does."""
+    values, min_values, states, chunk = display_bars(sink.array, sink.states, sink.highlight, width, STATE_COUNT)
+    max_value = max(values) or 1
+    tops, bottoms, indices = column_spans(
+        width, height, (height - 10) / max_value, values, min_values, states, envelope and chunk > 1
+    )
+    return array("i", tops), array("i", bottoms), bytes(indices)
+
+
+def _capture(make_steps, values, width, height, frames, envelope):
+    """Count the run's steps on a copy, then replay it and snapshot every ``stride`` steps."""
+    counter = StepDriver(make_steps(values[:]), StepSink(values[:]))
+    counter.advance()
+    total = counter.steps
+
+    sink = StepSink(values)
+    driver = StepDriver(make_steps(values), sink)
+    # The first frame is the input, so the steps are spread over the other frames - 1.
+    stride = max(1, math.ceil(total / (frames - 1)))
+    snapshots = [_snapshot(sink, width, height, envelope)]
+    while not driver.done:
+        taken = driver.advance(stride)
+        if driver.done:
+            # The end state is drawn without the last step's highlight, like the app's final redraw.
+            sink.highlight = ()
+            if not taken and len(snapshots) > 1:
+                snapshots.pop()
+        snapshots.append(_snapshot(sink, width, height, envelope))
+    return snapshots, total
+
+
+def _dedupe(snapshots, frame_s):
+    """Merge runs of identical consecutive frames; returns the frames and their durations in seconds."""
+    unique = []
+    durations = []
+    for snapshot in snapshots:
+        if unique and snapshot == unique[-1]:
+            durations[-1] += frame_s
+        else:
+            unique.append(snapshot)
+            durations.append(frame_s)
+    return unique, durations
+
+
+def _encode_all(format, width, height, snapshots, workers, executor):
+    workers = workers or os.cpu_count() or 1
+    if executor is None and (workers <= 1 or len(snapshots) < MIN_PARALLEL_FRAMES):
+        return _encode_batch(format, width, height, snapshots, None)
+    count = max(1, min(len(snapshots), workers * BATCHES_PER_WORKER))
+    bounds = [len(snapshots) * index // count for index in range(count + 1)]
+    batches = [snapshots[start:stop] for start, stop in zip(bounds, bounds[1:])]
+    previous = [snapshots[start - 1] if start else None for start in bounds[:-1]]
+
+    def work(pool):
+        tasks = pool.map(_encode_batch, repeat(format), repeat(width), repeat(height), batches, previous)
+        return [chunk for chunks in tasks for chunk in chunks]
+
+    if executor is not None:
+        return work(executor)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return work(pool)
+
+
+def _encode_batch(format, width, height, snapshots, previous):
+    """
+    Worker: rasterize and compress ``snapshots``.
+
+    Returns one ``(x, y, w, h, data)`` per frame, ``data`` being zlib
+    compressed PNG scanlines or GIF LZW codes of the ``w`` by ``h``
+    rectangle at ``(x, y)``. PNG sequences always get the whole frame.
+    """
+    encoded = []
+    for snapshot in snapshots:
+        rect = (0, 0, width, height)
+        if previous is not None and format != "png":
+            rect = _changed_rect(width, height, previous, snapshot)
+        pixels = _crop(height, snapshot, rect)
+        x, y, w, h = rect
+        if format == "gif":
+            data = _lzw_encode(pixels, _gif_code_size(STATE_COUNT + 1))
+        else:
+            data = zlib.compress(b"".join(b"\0" + pixels[row * w:(row + 1) * w] for row in range(h)))
+        encoded.append((x, y, w, h, data))
+        previous = snapshot
+    return encoded
+
+
+def _changed_rect(width, height, before, after):
+    """Smallest rectangle covering every column that differs between two frames; at least 1x1."""
+    changed = [
+        x
+        for x in range(width)
+        if before[0][x] != after[0][x] or before[1][x] != after[1][x] or before[2][x] != after[2][x]
+    ]
+    if not changed:
+        return 0, 0, 1, 1
+    left, right = changed[0], changed[-1] + 1
+    top = max(0, min(min(before[0][left:right]), min(after[0][left:right])))
+    bottom = min(height, max(max(before[1][left:right]), max(after[1][left:right])))
+    if bottom <= top:
+        top, bottom = 0, 1
+    return left, top, right - left, bottom - top
+
+
+def _crop(height, snapshot, rect):
+    x, y, w, h = rect
+    tops, bottoms, indices = snapshot
+    pixels = render_indexed(w, height, tops[x:x + w], bottoms[x:x + w], indices[x:x + w])
+    return pixels[y * w:(y + h) * w]
+
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _png_header(width, height, colors):
+    return (
+        _PNG_SIGNATURE
+        + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0))
+        + _chunk(b"PLTE", b"".join(bytes(rgb) for rgb in colors))
+    )
+
+
+def _delays(durations, unit, minimum=0):
+    """
+    Frame delays in ``unit`` ticks, at least ``minimum`` each, rounded
+    cumulatively so the total only drifts where ``minimum`` forces it to.
+    """
+    delays = []
+    elapsed = 0.0
+    shown = 0
+    for duration in durations:
+        elapsed += duration
+        delay = max(minimum, round(elapsed * unit) - shown)
+        delays.append(delay)
+        shown += delay
+    return delays
+
+
+def _write_apng(path, width, height, colors, encoded, durations):
+    with open(path, "wb") as handle:
+        handle.write(_png_header(width, height, colors))
+        handle.write(_chunk(b"acTL", struct.pack(">II", len(encoded), 0)))
+        sequence = 0
+        for index, ((x, y, w, h, data), delay) in enumerate(zip(encoded, _delays(durations, 1000))):
+            # Delays are in milliseconds; a 16-bit numerator caps one frame at about a minute.
+            control = struct.pack(">IIIIIHHBB", sequence, w, h, x, y, min(delay, 0xFFFF), 1000, 0, 0)
+            handle.write(_chunk(b"fcTL", control))
+            sequence += 1
+            if index == 0:
+                handle.write(_chunk(b"IDAT", data))
+            else:
+                handle.write(_chunk(b"fdAT", struct.pack(">I", sequence) + data))
+                sequence += 1
+        handle.write(_chunk(b"IEND", b""))
+
+
+def _write_sequence(path, width, height, colors, encoded, durations):
+    """Write ``frame_00000.png``... plus an ffmpeg concat list that keeps the merged frame durations."""
+    path.mkdir(parents=True, exist_ok=True)
+    header = _png_header(width, height, colors)
+    lines = ["ffconcat version 1.0"]
+    for index, ((_x, _y, _w, _h, data), duration) in enumerate(zip(encoded, durations)):
+        name = f"frame_{index:05d}.png"
+        (path / name).write_bytes(header + _chunk(b"IDAT", data) + _chunk(b"IEND", b""))
+        lines.append(f"file {name}")
+        lines.append(f"duration {duration:.4f}")
+    if encoded:
+        # The concat demuxer ignores the last duration unless the last file is listed again.
+        lines.append(f"file frame_{len(encoded) - 1:05d}.png")
+    (path / "frames.ffconcat").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _gif_code_size(color_count):
+    """Bits per color index; GIF needs at least 2."""
+    return max(2, (color_count - 1).bit_length())
+
+
+def _write_gif(path, width, height, colors, encoded, durations):
+    code_size = _gif_code_size(len(colors))
+    table = b"".join(bytes(rgb) for rgb in colors) + bytes(3 * ((1 << code_size) - len(colors)))
+    with open(path, "wb") as handle:
+        handle.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF0 | (code_size - 1), 0, 0) + table)
+        # NETSCAPE2.0 extension: loop forever.
+        handle.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+        for (x, y, w, h, data), delay in zip(encoded, _delays(durations, 100, minimum=1)):
+            # Graphic control: disposal 1 keeps the frame, so the next one only draws what changed.
+            handle.write(b"\x21\xf9\x04" + struct.pack("<BHBB", 0x04, min(delay, 0xFFFF), 0, 0))
+            handle.write(b"\x2c" + struct.pack("<HHHHB", x, y, w, h, 0) + bytes((code_size,)))
+            for start in range(0, len(data), 255):
+                block = data[start:start + 255]
+                handle.write(bytes((len(block),)) + block)
+            handle.write(b"\x00")
+        handle.write(b"\x3b")
+
+
+def _lzw_encode(pixels, min_code_size):
+    """GIF flavored LZW: variable code width up to 12 bits, a clear code whenever the table fills up."""
+    clear = 1 << min_code_size
+    code_size = min_code_size + 1
+    next_code = clear + 2
+    table = {}
+    out = bytearray()
+    buffer = clear
+    filled = code_size
+    prefix = None
+    for byte in pixels:
+        if prefix is None:
+            prefix = byte
+            continue
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        buffer |= prefix << filled
+        filled += code_size
+        while filled >= 8:
+            out.append(buffer & 0xFF)
+            buffer >>= 8
+            filled -= 8
+        if next_code < _GIF_MAX_CODE:
+            table[key] = next_code
+            next_code += 1
+            # The decoder adds its entry one code later, so it widens one code later too.
+            if next_code > 1 << code_size:
+                code_size += 1
+        else:
+            buffer |= clear << filled
+            filled += code_size
+            table = {}
+            code_size = min_code_size + 1
+            next_code = clear + 2
+        prefix = byte
+    if prefix is not None:
+        buffer |= prefix << filled
+        filled += code_size
+        if next_code == 1 << code_size and code_size < 12:
+            code_size += 1
+    buffer |= (clear + 1) << filled
+    filled += code_size
+    while filled > 0:
+        out.append(buffer & 0xFF)
+        buffer >>= 8
+        filled -= 8
+    return bytes(out)
@@ -0,0 +1,141 @@
+"""
+Per-frame measurements for the performance HUD.
+
+``FrameStats`` keeps the last ``window`` frames of a run. For each frame it
+stores how long the algorithm's steps, the downsampler and the Tk drawing
+took, how many steps the frame applied and how many Tcl commands it sent.
+``summary`` turns these into render FPS, p50/p99 frame times and per-frame
+averages. It also names the stage that took the most time per frame, so a
+slow run shows whether the algorithm, the downsampler or Tk is the
+bottleneck.
+
+``TclCallCounter`` counts the Tcl commands of a widget by standing in for
+its interpreter handle (``widget.tk``).
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+
+DEFAULT_WINDOW = 240
+
+STAGES = ("algorithm", "downsampler", "Tk")
+
+
+class TclCallCounter:
+    """
+    Wraps a widget's Tcl interpreter and counts ``call``\\s.
+
+    Everything else is passed through. Widgets and images created with the
+    wrapped widget as master inherit the wrapper, so their commands are
+    counted too.
+    """
+
+    def __init__(self, tk_app):
+        self._tk = tk_app
+        self.calls = 0
+
+    @classmethod
+    def install(cls, widget):
+        """Wrap ``widget.tk`` unless it is wrapped already; returns the counter."""
+        counter = widget.tk
+        if not isinstance(counter, cls):
+            counter = widget.tk = cls(counter)
+        return counter
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of ``values``; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class FrameStats:
+    """Rolling per-frame timings and counts of the last ``window`` frames."""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        window = self.window
+        self._stamps = deque(maxlen=window)
+        self._step_s = deque(maxlen=window)
+        self._downsample_s = deque(maxlen=window)
+        self._draw_s = deque(maxlen=window)
+        self._steps = deque(maxlen=window)
+        self._tcl_calls = deque(maxlen=window)
+
+    def __len__(self):
+        return len(self._stamps)
+
+    def record(self, step_seconds, downsample_seconds, draw_seconds, steps, tcl_calls, now=None):
+        """
+        Add one frame. ``draw_seconds`` is the whole ``update_plot`` time,
+        downsampling included; ``steps`` is how many steps the frame applied.
+        """
+        self._stamps.append(time.perf_counter() if now is None else now)
+        self._step_s.append(step_seconds)
+        self._downsample_s.append(min(downsample_seconds, draw_seconds))
+        self._draw_s.append(draw_seconds)
+        self._steps.append(steps)
+        self._tcl_calls.append(tcl_calls)
+
+    def fps(self):
+        """Frames per second over the window."""
+        if len(self._stamps) < 2:
+            return 0.0
+        span = self._stamps[-1] - self._stamps[0]
+        return (len(self._stamps) - 1) / span if span > 0 else 0.0
+
+    def summary(self) -> dict:
+        frames = len(self._stamps)
+        if not frames:
+            return {"frames": 0}
+        step_s = sum(self._step_s) / frames
+        downsample_s = sum(self._downsample_s) / frames
+        tk_s = sum(self._draw_s) / frames - downsample_s
+        steps = sum(self._steps) / frames
+        stage_times = dict(zip(STAGES, (step_s, downsample_s, tk_s)))
+        return {
+            "frames": frames,
+            "fps": self.fps(),
+            "frame_p50_s": percentile(self._draw_s, 0.5),
+            "frame_p99_s": percentile(self._draw_s, 0.99),
+            "step_s": step_s,
+            "downsample_s": downsample_s,
+            "tk_s": tk_s,
+            "steps_per_frame": steps,
+            # Every step but the last one of a frame is applied without being drawn.
+            "undrawn_per_frame": sum(max(0, count - 1) for count in self._steps) / frames,
+            "tcl_per_frame": sum(self._tcl_calls) / frames,
+            "bottleneck": max(stage_times, key=stage_times.get),
+        }
+
+    def format(self) -> str:
+        """The HUD text: three short lines."""
+        stats = self.summary()
+        if not stats["frames"]:
+            return "No frames yet"
+        return "\n".join(
+            (
+                f"{stats['fps']:.1f} FPS · update_plot p50 {stats['frame_p50_s'] * 1000:.1f} ms"
+                f" · p99 {stats['frame_p99_s'] * 1000:.1f} ms",
+                f"{stats['steps_per_frame']:,.0f} steps/frame ({stats['undrawn_per_frame']:,.0f} not drawn)"
+                f" · {stats['tcl_per_frame']:,.0f} Tcl cmds/frame",
+                f"per frame: algorithm {stats['step_s'] * 1000:.1f} ms · downsampler"
+                f" {stats['downsample_s'] * 1000:.1f} ms · Tk {stats['tk_s'] * 1000:.1f} ms"
+                f" → {stats['bottleneck']}",
+            )
+        )
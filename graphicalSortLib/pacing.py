@@ -0,0 +1,121 @@
+"""
+Frame pacing driven by measured throughput.
+
+Before a paced run starts, the app dry-runs the algorithm's step generator
+on a copy for a short time budget. Most runs finish inside the budget,
+which gives the exact number of steps; longer runs give a lower bound that
+the controller keeps raising while the run goes.
+
+``PacingController`` then decides, after every rendered frame, how many
+steps to advance per frame (``skip``) and how long to wait between frames
+(``interval``) from the measured render time and step rate, so the run hits
+either a target duration or, when running as fast as possible, the target
+frame rate.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+DEFAULT_FPS = 60.0
+
+# Exponential moving average weight for render time and step rate samples.
+_SMOOTHING = 0.2
+# Steps per frame for unpaced runs before any throughput was measured.
+_UNPACED_INITIAL_SKIP = 256
+
+
+class PacingController:
+    """
+    Chooses steps per frame and frame interval from measured throughput.
+
+    ``duration`` is the wall time the whole run should take. Without one,
+    ``delay`` (seconds per frame) is turned into a duration by spreading the
+    run over at most ``capacity`` frames; with neither the run is unpaced and
+    the controller only keeps the frame rate at ``target_fps``.
+    """
+
+    def __init__(self, duration=None, delay=0.0, capacity=None, target_fps=DEFAULT_FPS, fallback_total=0):
+        self.duration = duration if duration and duration > 0 else None
+        self.delay = max(0.0, delay or 0.0)
+        self.capacity = capacity if capacity and capacity > 0 else None
+        self.target_fps = max(1.0, target_fps)
+        self.total = max(0, int(fallback_total))
+        self.exact_total = False
+        self.skip = 1
+        self.interval = 1.0 / self.target_fps
+        self.render_time = 0.0
+        self.step_rate = 0.0
+        self.started = None
+        self._last_sample = None
+
+    @property
+    def paced(self):
+        return self.duration is not None or self.delay > 0
+
+    def begin(self, total, exact, now=None):
+        """Called once the probe is done; starts the clock for the target duration."""
+        if exact or total > self.total:
+            self.total = total
+        self.exact_total = exact
+        self.started = time.perf_counter() if now is None else now
+        self._last_sample = (self.started, 0)
+        self._recompute(0, self.started)
+
+    def settle(self, total):
+        """Called when the exact step count becomes known after ``begin``, e.g. from a worker."""
+        self.total = total
+        self.exact_total = True
+
+    def shift(self, seconds):
+        """Move the clock forward by a pause of ``seconds`` so paused time is not counted."""
+        if self.started is not None:
+            self.started += seconds
+        if self._last_sample is not None:
+            self._last_sample = (self._last_sample[0] + seconds, self._last_sample[1])
+
+    def target_duration(self):
+        if self.duration is not None:
+            return self.duration
+        frames = self.total if self.capacity is None else min(self.total, self.capacity)
+        return self.delay * max(1, frames)
+
+    def frame_done(self, steps_done, render_seconds, now=None):
+        """Feed one rendered frame's measurements and update ``skip``/``interval``."""
+        if now is None:
+            now = time.perf_counter()
+        self.render_time += _SMOOTHING * (render_seconds - self.render_time)
+        if self._last_sample is not None:
+            last_time, last_steps = self._last_sample
+            if now > last_time and steps_done >= last_steps:
+                rate = (steps_done - last_steps) / (now - last_time)
+                self.step_rate += _SMOOTHING * (rate - self.step_rate)
+        self._last_sample = (now, steps_done)
+        if not self.exact_total and steps_done >= self.total:
+            # The probe only gave a lower bound: assume half the work is left.
+            self.total = steps_done * 2
+        self._recompute(steps_done, now)
+
+    def _recompute(self, steps_done, now):
+        # Rendering slower than the target frame rate lowers the frame rate.
+        fps = min(self.target_fps, 1.0 / max(self.render_time, 1e-4))
+        interval = 1.0 / fps
+        if not self.paced:
+            self.interval = interval
+            # Until the first rate sample arrives, assume a modest batch per frame.
+            steps = self.step_rate * interval if self.step_rate else _UNPACED_INITIAL_SKIP
+            self.skip = max(1, int(steps))
+            return
+
+        elapsed = now - self.started if self.started is not None else 0.0
+        remaining_time = max(self.target_duration() - elapsed, interval)
+        remaining_steps = max(1, self.total - steps_done)
+        rate = remaining_steps / remaining_time
+        if rate * interval < 1:
+            # Fewer steps than frames: one step per frame, spaced out.
+            self.skip = 1
+            self.interval = 1.0 / rate
+        else:
+            self.skip = max(1, math.ceil(rate * interval))
+            self.interval = interval
@@ -0,0 +1,238 @@
+"""
+cProfile and tracemalloc around one algorithm run.
+
+A ``RunProfiler`` is started when a run starts and stopped when it ends,
+which in the GUI is many Tk callbacks later. ``stop`` writes
+``<algorithm>.pstats`` (open it with ``pstats.Stats`` or a viewer such as
+snakeviz) and ``<algorithm>.profile.json`` to the output directory, and
+returns a ``ProfileReport``:
+
+- ``breakdown``: seconds spent in the algorithm's step generator, in the
+  step sink that applies its steps (what used to be the ``visualizer``
+  callback), in ``_draw_visual_frame`` apart from its ``update_plot``
+  call, and in ``update_plot``. The parts do not overlap, so their shares
+  add up to at most 100%. Comes from the cProfile data.
+- ``peak_kib`` / ``retained_kib``: the most memory allocated during the
+  run on top of what existed before it, and what was still held at the
+  end. The input array exists before the run, so ``peak_kib`` is the
+  run's auxiliary memory. Comes from tracemalloc.
+- ``aux_reads`` / ``aux_writes``: the algorithm's own count of auxiliary
+  memory traffic from its ``OpCounter``.
+
+Both profilers slow a run down, tracemalloc by far the most, so compare
+the shares of the breakdown rather than absolute times with unprofiled
+runs.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# (file name, function name) of the profiled functions.
+# StepDriver._capture is the frame every step generator runs in.
+_ALGORITHM = ("events.py", "_capture")
+_ADVANCE = ("events.py", "advance")
+_DRAW_FRAME = ("app.py", "_draw_visual_frame")
+_UPDATE_PLOT = ("app.py", "update_plot")
+
+
+class ProfileOptions(NamedTuple):
+    """What to profile and where to write the results."""
+
+    directory: str = "."
+    cpu: bool = True
+    memory: bool = True
+
+
+class ProfileReport(NamedTuple):
+    algorithm: str
+    elapsed: float
+    stats_path: Optional[str]
+    report_path: str
+    breakdown: dict
+    peak_kib: Optional[float]
+    retained_kib: Optional[float]
+    array_kib: float
+    aux_reads: int
+    aux_writes: int
+
+
+def file_stem(name: str) -> str:
+    """``"Quick Sort"`` -> ``"quick_sort"``."""
+    return re.sub(r"[^0-9a-z]+", "_", name.lower()).strip("_") or "run"
+
+
+def _cumulative(stats, filename, function):
+    """Total cumulative seconds of every profiled function ``function`` defined in ``filename``."""
+    return sum(
+        entry[3]
+        for (path, _line, name), entry in stats.stats.items()
+        if name == function and Path(path).name == filename
+    )
+
+
+def _called_from(stats, callee, caller):
+    """Cumulative seconds of ``callee`` in the calls made by ``caller``; both are (file name, function name)."""
+    seconds = 0.0
+    for (path, _line, name), entry in stats.stats.items():
+        if (Path(path).name, name) != callee:
+            continue
+        # entry[4] maps each caller to the (calls, primitive calls, total, cumulative) times of its calls.
+        seconds += sum(
+            timing[3]
+            for (caller_path, _caller_line, caller_name), timing in entry[4].items()
+            if (Path(caller_path).name, caller_name) == caller
+        )
+    return seconds
+
+
+def time_breakdown(stats: pstats.Stats) -> dict:
+    """Seconds per part of a run, plus the total, from ``stats``. The parts do not overlap."""
+    algorithm = _cumulative(stats, *_ALGORITHM)
+    return {
+        "algorithm": algorithm,
+        # advance() resumes the generator, so its time minus the generator's is the sink's.
+        "step sink": max(0.0, _cumulative(stats, *_ADVANCE) - algorithm),
+        # _draw_visual_frame calls update_plot, which is reported on its own.
+        "_draw_visual_frame": max(
+            0.0, _cumulative(stats, *_DRAW_FRAME) - _called_from(stats, _UPDATE_PLOT, _DRAW_FRAME)
+        ),
+        "update_plot": _cumulative(stats, *_UPDATE_PLOT),
+        "total": stats.total_tt,
+    }
+
+
+class RunProfiler:
+    """Profiles one run of ``name``; ``start`` and ``stop`` may be called from different callbacks."""
+
+    def __init__(self, name, options: ProfileOptions = ProfileOptions()):
+        if not options.cpu and not options.memory:
+            raise ValueError("Enable CPU or memory profiling, or both.")
+        self.name = name
+        self.options = options
+        self._profile = None
+        self._started_tracing = False
+        self._memory_base = 0
+        self._started = None
+
+    @property
+    def running(self):
+        return self._started is not None
+
+    def start(self):
+        if self.options.memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._started_tracing = True
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        if self.options.cpu:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = time.perf_counter()
+
+    def _disable(self):
+        elapsed = time.perf_counter() - self._started
+        self._started = None
+        if self._profile is not None:
+            self._profile.disable()
+        memory = None
+        if self.options.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            memory = (peak - self._memory_base, current - self._memory_base)
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return elapsed, memory
+
+    def cancel(self):
+        """Stop profiling without writing anything."""
+        if self.running:
+            self._disable()
+        self._profile = None
+
+    def stop(self, values=None, counter=None) -> ProfileReport:
+        """
+        Stop profiling and write the results. ``values`` (the input array)
+        and ``counter`` (the run's ``OpCounter``) complete the memory report.
+        """
+        elapsed, memory = self._disable()
+        directory = Path(self.options.directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = file_stem(self.name)
+        stats_path = None
+        breakdown = {}
+        if self._profile is not None:
+            stats = pstats.Stats(self._profile)
+            stats_path = directory / f"{stem}.pstats"
+            stats.dump_stats(stats_path)
+            breakdown = time_breakdown(stats)
+            self._profile = None
+        peak, retained = memory if memory is not None else (None, None)
+        report = ProfileReport(
+            algorithm=self.name,
+            elapsed=elapsed,
+            stats_path=None if stats_path is None else str(stats_path),
+            report_path=str(directory / f"{stem}.profile.json"),
+            breakdown=breakdown,
+            peak_kib=None if peak is None else round(peak / 1024, 1),
+            retained_kib=None if retained is None else round(max(0, retained) / 1024, 1),
+            array_kib=round(_array_bytes(values) / 1024, 1),
+            aux_reads=0 if counter is None else counter.aux_reads,
+            aux_writes=0 if counter is None else counter.aux_writes,
+        )
+        with open(report.report_path, "w", encoding="utf-8") as handle:
+            json.dump(report._asdict(), handle, indent=2)
+        return report
+
+
+def _array_bytes(values):
+    if values is None:
+        return 0
+    size = sys.getsizeof(values)
+    if isinstance(values, list):
+        # A list also owns its int objects; small ints are shared, so this is an upper bound.
+        size += sum(map(sys.getsizeof, values))
+    return size
+
+
+def format_summary(report: ProfileReport) -> str:
+    """One line: the share of every part of the breakdown and the peak memory."""
+    total = report.breakdown.get("total") or 0.0
+    parts = [
+        f"{label} {seconds / total:.0%}"
+        for label, seconds in report.breakdown.items()
+        if label != "total" and seconds and total
+    ]
+    if report.peak_kib is not None:
+        parts.append(f"peak {report.peak_kib:,.1f} KiB")
+    return ", ".join(parts)
+
+
+def format_report(report: ProfileReport) -> str:
+    lines = [f"{report.algorithm}: {report.elapsed:.3f}s profiled"]
+    total = report.breakdown.get("total") or 0.0
+    for label, seconds in report.breakdown.items():
+        if label == "total" or not seconds:
+            continue
+        share = f" ({seconds / total:.0%})" if total else ""
+        lines.append(f"  {label:<20}{seconds * 1000:>11.1f} ms{share}")
+    if report.peak_kib is not None:
+        lines.append(
+            f"  memory: peak {report.peak_kib:,.1f} KiB above the {report.array_kib:,.1f} KiB input,"
+            f" {report.retained_kib:,.1f} KiB still held at the end"
+        )
+    lines.append(f"  auxiliary reads/writes: {report.aux_reads:,}/{report.aux_writes:,}")
+    if report.stats_path:
+        lines.append(f"  stats: {report.stats_path}")
+    lines.append(f"  report: {report.report_path}")
+    return "\n".join(lines)
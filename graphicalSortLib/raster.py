@@ -0,0 +1,134 @@
+"""
+Off-screen raster rendering of bar charts.
+
+``render_ppm`` draws bars into a binary PPM (P6) image that Tk can load into
+a ``PhotoImage`` with a single call, so a frame costs one Tcl round trip no
+matter how many bars are visible. Each pixel column shows one bar, filled
+from its top row down to its bottom row in its palette color.
+``render_stacked_ppm`` stacks several such charts into one image, and
+``render_indexed`` returns the palette codes instead of RGB for encoders
+of indexed images (GIF, palette PNG).
+
+The image is built row by row in a ``bytearray``: a row only changes where
+bars start or end, so unchanged rows are reused and each changed row is
+expanded to RGB with three ``bytes.translate`` calls. This beats a NumPy
+lookup-table gather over the full image, so there is no NumPy path here.
+"""
+
+from __future__ import annotations
+
+
+def column_layout(width, count):
+    """Bar index of every pixel column when ``count`` bars span ``width`` pixels."""
+    return [x * count // width for x in range(width)]
+
+
+def column_spans(width, height, scale, values, min_values, states, envelope=False):
+    """
+    Pixel columns for bars ``values`` drawn ``width`` pixels wide.
+
+    Returns the ``(tops, bottoms, indices)`` that ``render_ppm`` takes, with
+    ``scale`` pixels per unit of value. With ``envelope`` every column spans
+    its bucket's ``min_values`` to ``values`` and is at least 1px tall.
+    """
+    columns = column_layout(width, len(values))
+    tops = [int(height - values[bar] * scale) for bar in columns]
+    if envelope:
+        bottoms = [max(top + 1, int(height - min_values[bar] * scale)) for top, bar in zip(tops, columns)]
+    else:
+        bottoms = [height] * width
+    indices = [states[bar] for bar in columns]
+    return tops, bottoms, indices
+
+
+def render_ppm(width, height, tops, bottoms, indices, palette, background):
+    """
+    Render ``width`` pixel columns of ``height`` rows into PPM bytes.
+
+    ``tops``/``bottoms`` give every column's first and one-past-last filled
+    row and ``indices`` its palette index. ``palette`` is a sequence of
+    ``(r, g, b)`` tuples (at most 255 entries); ``background`` fills the
+    rest of the image.
+    """
+    header = b"P6 %d %d 255\n" % (width, height)
+    return header + _render_rows(width, height, tops, bottoms, indices, palette, background)
+
+
+def render_stacked_ppm(width, bands, palette, background):
+    """
+    Render several bar charts stacked top to bottom into one PPM image.
+
+    ``bands`` holds a ``(height, tops, bottoms, indices)`` tuple per chart,
+    with rows counted from the top of that chart; all charts share
+    ``palette`` and ``background`` as in ``render_ppm``.
+    """
+    height = sum(band[0] for band in bands)
+    header = b"P6 %d %d 255\n" % (width, height)
+    rows = [
+        _render_rows(width, band_height, tops, bottoms, indices, palette, background)
+        for band_height, tops, bottoms, indices in bands
+    ]
+    return header + b"".join(rows)
+
+
+def render_indexed(width, height, tops, bottoms, indices):
+    """
+    Like ``render_ppm`` but one byte per pixel and no header: code 0 is the
+    background and code ``n + 1`` is palette entry ``n``.
+    """
+    starts, ends = _row_edges(width, height, tops, bottoms)
+    codes = bytearray(width)
+    row = bytes(codes)
+    image = bytearray()
+    for y in range(height):
+        if starts[y] or ends[y]:
+            for x in ends[y]:
+                codes[x] = 0
+            for x in starts[y]:
+                codes[x] = indices[x] + 1
+            row = bytes(codes)
+        image += row
+    return bytes(image)
+
+
+def _row_edges(width, height, tops, bottoms):
+    """Columns starting and ending on every row."""
+    starts = [[] for _ in range(height + 1)]
+    ends = [[] for _ in range(height + 1)]
+    for x in range(width):
+        top = max(0, min(height, tops[x]))
+        bottom = max(top, min(height, bottoms[x]))
+        if bottom > top:
+            starts[top].append(x)
+            ends[bottom].append(x)
+    return starts, ends
+
+
+def _render_rows(width, height, tops, bottoms, indices, palette, background):
+    # Channel lookup tables: code 0 is the background, code n + 1 is palette[n].
+    channels = [bytearray(256) for _ in range(3)]
+    for code, rgb in enumerate([background] + list(palette)):
+        for channel, value in zip(channels, rgb):
+            channel[code] = value
+    red, green, blue = (bytes(channel) for channel in channels)
+
+    starts, ends = _row_edges(width, height, tops, bottoms)
+    codes = bytearray(width)
+    pixels = bytearray(3 * width)
+    pixels[0::3] = codes.translate(red)
+    pixels[1::3] = codes.translate(green)
+    pixels[2::3] = codes.translate(blue)
+    row = bytes(pixels)
+    image = bytearray()
+    for y in range(height):
+        if starts[y] or ends[y]:
+            for x in ends[y]:
+                codes[x] = 0
+            for x in starts[y]:
+                codes[x] = indices[x] + 1
+            pixels[0::3] = codes.translate(red)
+            pixels[1::3] = codes.translate(green)
+            pixels[2::3] = codes.translate(blue)
+            row = bytes(pixels)
+        image += row
+    return bytes(image)
@@ -0,0 +1,216 @@
+"""
+Registry of the available sorts and searches.
+
+Every algorithm is described by an ``AlgorithmInfo``: display name, kind,
+best/average/worst complexity, stability, whether it sorts in place, its
+auxiliary memory class and the dotted path of its step generator. The
+module behind that path is only imported when the algorithm is first run,
+so listing algorithms or showing their metadata imports none of them.
+
+Other packages add algorithms through the ``graphicalSortLib.algorithms``
+entry point group. Each entry point loads an ``AlgorithmInfo`` or an
+iterable of them; its ``steps`` path should be absolute:
+
+    [project.entry-points."graphicalSortLib.algorithms"]
+    gnome = "my_sorts.registry:GNOME_SORT"
+
+Complexities are plain strings such as ``"n log n"``; ``estimate_steps``
+turns the average case into the step estimate used for frame pacing. ``k``
+is a value range or bucket count, ``d`` a digit count and ``b`` a radix.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import warnings
+from typing import NamedTuple, Optional
+
+ENTRY_POINT_GROUP = "graphicalSortLib.algorithms"
+
+SORT = "sort"
+SEARCH = "search"
+
+
+class AlgorithmInfo(NamedTuple):
+    name: str
+    kind: str
+    # "module:attribute" of the step generator; a leading dot is relative to this package.
+    steps: str
+    best: str
+    average: str
+    worst: str
+    # Stability and in-place-ness only apply to sorts.
+    stable: Optional[bool] = None
+    in_place: Optional[bool] = None
+    aux_memory: str = "1"
+    # Randomized sorts take a ``seed`` keyword and are bounded by an attempt budget.
+    randomized: bool = False
+    # Searches that only work on sorted input.
+    requires_sorted: bool = False
+    # Optional "module:attribute" of a NumPy version for headless runs: takes values, returns a sorted ndarray.
+    vectorized: Optional[str] = None
+    # Optional "module:attribute" of a multi-core version: sorts values in place, ``f(values, workers, executor)``.
+    multicore: Optional[str] = None
+
+    def describe(self) -> str:
+        """One-line summary of the metadata for the UI."""
+        parts = [f"best {self.best}", f"avg {self.average}", f"worst {self.worst}"]
+        if self.stable is not None:
+            parts.append("stable" if self.stable else "unstable")
+        if self.in_place is not None:
+            parts.append("in-place" if self.in_place else "not in-place")
+        parts.append(f"aux {self.aux_memory}")
+        return " · ".join(parts)
+
+
+_BUILTINS = (
+    AlgorithmInfo("Quick Sort", SORT, ".algorithms.quick_sort:quick_sort_steps",
+                  "n log n", "n log n", "n^2", False, True, "log n"),
+    AlgorithmInfo("Heap Sort", SORT, ".algorithms.heap_sort:heap_sort_steps",
+                  "n log n", "n log n", "n log n", False, True, "1"),
+    AlgorithmInfo("Tim Sort", SORT, ".algorithms.tim_sort:tim_sort_steps",
+                  "n log n", "n log n", "n log n", True, False, "n"),
+    AlgorithmInfo("Insertion Sort", SORT, ".algorithms.insertion_sort:insertion_sort_steps",
+                  "n", "n^2", "n^2", True, True, "1"),
+    AlgorithmInfo("Merge Sort", SORT, ".algorithms.merge_sort:merge_sort_steps",
+                  "n log n", "n log n", "n log n", True, False, "n"),
+    AlgorithmInfo("Selection Sort", SORT, ".algorithms.selection_sort:selection_sort_steps",
+                  "n^2", "n^2", "n^2", False, True, "1"),
+    AlgorithmInfo("Bubble Sort", SORT, ".algorithms.bubble_sort:bubble_sort_steps",
+                  "n^2", "n^2", "n^2", True, True, "1"),
+    AlgorithmInfo("Binary Insertion Sort", SORT, ".algorithms.binary_insertion_sort:binary_insertion_sort_steps",
+                  "n log n", "n^2", "n^2", False, True, "1"),
+    AlgorithmInfo("Parallel Merge Sort", SORT, ".algorithms.parallel_sort:parallel_merge_sort_steps",
+                  "n log n", "n log n", "n log n", True, False, "n",
+                  multicore=".algorithms.parallel_sort:merge_sort_multicore"),
+    AlgorithmInfo("Parallel Sample Sort", SORT, ".algorithms.parallel_sort:parallel_sample_sort_steps",
+                  "n log n", "n log n", "n log n", True, False, "n",
+                  multicore=".algorithms.parallel_sort:sample_sort_multicore"),
+    AlgorithmInfo("Counting Sort", SORT, ".algorithms.distribution_sort:counting_sort_steps",
+                  "n + k", "n + k", "n + k", True, False, "n + k",
+                  vectorized=".algorithms.distribution_sort:counting_sort_numpy"),
+    AlgorithmInfo("LSD Radix Sort", SORT, ".algorithms.distribution_sort:radix_lsd_sort_steps",
+                  "n * d", "n * d", "n * d", True, False, "n + b",
+                  vectorized=".algorithms.distribution_sort:radix_sort_numpy"),
+    AlgorithmInfo("MSD Radix Sort", SORT, ".algorithms.distribution_sort:radix_msd_sort_steps",
+                  "n * d", "n * d", "n * d", True, False, "n + b"),
+    AlgorithmInfo("Bucket Sort", SORT, ".algorithms.distribution_sort:bucket_sort_steps",
+                  "n + k", "n + k", "n^2", True, False, "n + k"),
+    AlgorithmInfo("Bogo Sort", SORT, ".algorithms.randomized_sort:bogosort_steps",
+                  "n", "n * n!", "unbounded", False, True, "n", randomized=True),
+    AlgorithmInfo("Bozo Sort", SORT, ".algorithms.randomized_sort:bozosort_steps",
+                  "n", "n!", "unbounded", False, True, "n", randomized=True),
+    AlgorithmInfo("Bogobogo Sort", SORT, ".algorithms.randomized_sort:bogobogosort_steps",
+                  "n", "n * n!", "unbounded", False, True, "1", randomized=True),
+    AlgorithmInfo("Linear Search", SEARCH, ".algorithms.linear_search:linear_search_steps",
+                  "1", "n", "n"),
+    AlgorithmInfo("Binary Search", SEARCH, ".algorithms.binary_search:binary_search_steps",
+                  "1", "log n", "log n", requires_sorted=True),
+)
+
+# Step counts per complexity class; factorials are capped so they stay cheap to compute.
+_GROWTH = {
+    "1": lambda n: 1,
+    "log n": lambda n: int(math.log2(n)) + 1,
+    "n": lambda n: n,
+    # k (value range or bucket count) is about n for the app's generated arrays.
+    "n + k": lambda n: 2 * n,
+    # d decimal digits of the values, which the generated arrays keep below n.
+    "n * d": lambda n: n * len(str(n)),
+    "n log n": lambda n: n * math.log2(n),
+    "n^2": lambda n: n * n,
+    "n!": lambda n: math.factorial(min(n, 20)),
+    "n * n!": lambda n: n * math.factorial(min(n, 20)),
+}
+
+_registry: dict[str, AlgorithmInfo] = {}
+_loaded_steps = {}
+_discovered = False
+
+
+def register(info: AlgorithmInfo) -> AlgorithmInfo:
+    """Add an algorithm; raises ``ValueError`` if the name is already taken or the kind is unknown."""
+    if info.kind not in (SORT, SEARCH):
+        raise ValueError(f"Unknown algorithm kind {info.kind!r} for {info.name}.")
+    if info.name in _registry:
+        raise ValueError(f"An algorithm named {info.name!r} is already registered.")
+    _registry[info.name] = info
+    return info
+
+
+def _discover():
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+    for info in _BUILTINS:
+        register(info)
+    # importlib.metadata is slow to import; only pay for it once algorithms are looked up.
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded = entry_point.load()
+            for info in [loaded] if isinstance(loaded, AlgorithmInfo) else loaded:
+                register(info)
+        except Exception as exc:  # A broken plugin must not take the app down.
+            warnings.warn(f"Skipping algorithm plugin {entry_point.name!r}: {exc}", RuntimeWarning)
+
+
+def algorithms(kind: Optional[str] = None) -> list[AlgorithmInfo]:
+    """All registered algorithms in registration order, optionally only one ``kind``."""
+    _discover()
+    return [info for info in _registry.values() if kind is None or info.kind == kind]
+
+
+def algorithm_names(kind: Optional[str] = None) -> list[str]:
+    return [info.name for info in algorithms(kind)]
+
+
+def algorithm_info(name: str) -> AlgorithmInfo:
+    _discover()
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown algorithm: {name}") from None
+
+
+def _resolve(path):
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name, package=__package__), attribute)
+
+
+def load_steps(name: str):
+    """Import and return the step generator of ``name``; the import happens on first use only."""
+    make_steps = _loaded_steps.get(name)
+    if make_steps is None:
+        make_steps = _loaded_steps[name] = _resolve(algorithm_info(name).steps)
+    return make_steps
+
+
+def load_vectorized(name: str):
+    """The NumPy version of ``name``, or ``None`` if it has none."""
+    path = algorithm_info(name).vectorized
+    return None if path is None else _resolve(path)
+
+
+def load_multicore(name: str):
+    """The multi-core version of ``name``, or ``None`` if it has none."""
+    path = algorithm_info(name).multicore
+    return None if path is None else _resolve(path)
+
+
+def estimate_steps(name: str, length: int) -> float:
+    """Rough step count for ``length`` elements from the average complexity, for frame pacing."""
+    if length <= 0:
+        return 0
+    info = algorithm_info(name)
+    n = max(1, length)
+    estimate = _GROWTH.get(info.average, _GROWTH["n"])(n)
+    if info.randomized:
+        # About n steps per attempt, bounded by the attempt budget.
+        from .algorithms.randomized_sort import DEFAULT_MAX_ATTEMPTS
+
+        estimate = min(estimate, DEFAULT_MAX_ATTEMPTS * n)
+    return estimate
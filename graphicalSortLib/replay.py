@@ -0,0 +1,135 @@
+"""
+Replay of recorded traces with keyframe seeking.
+
+``TraceReplay`` restores the array and bar state at any step of a trace. A
+seek bisects the keyframe index, restores the nearest keyframe at or before
+the target and applies at most one keyframe interval of events. Stepping
+backwards uses an undo log, so playing in reverse costs O(1) per step.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from .algorithms.events import COMPARE, MARK, SWAP, WRITE, StepSink
+from .trace import TraceReader
+
+_NO_HIGHLIGHT = ()
+
+
+class TraceReplay:
+    """Plays a trace forwards and backwards over a ``StepSink`` state."""
+
+    def __init__(self, reader: TraceReader):
+        self.reader = reader
+        self.array = list(reader.initial_array)
+        self.sink = StepSink(self.array)
+        self.position = 0
+        self.total_steps = reader.total_steps
+        self._keyframe_steps = [chunk[1] for chunk in reader.keyframes]
+        self._chunk_steps = [chunk[1] for chunk in reader.event_chunks]
+        self._cached_chunk = -1
+        self._cached_events: list[tuple[int, int, int, int]] = []
+        self._undo: list[tuple] = []
+        self._undo_base = 0
+
+    @classmethod
+    def open(cls, path) -> "TraceReplay":
+        return cls(TraceReader(path))
+
+    @property
+    def at_end(self):
+        return self.position >= self.total_steps
+
+    def seek(self, step: int) -> int:
+        """Move to ``step`` (clamped to the trace) and return the new position."""
+        step = max(0, min(int(step), self.total_steps))
+        if step == self.position:
+            return step
+        if step < self.position:
+            if step >= self._undo_base:
+                self._undo_to(step)
+                return step
+        else:
+            keyframe = self._keyframe_steps[bisect_right(self._keyframe_steps, step) - 1]
+            if keyframe <= self.position:
+                self._apply_to(step)
+                return step
+        self._restore_keyframe(step)
+        self._apply_to(step)
+        return step
+
+    def step(self, count: int = 1) -> int:
+        """Advance by ``count`` steps; negative counts play backwards."""
+        return self.seek(self.position + count)
+
+    def _restore_keyframe(self, step):
+        index = bisect_right(self._keyframe_steps, step) - 1
+        values, states, highlight = self.reader.read_keyframe(self.reader.keyframes[index])
+        self.array[:] = values
+        self.sink.states[:] = states
+        self.sink.highlight = highlight
+        self.position = self._keyframe_steps[index]
+        self._undo.clear()
+        self._undo_base = self.position
+
+    def _events_for(self, step):
+        index = bisect_right(self._chunk_steps, step) - 1
+        if index != self._cached_chunk:
+            self._cached_events = self.reader.read_events(self.reader.event_chunks[index])
+            self._cached_chunk = index
+        return self._chunk_steps[index], self._cached_events
+
+    def _apply_to(self, step):
+        array = self.array
+        sink = self.sink
+        states = sink.states
+        undo = self._undo
+        keyframe_steps = self._keyframe_steps
+        position = self.position
+        while position < step:
+            first_step, events = self._events_for(position)
+            stop = min(len(events), step - first_step)
+            for offset in range(position - first_step, stop):
+                kind, a, b, c = events[offset]
+                previous = sink.highlight
+                if kind == COMPARE:
+                    undo.append((COMPARE, 0, 0, previous))
+                    sink.highlight = (a, b)
+                elif kind == SWAP:
+                    array[a], array[b] = array[b], array[a]
+                    undo.append((SWAP, a, b, previous))
+                    sink.highlight = (a, b)
+                elif kind == WRITE:
+                    undo.append((WRITE, a, array[a], previous))
+                    array[a] = b
+                    sink.highlight = (a, -1)
+                else:
+                    undo.append((MARK, a, bytes(states[a:b]), previous))
+                    if b > a:
+                        states[a:b] = bytes((c,)) * (b - a)
+                    sink.highlight = _NO_HIGHLIGHT
+            position = first_step + stop
+            # Keep the undo log no longer than one keyframe interval.
+            if len(keyframe_steps) > 1 and position - self._undo_base > 0:
+                index = bisect_right(keyframe_steps, position) - 1
+                if keyframe_steps[index] > self._undo_base:
+                    del undo[: keyframe_steps[index] - self._undo_base]
+                    self._undo_base = keyframe_steps[index]
+        self.position = position
+
+    def _undo_to(self, step):
+        array = self.array
+        sink = self.sink
+        states = sink.states
+        undo = self._undo
+        for _ in range(self.position - step):
+            kind, a, b, previous = undo.pop()
+            if kind == SWAP:
+                array[a], array[b] = array[b], array[a]
+            elif kind == WRITE:
+                array[a] = b
+            elif kind == MARK:
+                states[a : a + len(b)] = b
+            sink.highlight = previous
+        self.position = step
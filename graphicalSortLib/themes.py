@@ -0,0 +1,89 @@
+"""
+Color themes shared by the Tk app and the headless exporter.
+
+Each theme maps the app's color constant names to hex colors; the app
+copies the selected one into its module globals. ``sort_palette`` and
+``search_palette`` turn a theme into the tuple indexed by the bar states
+of ``algorithms.events``.
+"""
+
+THEME_PALETTES = {
+    "dark": {
+        "APP_BG": "#0F131A",
+        "PANEL_BG": "#171D26",
+        "PANEL_BORDER": "#2A3240",
+        "CANVAS_BG": "#0B1016",
+        "TEXT_COLOR": "#E6EDF3",
+        "MUTED_TEXT": "#9AA7B8",
+        "INPUT_BG": "#111827",
+        "BUTTON_BG": "#243041",
+        "BUTTON_ACTIVE_BG": "#33465E",
+        "START_BUTTON_BG": "#1F5F3B",
+        "START_BUTTON_ACTIVE_BG": "#2A7A4C",
+        "STOP_BUTTON_BG": "#5F2531",
+        "STOP_BUTTON_ACTIVE_BG": "#7A3342",
+        "ACCENT_COLOR": "#3DA5FF",
+        "LINK_COLOR": "#7DC4FF",
+        "DEFAULT_BAR_COLOR": "#4F8FF7",
+        "SORTED_BAR_COLOR": "#37D67A",
+        "RANGE_BAR_COLOR": "#E8B949",
+        "HIGHLIGHT_BAR_COLOR": "#FF5C7A",
+        "SEARCH_RANGE_COLOR": "#2C6CA8",
+        "SEARCH_CURRENT_COLOR": "#F4C542",
+        "SEARCH_VISITED_COLOR": "#5B6472",
+        "WARNING_COLOR": "#FFB454",
+        "ERROR_COLOR": "#FF6B6B",
+        "PARTITION_COLORS": ("#A78BFA", "#F97316", "#22D3EE", "#F472B6"),
+    },
+    "light": {
+        "APP_BG": "#F3F6FB",
+        "PANEL_BG": "#FFFFFF",
+        "PANEL_BORDER": "#CBD5E1",
+        "CANVAS_BG": "#EAF0F8",
+        "TEXT_COLOR": "#1F2937",
+        "MUTED_TEXT": "#4B5563",
+        "INPUT_BG": "#FFFFFF",
+        "BUTTON_BG": "#E2E8F0",
+        "BUTTON_ACTIVE_BG": "#CBD5E1",
+        "START_BUTTON_BG": "#2F855A",
+        "START_BUTTON_ACTIVE_BG": "#38A169",
+        "STOP_BUTTON_BG": "#C53030",
+        "STOP_BUTTON_ACTIVE_BG": "#E53E3E",
+        "ACCENT_COLOR": "#2563EB",
+        "LINK_COLOR": "#1D4ED8",
+        "DEFAULT_BAR_COLOR": "#2D6DAF",
+        "SORTED_BAR_COLOR": "#2F9E44",
+        "RANGE_BAR_COLOR": "#D69E2E",
+        "HIGHLIGHT_BAR_COLOR": "#D6336C",
+        "SEARCH_RANGE_COLOR": "#8CB8E8",
+        "SEARCH_CURRENT_COLOR": "#E3B341",
+        "SEARCH_VISITED_COLOR": "#94A3B8",
+        "WARNING_COLOR": "#B7791F",
+        "ERROR_COLOR": "#C53030",
+        "PARTITION_COLORS": ("#7C3AED", "#EA580C", "#0891B2", "#DB2777"),
+    },
+}
+
+
+def sort_palette(theme):
+    """Colors indexed by bar state for sorts."""
+    return (
+        theme["DEFAULT_BAR_COLOR"],
+        theme["SORTED_BAR_COLOR"],
+        theme["RANGE_BAR_COLOR"],
+        theme["HIGHLIGHT_BAR_COLOR"],
+        theme["RANGE_BAR_COLOR"],
+        theme["SEARCH_VISITED_COLOR"],
+    ) + theme["PARTITION_COLORS"]
+
+
+def search_palette(theme):
+    """Colors indexed by bar state for searches."""
+    return (
+        theme["DEFAULT_BAR_COLOR"],
+        theme["SORTED_BAR_COLOR"],
+        theme["SEARCH_RANGE_COLOR"],
+        theme["SEARCH_CURRENT_COLOR"],
+        theme["SEARCH_CURRENT_COLOR"],
+        theme["SEARCH_VISITED_COLOR"],
+    ) + theme["PARTITION_COLORS"]
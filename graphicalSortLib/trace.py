@@ -0,0 +1,391 @@
+"""
+Headless trace recording in a compact binary format.
+
+A trace file starts with a struct-packed header followed by chunks. Every
+chunk has a fixed ``<BQII`` frame (type, first step, event count, payload
+size) and a payload that is zlib-compressed when the header says so:
+
+- ``CHUNK_ARRAY``: the initial array, packed with the ``array`` module.
+- ``CHUNK_EVENTS``: step events, delta + varint encoded. The delta state is
+  reset at the start of each chunk so chunks decode independently.
+- ``CHUNK_KEYFRAME``: the full array, bar states and highlight after
+  ``first step`` events, written periodically so a replay can seek without starting over.
+- ``CHUNK_END``: ``<Qqd`` total steps, search result and elapsed seconds.
+
+The recorder streams chunks to disk while the algorithm runs, so the trace
+never has to fit in memory. A trace cut off by a killed recorder still
+opens: the reader keeps every whole chunk before the cut and reports the
+trace as not ``complete``.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array as _array
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from .algorithms.events import MARK, WRITE, StepSink, drive
+from .registry import SORT, algorithm_info, load_steps
+
+MAGIC = b"GSTR"
+VERSION = 2
+_READABLE_VERSIONS = (1, 2)
+
+FLAG_ZLIB = 0x01
+
+KIND_SORT = 0
+KIND_SEARCH = 1
+
+CHUNK_ARRAY = 1
+CHUNK_EVENTS = 2
+CHUNK_END = 3
+CHUNK_KEYFRAME = 4
+
+NO_RESULT = -2
+
+_HEADER = struct.Struct("<4sBBBqH")
+_CHUNK = struct.Struct("<BQII")
+_END = struct.Struct("<Qqd")
+_KEYFRAME = struct.Struct("<Iqq")
+
+DEFAULT_CHUNK_EVENTS = 8192
+
+
+class TraceFormatError(ValueError):
+    """Raised when a file is not a readable trace."""
+
+
+def _put_varint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _get_varint(data, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _pack_values(values) -> bytes:
+    typecode = "i"
+    if values and (min(values) < -(2**31) or max(values) >= 2**31):
+        typecode = "q"
+    packed = _array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return typecode.encode("ascii") + packed.tobytes()
+
+
+def _unpack_values(payload: bytes) -> list[int]:
+    try:
+        values = _array(payload[:1].decode("ascii"))
+        values.frombytes(payload[1:])
+    except (UnicodeDecodeError, ValueError):
+        raise TraceFormatError("The trace holds a broken array.") from None
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def encode_events(events) -> bytes:
+    """Encode ``(kind, a, b, c)`` tuples exactly like an events chunk payload."""
+    encoder = _EventEncoder()
+    for event in events:
+        encoder.add(*event)
+    return bytes(encoder.buffer)
+
+
+def decode_events(payload) -> Iterator[tuple[int, int, int, int]]:
+    """Decode an events chunk payload back into ``(kind, a, b, c)`` tuples."""
+    pos = 0
+    end = len(payload)
+    last_index = 0
+    last_value = 0
+    while pos < end:
+        tag = payload[pos]
+        pos += 1
+        kind = tag & 0x03
+        delta, pos = _get_varint(payload, pos)
+        a = last_index + _unzigzag(delta)
+        last_index = a
+        second, pos = _get_varint(payload, pos)
+        if kind == WRITE:
+            last_value += _unzigzag(second)
+            yield kind, a, last_value, 0
+        elif kind == MARK:
+            yield kind, a, a + _unzigzag(second), tag >> 2
+        else:
+            yield kind, a, a + _unzigzag(second), 0
+
+
+class _EventEncoder:
+    __slots__ = ("buffer", "count", "last_index", "last_value")
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.reset()
+
+    def reset(self):
+        self.buffer.clear()
+        self.count = 0
+        self.last_index = 0
+        self.last_value = 0
+
+    def add(self, kind, a, b, c):
+        buf = self.buffer
+        buf.append(kind | (c << 2) if kind == MARK else kind)
+        _put_varint(buf, _zigzag(a - self.last_index))
+        self.last_index = a
+        if kind == WRITE:
+            _put_varint(buf, _zigzag(b - self.last_value))
+            self.last_value = b
+        else:
+            _put_varint(buf, _zigzag(b - a))
+        self.count += 1
+
+
+class TraceRecorder(StepSink):
+    """Step sink that streams every event of a run into a trace file."""
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        array,
+        name: str,
+        kind: int = KIND_SORT,
+        target: int = 0,
+        compress: bool = True,
+        chunk_events: int = DEFAULT_CHUNK_EVENTS,
+        keyframe_interval: Optional[int] = None,
+    ):
+        super().__init__(array)
+        self.stream = stream
+        self.compress = compress
+        self.chunk_events = max(1, chunk_events)
+        # A keyframe costs about as much as encoding len(array) events, so
+        # by default space them so they never dominate the file size.
+        if keyframe_interval is None:
+            keyframe_interval = max(self.chunk_events, len(array))
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.steps = 0
+        self._first_step = 0
+        self._last_keyframe = 0
+        self._encoder = _EventEncoder()
+        name_bytes = name.encode("utf-8")
+        flags = FLAG_ZLIB if compress else 0
+        stream.write(_HEADER.pack(MAGIC, VERSION, flags, kind, target, len(name_bytes)))
+        stream.write(name_bytes)
+        self._write_chunk(CHUNK_ARRAY, 0, len(array), _pack_values(array))
+
+    def _write_chunk(self, chunk_type, first_step, count, payload):
+        if self.compress:
+            payload = zlib.compress(payload, 6)
+        self.stream.write(_CHUNK.pack(chunk_type, first_step, count, len(payload)))
+        self.stream.write(payload)
+
+    def on_step(self, kind, a, b, c):
+        encoder = self._encoder
+        encoder.add(kind, a, b, c)
+        self.steps += 1
+        if encoder.count >= self.chunk_events:
+            self.flush()
+
+    def flush(self):
+        encoder = self._encoder
+        if encoder.count:
+            self._write_chunk(CHUNK_EVENTS, self._first_step, encoder.count, bytes(encoder.buffer))
+            self._first_step = self.steps
+            encoder.reset()
+            if self.steps - self._last_keyframe >= self.keyframe_interval:
+                self._write_keyframe()
+
+    def _write_keyframe(self):
+        values = _pack_values(self.array)
+        first, second = self.highlight or (-1, -1)
+        payload = _KEYFRAME.pack(len(values), first, second) + values + bytes(self.states)
+        self._write_chunk(CHUNK_KEYFRAME, self.steps, len(self.array), payload)
+        self._last_keyframe = self.steps
+
+    def close(self, result: int = NO_RESULT, elapsed: float = 0.0):
+        """Flush pending events and write the end chunk. The stream stays open."""
+        self.flush()
+        self._write_chunk(CHUNK_END, self.steps, 0, _END.pack(self.steps, result, elapsed))
+
+
+class TraceReader:
+    """Reads the header and chunk index of a trace file and decodes its events."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.chunks: list[tuple[int, int, int, int, int]] = []
+        self.event_chunks: list[tuple[int, int, int, int, int]] = []
+        self.keyframes: list[tuple[int, int, int, int, int]] = []
+        self.total_steps = 0
+        self.result = NO_RESULT
+        self.elapsed = 0.0
+        self.complete = False
+        with self.path.open("rb") as stream:
+            header = stream.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise TraceFormatError(f"{self.path} is too short to be a trace.")
+            magic, version, flags, kind, target, name_len = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise TraceFormatError(f"{self.path} is not a graphicalSortLib trace.")
+            if version not in _READABLE_VERSIONS:
+                raise TraceFormatError(f"Unsupported trace version {version}.")
+            self.compressed = bool(flags & FLAG_ZLIB)
+            self.kind = kind
+            self.target = target
+            name = stream.read(name_len)
+            try:
+                self.name = name.decode("utf-8")
+            except UnicodeDecodeError:
+                raise TraceFormatError(f"{self.path} has a broken algorithm name.") from None
+            if len(name) != name_len:
+                raise TraceFormatError(f"{self.path} is too short to be a trace.")
+            self._scan_chunks(stream, os.fstat(stream.fileno()).st_size)
+
+        if not self.chunks or self.chunks[0][0] != CHUNK_ARRAY:
+            raise TraceFormatError(f"{self.path} has no initial array.")
+        self.initial_array = _unpack_values(self._read_payload(self.chunks[0]))
+
+    def _scan_chunks(self, stream, file_size):
+        """Index the chunks up to the end chunk, or up to the first chunk cut off by the end of the file."""
+        while True:
+            frame = stream.read(_CHUNK.size)
+            if len(frame) < _CHUNK.size:
+                return
+            chunk_type, first_step, count, size = _CHUNK.unpack(frame)
+            offset = stream.tell()
+            if offset + size > file_size:
+                # The recorder was stopped while writing this chunk.
+                return
+            if chunk_type == CHUNK_END:
+                try:
+                    payload = stream.read(size)
+                    if self.compressed:
+                        payload = zlib.decompress(payload)
+                    self.total_steps, self.result, self.elapsed = _END.unpack(payload)
+                except (zlib.error, struct.error):
+                    raise TraceFormatError(f"{self.path} has a broken end chunk.") from None
+                self.complete = True
+                return
+            stream.seek(size, 1)
+            chunk = (chunk_type, first_step, count, offset, size)
+            self.chunks.append(chunk)
+            if chunk_type == CHUNK_EVENTS:
+                self.event_chunks.append(chunk)
+                self.total_steps = first_step + count
+            elif chunk_type in (CHUNK_ARRAY, CHUNK_KEYFRAME):
+                self.keyframes.append(chunk)
+
+    def _read_payload(self, chunk, stream=None):
+        _chunk_type, _first_step, _count, offset, size = chunk
+        if stream is None:
+            with self.path.open("rb") as handle:
+                handle.seek(offset)
+                payload = handle.read(size)
+        else:
+            stream.seek(offset)
+            payload = stream.read(size)
+        if len(payload) != size:
+            raise TraceFormatError(f"{self.path} was cut off inside a chunk.")
+        if self.compressed:
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error as exc:
+                raise TraceFormatError(f"{self.path} has a broken chunk: {exc}") from None
+        return payload
+
+    def __len__(self):
+        return len(self.initial_array)
+
+    def read_events(self, chunk) -> list[tuple[int, int, int, int]]:
+        return list(decode_events(self._read_payload(chunk)))
+
+    def read_keyframe(self, chunk) -> tuple[list[int], bytearray, tuple]:
+        """Return the array values, bar states and highlight stored in a keyframe chunk."""
+        payload = self._read_payload(chunk)
+        if chunk[0] == CHUNK_ARRAY:
+            return _unpack_values(payload), bytearray(chunk[2]), ()
+        try:
+            values_size, first, second = _KEYFRAME.unpack_from(payload)
+        except struct.error:
+            raise TraceFormatError(f"{self.path} has a broken keyframe.") from None
+        start = _KEYFRAME.size
+        values = _unpack_values(payload[start : start + values_size])
+        highlight = () if first == second == -1 else (first, second)
+        return values, bytearray(payload[start + values_size :]), highlight
+
+    def iter_events(self) -> Iterator[tuple[int, int, int, int]]:
+        with self.path.open("rb") as stream:
+            for chunk in self.chunks:
+                if chunk[0] == CHUNK_EVENTS:
+                    yield from decode_events(self._read_payload(chunk, stream))
+
+
+def record(
+    path,
+    algorithm_name: str,
+    array,
+    *,
+    target: Optional[int] = None,
+    compress: bool = True,
+    chunk_events: int = DEFAULT_CHUNK_EVENTS,
+    keyframe_interval: Optional[int] = None,
+) -> TraceReader:
+    """
+    Run a sort or search from the algorithm registry and record it.
+
+    ``array`` is copied before running. Returns a reader for the new trace.
+    """
+    values = list(array)
+    info = algorithm_info(algorithm_name)
+    if info.kind == SORT:
+        kind = KIND_SORT
+    else:
+        if target is None:
+            raise ValueError(f"{algorithm_name} needs a search target.")
+        kind = KIND_SEARCH
+
+    with Path(path).open("wb") as stream:
+        recorder = TraceRecorder(
+            stream,
+            values,
+            algorithm_name,
+            kind=kind,
+            target=target or 0,
+            compress=compress,
+            chunk_events=chunk_events,
+            keyframe_interval=keyframe_interval,
+        )
+        started = time.perf_counter()
+        result = NO_RESULT
+        make_steps = load_steps(algorithm_name)
+        if kind == KIND_SORT:
+            drive(make_steps(values), recorder)
+        else:
+            result = drive(make_steps(values, target), recorder)
+        recorder.close(result=result, elapsed=time.perf_counter() - started)
+    return TraceReader(path)
@@ -1,17 +1,190 @@
-import matplotlib.pyplot as plt
-import time
+"""
+Matplotlib bar chart backend for the algorithm callbacks.
+
+A ``Visualizer`` is called like any algorithm callback,
+``visualizer(array, colors)``, so it can be passed straight to the
+algorithm functions:
+
+    from graphicalSortLib.algorithms.quick_sort import quick_sort
+    from graphicalSortLib.visualizer import Visualizer
+
+    quick_sort(values, Visualizer(values, delay=0.01))
+
+The bars are animated artists drawn with blitting. The axes, ticks and
+labels are rendered once into a cached background. After that, an update
+only touches the bars whose height or color changed: it restores the
+background behind their columns, draws those bars again and blits the
+columns. A full redraw only happens when the window is resized or a value
+leaves the y range.
+
+With ``interactive=False`` the figure is rendered by Agg, with no window
+and no pyplot, for batch rendering; ``frame()`` returns the pixels and
+``save(path)`` writes them to an image file.
+"""
+
+import math
+
+DEFAULT_COLOR = "blue"
+# Above this share of changed bars one full blit is cheaper than one per column.
+_FULL_BLIT_SHARE = 0.25
+
 
 class Visualizer:
-    def __init__(self, array, delay=0.1):
+    def __init__(self, array, delay=0.1, *, interactive=True, color=DEFAULT_COLOR, title=None, figsize=None):
+        # matplotlib is slow to import and not needed by the rest of the package.
+        if interactive:
+            import matplotlib.pyplot as plt
+
+            self.plt = plt
+            self.fig, self.ax = plt.subplots(figsize=figsize)
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self.plt = None
+            self.fig = Figure(figsize=figsize)
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
+        self.interactive = interactive
         self.array = array
         self.delay = delay
-        self.fig, self.ax = plt.subplots()
-        self.bars = self.ax.bar(range(len(array)), array, color="blue")
-        plt.ion()
-        plt.show()
-
-    def update(self, array):
-        for bar, height in zip(self.bars, array):
-            bar.set_height(height)
+        self.color = color
+        self.frames = 0
+        if title:
+            self.ax.set_title(title)
+        self._background = None
+        self._build_bars(array)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+        if interactive:
+            self.plt.ion()
+            self.plt.show(block=False)
         self.fig.canvas.draw()
-        plt.pause(self.delay)
+
+    def __call__(self, array, colors=None):
+        self.update(array, colors)
+
+    def _build_bars(self, array):
+        if getattr(self, "bars", None) is not None:
+            self.bars.remove()
+        self._heights = list(array)
+        self._colors = [self.color] * len(self._heights)
+        self.bars = self.ax.bar(range(len(self._heights)), self._heights, color=self.color, animated=True)
+        self._half_width = self.bars[0].get_width() / 2 if self._heights else 0.4
+        self.ax.set_xlim(-0.5, max(len(self._heights), 1) - 0.5)
+        self._set_value_range(self._heights)
+
+    def _set_value_range(self, heights):
+        low = min(0, min(heights, default=0))
+        high = max(1, max(heights, default=1))
+        self.ax.set_ylim(low, high * 1.05)
+
+    def _on_draw(self, _event):
+        """A full draw (first show, resize, rescale): cache the background without bars, then blit the bars."""
+        canvas = self.fig.canvas
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+        canvas.blit(self.fig.bbox)
+
+    def update(self, array, colors=None):
+        """
+        Show ``array`` with one color per bar (``colors`` is ``None`` to keep
+        the current ones) and wait ``delay`` seconds.
+        """
+        self.array = array
+        if len(array) != len(self._heights):
+            self._build_bars(array)
+            self.fig.canvas.draw()
+        else:
+            changed = [
+                index
+                for index, height in enumerate(array)
+                if height != self._heights[index] or (colors is not None and colors[index] != self._colors[index])
+            ]
+            if changed:
+                self._apply(array, colors, changed)
+        self.frames += 1
+        self._wait()
+
+    def _apply(self, array, colors, changed):
+        from matplotlib.transforms import Bbox
+
+        for index in changed:
+            self.bars[index].set_height(array[index])
+            self._heights[index] = array[index]
+            if colors is not None:
+                self.bars[index].set_facecolor(colors[index])
+                self._colors[index] = colors[index]
+
+        low, high = self.ax.get_ylim()
+        if any(not low <= array[index] <= high for index in changed):
+            self._set_value_range(array)
+            # New tick labels: the draw event caches a new background and draws the bars.
+            self.fig.canvas.draw()
+            return
+
+        canvas = self.fig.canvas
+        ax_box = self.ax.bbox
+        figure_height = self.fig.bbox.height
+        if len(changed) > len(self.bars) * _FULL_BLIT_SHARE:
+            canvas.restore_region(self._background)
+            for bar in self.bars:
+                self.ax.draw_artist(bar)
+            canvas.blit(ax_box)
+            return
+
+        # Merge the changed bars' pixel columns into disjoint spans; restore_region counts rows from the top.
+        spans = []
+        for index in changed:
+            x0, _y0, x1, _y1 = self.bars[index].get_window_extent().extents
+            left = max(math.floor(x0) - 1, math.floor(ax_box.x0))
+            right = min(math.ceil(x1) + 1, math.ceil(ax_box.x1))
+            if spans and left <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], right)
+            else:
+                spans.append([left, right])
+        top = math.floor(figure_height - ax_box.y1)
+        bottom = math.ceil(figure_height - ax_box.y0)
+        to_data = self.ax.transData.inverted()
+        last = len(self.bars) - 1
+        for left, right in spans:
+            # restore_region includes the box's right and bottom pixels; the clip box below does not.
+            canvas.restore_region(self._background, bbox=(left, top, right - 1, bottom - 1), xy=(0, 0))
+            # Narrow bars can share pixels with their neighbours, so redraw every bar the span touches,
+            # clipped to the span so their anti-aliased edges outside it are not blended twice.
+            span_box = Bbox.from_extents(left, figure_height - bottom, right, figure_height - top)
+            (data_left, _), (data_right, _) = to_data.transform([(left, 0), (right, 0)])
+            # One extra bar on each side covers rounding at the span's edge pixels.
+            first = max(0, math.ceil(data_left - self._half_width) - 1)
+            for index in range(first, min(last, math.floor(data_right + self._half_width) + 1) + 1):
+                bar = self.bars[index]
+                bar.set_clip_box(span_box)
+                self.ax.draw_artist(bar)
+                bar.set_clip_box(ax_box)
+        canvas.blit(Bbox.from_extents(spans[0][0], figure_height - bottom, spans[-1][1], figure_height - top))
+
+    def _wait(self):
+        if not self.interactive:
+            return
+        canvas = self.fig.canvas
+        if self.delay > 0:
+            # Runs the GUI event loop like plt.pause, without plt.pause's full redraw.
+            canvas.start_event_loop(self.delay)
+        else:
+            canvas.flush_events()
+
+    def frame(self):
+        """The current image as an ``(height, width, 4)`` RGBA array."""
+        import numpy as np
+
+        return np.asarray(self.fig.canvas.buffer_rgba()).copy()
+
+    def save(self, path):
+        """Write the current image to ``path``; the format follows its suffix."""
+        from matplotlib.image import imsave
+
+        imsave(path, self.frame())
+
+    def close(self):
+        if self.plt is not None:
+            self.plt.close(self.fig)
@@ -0,0 +1,236 @@
+"""
+Running step generators in worker processes.
+
+A ``StreamDriver`` looks like ``StepDriver`` to the app, but the algorithm
+runs in a ``ProcessPoolExecutor`` worker and never competes with the Tk
+event loop for the GIL. The worker packs its steps into flat ``array('i')``
+batches (``'q'`` when a value does not fit) and puts them on a bounded
+manager queue; the driver unpacks batches and applies them to the GUI's
+copy of the array as the render loop asks for steps. Unpacking is a zip
+over the array, several times cheaper than decoding the trace file's
+varint encoding, which matters because it runs in the GUI process.
+
+The queue bound lets a worker run up to ``MAX_PENDING_BATCHES`` batches
+ahead, so several algorithms (a race) are precomputed in parallel on
+separate cores while playback catches up.
+
+``make_steps`` is pickled into the worker, so it must be a module-level
+step generator or a ``functools.partial`` of one.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from .algorithms.events import AUX, COMPARE, SWAP, WRITE, StepSink
+
+DEFAULT_BATCH_EVENTS = 8192
+# At 16 bytes per step this keeps at most about 8 MB per stream in flight.
+MAX_PENDING_BATCHES = 64
+
+# How often a worker blocked on a full queue checks whether it was cancelled.
+_PUT_POLL_S = 0.1
+
+
+class WorkerPool:
+    """
+    A process pool plus the manager that carries step batches back.
+
+    Both are started on first use; ``shutdown`` cancels every stream that is
+    still running so no worker stays blocked on a full queue.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor = None
+        self._manager = None
+        self._streams = []
+
+    def stream(self, make_steps, values, sink: StepSink, batch_events: int = DEFAULT_BATCH_EVENTS) -> "StreamDriver":
+        """Start ``make_steps(copy of values)`` in a worker and return a driver that applies its steps to ``sink``."""
+        if self._executor is None:
+            self._manager = multiprocessing.Manager()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._streams = [stream for stream in self._streams if not stream.finished]
+        steps_queue = self._manager.Queue(MAX_PENDING_BATCHES)
+        cancel = self._manager.Event()
+        future = self._executor.submit(_stream_steps, make_steps, values[:], steps_queue, cancel, batch_events)
+        stream = StreamDriver(sink, future, steps_queue, cancel)
+        self._streams.append(stream)
+        return stream
+
+    def shutdown(self):
+        for stream in self._streams:
+            stream.close()
+        self._streams = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = None
+            self._manager = None
+
+
+class StreamDriver:
+    """
+    Applies the steps streamed back by a worker to a sink.
+
+    Has the ``done``/``result``/``steps``/``advance``/``close`` interface of
+    ``StepDriver``. ``advance`` stops early when the worker has not sent the
+    next batch yet. Once the worker has finished, ``total`` is its exact
+    step count and ``elapsed`` the time it spent computing.
+    """
+
+    # The deadline is checked once per this many steps.
+    DEADLINE_STRIDE = 256
+
+    def __init__(self, sink: StepSink, future, steps_queue, cancel):
+        self.sink = sink
+        self.result = None
+        self.done = False
+        self.steps = 0
+        self._future = future
+        self._queue = steps_queue
+        self._cancel = cancel
+        self._events = []
+        self._position = 0
+
+    @property
+    def finished(self):
+        """Whether the worker is done, even if its steps were not all applied yet."""
+        return self._future.done()
+
+    @property
+    def total(self):
+        if not self._future.done() or self._future.cancelled() or self._future.exception() is not None:
+            return None
+        return self._future.result()[1]
+
+    @property
+    def elapsed(self):
+        if not self._future.done() or self._future.cancelled() or self._future.exception() is not None:
+            return None
+        return self._future.result()[2]
+
+    def _next_batch(self):
+        """Load the next batch; returns False when none has arrived yet."""
+        try:
+            message = self._queue.get_nowait()
+        except queue.Empty:
+            if self._future.done():
+                # Re-raise a worker error instead of waiting forever.
+                self._future.result()
+            return False
+        if message is None:
+            self.result = self._future.result()[0]
+            self.done = True
+            return False
+        packed, aux_reads, aux_writes, aux_steps = message
+        flat = iter(packed)
+        self._events = list(zip(flat, flat, flat, flat))
+        self._position = 0
+        self.sink.aux(aux_reads, aux_writes)
+        self.steps += aux_steps
+        return True
+
+    def advance(self, limit: Optional[int] = None, deadline: Optional[float] = None) -> int:
+        """Apply up to ``limit`` streamed steps and return how many were applied."""
+        sink = self.sink
+        values = sink.array
+        compare, swap, write, mark = sink.compare, sink.swap, sink.write, sink.mark
+        taken = 0
+        while not self.done and (limit is None or taken < limit):
+            if self._position >= len(self._events) and not self._next_batch():
+                break
+            batch = self.DEADLINE_STRIDE if deadline is not None else len(self._events)
+            if limit is not None:
+                batch = min(batch, limit - taken)
+            start = self._position
+            stop = min(len(self._events), start + batch)
+            for kind, a, b, c in self._events[start:stop]:
+                if kind == COMPARE:
+                    compare(a, b)
+                elif kind == SWAP:
+                    values[a], values[b] = values[b], values[a]
+                    swap(a, b)
+                elif kind == WRITE:
+                    values[a] = b
+                    write(a, b)
+                else:
+                    mark(a, b, c)
+            self._position = stop
+            taken += stop - start
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self.steps += taken
+        return taken
+
+    def close(self):
+        """Stop the worker; steps already applied stay applied."""
+        if not self._future.done():
+            self._future.cancel()
+            try:
+                self._cancel.set()
+            except (OSError, EOFError):
+                # The manager is already gone, so the worker's next put fails anyway.
+                pass
+
+
+def _pack(batch):
+    flat = [value for event in batch for value in event]
+    try:
+        return array("i", flat)
+    except OverflowError:
+        return array("q", flat)
+
+
+def _stream_steps(make_steps, values, steps_queue, cancel, batch_events):
+    """Worker: run the generator and put packed batches on ``steps_queue``; returns (result, steps, elapsed)."""
+    batch = []
+    append = batch.append
+    steps = 0
+    aux_reads = aux_writes = aux_steps = 0
+    waited = 0.0
+    outcome = []
+
+    def capture():
+        outcome.append((yield from make_steps(values)))
+
+    def put(message):
+        nonlocal waited
+        started = time.perf_counter()
+        while True:
+            if cancel.is_set():
+                return False
+            try:
+                steps_queue.put(message, timeout=_PUT_POLL_S)
+                break
+            except queue.Full:
+                pass
+        waited += time.perf_counter() - started
+        return True
+
+    started = time.perf_counter()
+    for kind, a, b, c in capture():
+        steps += 1
+        if kind == AUX:
+            # AUX steps are only counted on the GUI side, so only their totals travel.
+            aux_reads += a
+            aux_writes += b
+            aux_steps += 1
+            continue
+        append((kind, a, b, c))
+        if len(batch) >= batch_events:
+            if not put((_pack(batch), aux_reads, aux_writes, aux_steps)):
+                return None, steps, time.perf_counter() - started - waited
+            batch.clear()
+            aux_reads = aux_writes = aux_steps = 0
+    if batch or aux_steps:
+        put((_pack(batch), aux_reads, aux_writes, aux_steps))
+    elapsed = time.perf_counter() - started - waited
+    put(None)
+    return outcome[0], steps, elapsed
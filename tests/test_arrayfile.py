@@ -0,0 +1,89 @@
+import struct
+from array import array
+
+import pytest
+
+from graphicalSortLib.arrayfile import SUFFIX_FORMATS, ArrayFileError, load_array, open_array, save_array
+
+VALUES = [5, -3, 0, 2**31 - 1, -(2**31), 17]
+
+
+@pytest.mark.parametrize("suffix", sorted(SUFFIX_FORMATS))
+def test_round_trip(tmp_path, suffix):
+    path = tmp_path / f"values{suffix}"
+    save_array(path, VALUES)
+    loaded = load_array(path)
+    assert list(loaded) == VALUES
+    assert isinstance(loaded, array)
+    with open_array(path) as source:
+        preview = source.preview(3)
+    if source.length is not None:
+        assert preview == [VALUES[0], VALUES[2], VALUES[4]]
+    else:
+        # Text previews sample byte offsets, so only the first value is certain.
+        assert preview[0] == VALUES[0] and set(preview) <= set(VALUES)
+
+
+@pytest.mark.parametrize("suffix", sorted(SUFFIX_FORMATS))
+def test_round_trip_empty(tmp_path, suffix):
+    path = tmp_path / f"empty{suffix}"
+    save_array(path, [])
+    assert list(load_array(path)) == []
+
+
+def test_int64_values_do_not_fit_int32(tmp_path):
+    big = [2**40, -1]
+    save_array(tmp_path / "big.i64", big)
+    assert list(load_array(tmp_path / "big.i64")) == big
+    with pytest.raises(ArrayFileError):
+        save_array(tmp_path / "big.i32", big)
+
+
+def test_csv_header_and_commas(tmp_path):
+    path = tmp_path / "values.csv"
+    path.write_text("value,other\n1,2\n3, 4\n")
+    assert list(load_array(path)) == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("token", ["--5", "+-5", "1.5", "x", "٣"])
+def test_bad_token_is_reported(tmp_path, token):
+    path = tmp_path / "values.txt"
+    path.write_text(f"1 2 {token} 4\n", encoding="utf-8")
+    with pytest.raises(ArrayFileError, match="is not an integer"):
+        load_array(path)
+
+
+def _npy(descr, shape, payload, fortran_order=False):
+    header = repr({"descr": descr, "fortran_order": fortran_order, "shape": shape}).encode("latin1")
+    header += b" " * (-(10 + len(header) + 1) % 64) + b"\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header + payload
+
+
+def test_npy_dtypes_and_byte_order(tmp_path):
+    path = tmp_path / "values.npy"
+    path.write_bytes(_npy(">i2", (3,), struct.pack(">3h", 1, -2, 300)))
+    assert list(load_array(path)) == [1, -2, 300]
+    path.write_bytes(_npy("|u1", (2, 2), bytes([1, 2, 3, 250]), fortran_order=True))
+    assert list(load_array(path)) == [1, 2, 3, 250]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        _npy("<f8", (1,), struct.pack("<d", 1.0)),
+        _npy("<i4", (4,), struct.pack("<3i", 1, 2, 3)),
+        b"not a npy file",
+    ],
+)
+def test_npy_errors(tmp_path, data):
+    path = tmp_path / "values.npy"
+    path.write_bytes(data)
+    with pytest.raises(ArrayFileError):
+        load_array(path)
+
+
+def test_binary_partial_value(tmp_path):
+    path = tmp_path / "values.i32"
+    path.write_bytes(b"\x01\x00\x00")
+    with pytest.raises(ArrayFileError):
+        open_array(path)
@@ -0,0 +1,30 @@
+import pytest
+
+from graphicalSortLib.bench import DISTRIBUTIONS, generate_input, run_matrix
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+@pytest.mark.parametrize("size", [0, 1, 2, 50])
+def test_generate_input_sizes(distribution, size):
+    values = generate_input(size, distribution, seed=3)
+    assert len(values) == size
+    assert generate_input(size, distribution, seed=3) == values
+
+
+def test_nearly_sorted_is_a_permutation():
+    values = generate_input(1000, "nearly_sorted", seed=1)
+    assert sorted(values) == list(range(1, 1001))
+    assert values != sorted(values)
+
+
+@pytest.mark.parametrize("size", [0, 1, 50])
+def test_matrix_edge_sizes(size):
+    rows = run_matrix(
+        ["Quick Sort", "Merge Sort", "Binary Search"],
+        [size],
+        DISTRIBUTIONS,
+        warmup=0,
+        repeat=1,
+    )
+    assert len(rows) == 3 * len(DISTRIBUTIONS)
+    assert {row["status"] for row in rows} == {"ok"}
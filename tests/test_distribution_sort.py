@@ -0,0 +1,85 @@
+import random
+from array import array
+
+import pytest
+
+from graphicalSortLib.algorithms.distribution_sort import MAX_COUNTING_RANGE, counting_sort_steps, radix_msd_sort_steps
+from graphicalSortLib.core import sort, sort_vectorized
+
+DISTRIBUTION_SORTS = ["Counting Sort", "LSD Radix Sort", "MSD Radix Sort", "Bucket Sort"]
+
+
+def _inputs():
+    rng = random.Random(19)
+    return {
+        "empty": [],
+        "single": [7],
+        "random": [rng.randrange(1000) for _ in range(300)],
+        "negative": [rng.randrange(-500, 500) for _ in range(300)],
+        "duplicates": [rng.choice([3, 3, 8, -2]) for _ in range(100)],
+        "sorted": list(range(50)),
+        "reversed": list(range(50, 0, -1)),
+        "wide": [rng.randrange(-(10**12), 10**12) for _ in range(50)],
+    }
+
+
+@pytest.mark.parametrize("name", DISTRIBUTION_SORTS)
+@pytest.mark.parametrize("case", sorted(_inputs()))
+def test_sorts(name, case):
+    values = _inputs()[case]
+    if name == "Counting Sort" and case == "wide":
+        pytest.skip("range above MAX_COUNTING_RANGE")
+    stats = sort(list(values), name)
+    assert list(stats.values) == sorted(values)
+    assert stats.comparisons == 0 or name == "Bucket Sort"
+
+
+@pytest.mark.parametrize("name", DISTRIBUTION_SORTS)
+def test_sorts_array_in_place(name):
+    values = array("i", [5, -1, 3, 3, 0])
+    assert sort(values, name).values is values
+    assert values.tolist() == [-1, 0, 3, 3, 5]
+
+
+def test_counting_sort_rejects_wide_range():
+    with pytest.raises(ValueError, match="radix sort"):
+        counting_sort_steps([0, MAX_COUNTING_RANGE])
+
+
+def test_radix_bases():
+    values = [random.Random(k).randrange(10**6) for k in range(200)]
+    for radix in (2, 16, 256):
+        data = list(values)
+        for _step in radix_msd_sort_steps(data, radix):
+            pass
+        assert data == sorted(values)
+
+
+@pytest.mark.parametrize("name", ["Counting Sort", "LSD Radix Sort"])
+def test_vectorized(name):
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(19)
+    for data in (
+        rng.integers(-1000, 1000, 5000),
+        rng.integers(0, 200, 5000).astype(np.uint8),
+        np.array([], dtype=np.int64),
+        np.array([4]),
+        [3, -1, 2],
+    ):
+        stats = sort_vectorized(data, name)
+        assert stats.values.tolist() == sorted(np.asarray(data).tolist())
+        assert stats.values.dtype == np.asarray(data).dtype
+
+
+def test_vectorized_radix_wide_values():
+    np = pytest.importorskip("numpy")
+    data = np.random.default_rng(1).integers(-(2**40), 2**40, 2000)
+    assert np.array_equal(sort_vectorized(data, "LSD Radix Sort").values, np.sort(data))
+
+
+def test_vectorized_errors():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        sort_vectorized([0, MAX_COUNTING_RANGE], "Counting Sort")
+    with pytest.raises(ValueError):
+        sort_vectorized([1, 2], "Bucket Sort")
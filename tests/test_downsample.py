@@ -0,0 +1,53 @@
+import random
+from array import array
+
+import pytest
+
+from graphicalSortLib import downsample as downsample_module
+from graphicalSortLib.algorithms.events import STATE_COUNT, STATE_CURRENT, STATE_PIVOT
+from graphicalSortLib.downsample import bucket_size, display_bars, downsample
+
+
+@pytest.mark.parametrize(
+    "length, max_samples, expected",
+    [(10, None, 1), (10, 0, 1), (10, 10, 1), (11, 10, 2), (10_000, 800, 13)],
+)
+def test_bucket_size(length, max_samples, expected):
+    assert bucket_size(length, max_samples) == expected
+
+
+def test_no_downsampling_returns_inputs():
+    values = [3, 1, 2]
+    states = bytes(3)
+    assert downsample(values, states, 5, STATE_COUNT) == (values, values, states)
+
+
+def test_python_buckets():
+    values = [1, 5, 2, 8, 3, 0, 7]
+    states = bytes([0, 0, 2, 2, 1, 0, 0])
+    maxima, minima, dominant = downsample(values, states, 3, STATE_COUNT)
+    assert maxima == [5, 8, 7]
+    assert minima == [1, 0, 7]
+    # Ties go to the lower state.
+    assert dominant == bytes([2, 1, 0])
+
+
+@pytest.mark.parametrize("length, max_samples", [(5000, 800), (10_007, 333), (100_000, 1920), (4096, 4095)])
+def test_numpy_matches_python(length, max_samples):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(length)
+    values = array("i", (rng.randrange(-1000, 1000) for _ in range(length)))
+    states = bytes(rng.choice([0, 0, 0, 1, 2, 5, 7]) for _ in range(length))
+    chunk = bucket_size(length, max_samples)
+    python = downsample_module._downsample_python(values, states, chunk, STATE_COUNT)
+    assert downsample(values, states, max_samples, STATE_COUNT) == python
+    assert downsample_module._downsample_numpy(np.asarray(values), states, chunk, STATE_COUNT) == python
+
+
+def test_highlight_colors_whole_bucket():
+    values = list(range(100))
+    states = bytearray(100)
+    _maxima, _minima, shown, chunk = display_bars(values, states, (42, 7), 10, STATE_COUNT)
+    assert chunk == 10
+    assert shown[4] == STATE_CURRENT and shown[0] == STATE_PIVOT
+    assert states == bytearray(100)
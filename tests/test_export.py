@@ -0,0 +1,133 @@
+import random
+import struct
+import zlib
+
+import pytest
+
+from graphicalSortLib.export import _PNG_SIGNATURE, _delays, _lzw_encode, export_run
+
+
+def _lzw_decode(data, min_code_size):
+    """Reference GIF LZW decoder, written from the GIF89a specification."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    bits = int.from_bytes(data, "little")
+    available = len(data) * 8
+    position = 0
+    code_size = min_code_size + 1
+    table = [bytes((index,)) for index in range(clear)] + [b"", b""]
+    out = bytearray()
+    previous = None
+    while position + code_size <= available:
+        code = (bits >> position) & ((1 << code_size) - 1)
+        position += code_size
+        if code == clear:
+            table = table[:clear + 2]
+            code_size = min_code_size + 1
+            previous = None
+            continue
+        if code == end:
+            return bytes(out)
+        if code < len(table):
+            entry = table[code]
+            if previous is not None:
+                table.append(previous + entry[:1])
+        else:
+            assert code == len(table) and previous is not None, "code out of range"
+            entry = previous + previous[:1]
+            table.append(entry)
+        out += entry
+        previous = entry
+        if len(table) == 1 << code_size and code_size < 12:
+            code_size += 1
+    raise AssertionError("no end code")
+
+
+@pytest.mark.parametrize("min_code_size", [2, 4, 8])
+@pytest.mark.parametrize("length", [0, 1, 2, 300, 20_000])
+def test_lzw_round_trip(min_code_size, length):
+    rng = random.Random(length * 31 + min_code_size)
+    colors = 1 << min_code_size
+    # Runs and noise: long runs grow the table slowly, noise fills it up and forces clear codes.
+    pixels = bytearray()
+    while len(pixels) < length:
+        pixels += bytes((rng.randrange(colors),)) * rng.choice((1, 1, 3, 40))
+    pixels = bytes(pixels[:length])
+    assert _lzw_decode(_lzw_encode(pixels, min_code_size), min_code_size) == pixels
+
+
+def _png_chunks(data):
+    assert data.startswith(_PNG_SIGNATURE)
+    position = len(_PNG_SIGNATURE)
+    chunks = []
+    while position < len(data):
+        (length,) = struct.unpack_from(">I", data, position)
+        kind = data[position + 4:position + 8]
+        body = data[position + 8:position + 8 + length]
+        (crc,) = struct.unpack_from(">I", data, position + 8 + length)
+        assert crc == zlib.crc32(kind + body), f"bad CRC in {kind!r}"
+        chunks.append((kind, body))
+        position += 12 + length
+    assert position == len(data)
+    return chunks
+
+
+def test_apng_chunks_and_frame_count(tmp_path):
+    values = list(range(40, 0, -1))
+    result = export_run(tmp_path / "run.png", "Insertion Sort", values, width=64, height=32, frames=20, workers=1)
+    chunks = _png_chunks((tmp_path / "run.png").read_bytes())
+    kinds = [kind for kind, _ in chunks]
+    assert kinds[:3] == [b"IHDR", b"PLTE", b"acTL"] and kinds[-1] == b"IEND"
+    (frame_count, plays) = struct.unpack(">II", chunks[2][1])
+    assert frame_count == result.frames == kinds.count(b"fcTL")
+    assert 2 <= frame_count <= 20 and plays == 0
+    sequence = [struct.unpack_from(">I", body)[0] for kind, body in chunks if kind in (b"fcTL", b"fdAT")]
+    assert sequence == list(range(len(sequence)))
+
+
+def test_gif_frames_decode(tmp_path):
+    values = list(range(30, 0, -1))
+    result = export_run(tmp_path / "run.gif", "Bubble Sort", values, width=48, height=24, frames=12, workers=1)
+    data = (tmp_path / "run.gif").read_bytes()
+    assert data.startswith(b"GIF89a") and data.endswith(b"\x3b")
+    (flags,) = struct.unpack_from("<B", data, 10)
+    position = 13 + 3 * (1 << ((flags & 7) + 1))
+    frames = 0
+    while data[position] != 0x3B:
+        if data[position] == 0x21:
+            # Extension: label, then sub-blocks.
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+            continue
+        assert data[position] == 0x2C
+        _x, _y, width, height, _flags = struct.unpack_from("<HHHHB", data, position + 1)
+        min_code_size = data[position + 10]
+        position += 11
+        codes = bytearray()
+        while data[position]:
+            codes += data[position + 1:position + 1 + data[position]]
+            position += data[position] + 1
+        position += 1
+        assert len(_lzw_decode(bytes(codes), min_code_size)) == width * height
+        frames += 1
+    assert frames == result.frames
+
+
+def test_delays_round_cumulatively():
+    assert _delays([1 / 3] * 3, 10) == [3, 4, 3]
+    assert _delays([0.002] * 5, 100) == [0, 0, 1, 0, 0]
+    assert _delays([0.002] * 5, 100, minimum=1) == [1] * 5
+    assert sum(_delays([1 / 30] * 30, 1000)) == 1000
+
+
+def test_gif_delays_are_never_zero(tmp_path):
+    export_run(tmp_path / "fast.gif", "Bubble Sort", list(range(20, 0, -1)), width=32, height=16, fps=400, workers=1)
+    data = (tmp_path / "fast.gif").read_bytes()
+    delays = []
+    position = data.find(b"\x21\xf9\x04")
+    while position >= 0:
+        delays.append(struct.unpack_from("<H", data, position + 4)[0])
+        position = data.find(b"\x21\xf9\x04", position + 8)
+    assert delays and min(delays) >= 1
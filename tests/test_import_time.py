@@ -0,0 +1,40 @@
+"""The headless API must import quickly and without the GUI stack."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Best of several cold interpreters; about 12 ms on a laptop, so this catches a second heavy import.
+IMPORT_BUDGET_S = 0.030
+RUNS = 3
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import graphicalSortLib.core
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _cold_import():
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_core_import_skips_heavy_modules():
+    modules = set(_cold_import()["modules"])
+    for heavy in ("tkinter", "matplotlib", "numpy", "cProfile", "tracemalloc"):
+        assert heavy not in modules, f"import graphicalSortLib.core loaded {heavy}"
+
+
+def test_core_import_time_within_budget():
+    elapsed = min(_cold_import()["elapsed"] for _ in range(RUNS))
+    assert elapsed <= IMPORT_BUDGET_S, f"import graphicalSortLib.core took {elapsed * 1000:.1f} ms"
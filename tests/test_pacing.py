@@ -0,0 +1,90 @@
+import pytest
+
+from graphicalSortLib.pacing import DEFAULT_FPS, PacingController
+
+
+def _run(pacing, total, render_seconds=0.002):
+    """Simulate frames until ``total`` steps are done; returns the simulated end time."""
+    now = 0.0
+    done = 0
+    frames = 0
+    while done < total:
+        done = min(total, done + pacing.skip)
+        now += pacing.interval
+        pacing.frame_done(done, render_seconds, now)
+        frames += 1
+        assert frames < 1_000_000
+    return now
+
+
+def test_unpaced_keeps_the_frame_rate():
+    pacing = PacingController()
+    assert not pacing.paced
+    pacing.begin(0, False, now=0.0)
+    now = 0.0
+    for frame in range(1, 50):
+        now += 1.0 / DEFAULT_FPS
+        pacing.frame_done(frame * 10_000, 0.001, now)
+    assert pacing.interval == pytest.approx(1.0 / DEFAULT_FPS)
+    # 10,000 steps per frame at 60 FPS.
+    assert pacing.skip == pytest.approx(10_000, rel=0.05)
+
+
+def test_slow_rendering_lowers_the_frame_rate():
+    pacing = PacingController()
+    pacing.begin(0, False, now=0.0)
+    for frame in range(1, 50):
+        pacing.frame_done(frame, 0.05, frame * 0.05)
+    assert pacing.interval == pytest.approx(0.05, rel=0.01)
+
+
+@pytest.mark.parametrize("total", [30, 5_000, 2_000_000])
+def test_duration_is_met(total):
+    pacing = PacingController(duration=2.0)
+    pacing.begin(total, True, now=0.0)
+    assert _run(pacing, total) == pytest.approx(2.0, abs=0.1)
+
+
+def test_fewer_steps_than_frames_spaces_them_out():
+    pacing = PacingController(duration=3.0)
+    pacing.begin(10, True, now=0.0)
+    assert pacing.skip == 1
+    assert pacing.interval == pytest.approx(0.3)
+
+
+def test_delay_spreads_over_capacity():
+    pacing = PacingController(delay=0.01, capacity=200)
+    pacing.begin(100_000, True, now=0.0)
+    assert pacing.target_duration() == pytest.approx(2.0)
+    assert _run(pacing, 100_000) == pytest.approx(2.0, abs=0.1)
+
+
+def test_lower_bound_total_is_raised():
+    pacing = PacingController(duration=1.0)
+    pacing.begin(100, False, now=0.0)
+    pacing.frame_done(100, 0.001, 0.5)
+    assert pacing.total == 200
+    pacing.settle(150)
+    assert pacing.total == 150 and pacing.exact_total
+
+
+def test_fallback_total_until_the_probe_is_done():
+    pacing = PacingController(duration=1.0, fallback_total=1000)
+    pacing.begin(10, False, now=0.0)
+    assert pacing.total == 1000
+    pacing.begin(10, True, now=0.0)
+    assert pacing.total == 10
+
+
+def test_shift_excludes_paused_time():
+    paused = PacingController(duration=2.0)
+    paused.begin(10_000, True, now=0.0)
+    paused.frame_done(5_000, 0.001, 1.0)
+    paused.shift(5.0)
+    paused.frame_done(5_100, 0.001, 6.0 + 1 / 60)
+
+    running = PacingController(duration=2.0)
+    running.begin(10_000, True, now=0.0)
+    running.frame_done(5_000, 0.001, 1.0)
+    running.frame_done(5_100, 0.001, 1.0 + 1 / 60)
+    assert (paused.skip, paused.interval) == (running.skip, running.interval)
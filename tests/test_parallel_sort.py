@@ -0,0 +1,58 @@
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from graphicalSortLib.algorithms.parallel_sort import MIN_PARALLEL_SIZE
+from graphicalSortLib.core import sort, sort_parallel
+
+PARALLEL_SORTS = ["Parallel Merge Sort", "Parallel Sample Sort"]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def _values(n, seed=20):
+    rng = random.Random(seed)
+    return [rng.randrange(-(10**9), 10**9) for _ in range(n)]
+
+
+@pytest.mark.parametrize("name", PARALLEL_SORTS)
+@pytest.mark.parametrize("workers", [2, 3, 5])
+def test_multicore_with_executor(executor, name, workers):
+    values = _values(MIN_PARALLEL_SIZE + 1000)
+    data = array("i", values)
+    stats = sort_parallel(data, name, workers=workers, executor=executor)
+    assert stats.values is data
+    assert data.tolist() == sorted(values)
+
+
+@pytest.mark.parametrize("name", PARALLEL_SORTS)
+def test_multicore_duplicates_and_lists(executor, name):
+    values = [random.Random(k).choice([1, 2, 2, 3]) for k in range(MIN_PARALLEL_SIZE)]
+    stats = sort_parallel(list(values), name, workers=4, executor=executor)
+    assert stats.values == sorted(values)
+
+
+@pytest.mark.parametrize("name", PARALLEL_SORTS)
+@pytest.mark.parametrize("values", [[], [1], [3, 1, 2], list(range(100, 0, -1))])
+def test_multicore_small_inputs_sort_in_process(name, values):
+    # Below MIN_PARALLEL_SIZE no pool is needed, so no executor is passed.
+    assert sort_parallel(list(values), name, workers=4).values == sorted(values)
+
+
+@pytest.mark.parametrize("name", PARALLEL_SORTS)
+@pytest.mark.parametrize("n", [0, 1, 7, 500])
+def test_step_generators(name, n):
+    values = _values(n)
+    stats = sort(list(values), name)
+    assert stats.values == sorted(values)
+
+
+def test_sort_parallel_rejects_other_sorts():
+    with pytest.raises(ValueError):
+        sort_parallel([2, 1], "Quick Sort")
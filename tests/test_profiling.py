@@ -0,0 +1,58 @@
+import cProfile
+import importlib.util
+import json
+import pstats
+
+from graphicalSortLib.core import sort
+from graphicalSortLib.profiling import ProfileOptions, format_summary, time_breakdown
+
+FAKE_APP = """
+def busy(n):
+    return sum(range(n))
+
+
+def update_plot():
+    busy(200_000)
+
+
+def _draw_visual_frame():
+    busy(100_000)
+    update_plot()
+
+
+def run():
+    for _ in range(5):
+        _draw_visual_frame()
+    update_plot()
+"""
+
+
+def test_breakdown_parts_do_not_overlap(tmp_path):
+    # The breakdown finds the drawing functions by file name, so the stand-in must be called app.py.
+    (tmp_path / "app.py").write_text(FAKE_APP)
+    spec = importlib.util.spec_from_file_location("fake_app", tmp_path / "app.py")
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+
+    profile = cProfile.Profile()
+    profile.enable()
+    app.run()
+    profile.disable()
+    stats = pstats.Stats(profile)
+    breakdown = time_breakdown(stats)
+
+    parts = sum(seconds for label, seconds in breakdown.items() if label != "total")
+    assert parts <= breakdown["total"]
+    # _draw_visual_frame's own share leaves out its update_plot calls: about a third of update_plot's.
+    assert 0.15 < breakdown["_draw_visual_frame"] / breakdown["update_plot"] < 0.7
+
+
+def test_profiled_sort_writes_report(tmp_path):
+    stats = sort(list(range(300, 0, -1)), "Merge Sort", profile=ProfileOptions(str(tmp_path)))
+    report = stats.profile
+    assert stats.values == list(range(1, 301))
+    assert report.breakdown["algorithm"] > 0
+    assert report.peak_kib is not None
+    assert (tmp_path / "merge_sort.pstats").exists()
+    assert json.loads((tmp_path / "merge_sort.profile.json").read_text())["algorithm"] == "Merge Sort"
+    assert "algorithm" in format_summary(report) and "peak" in format_summary(report)
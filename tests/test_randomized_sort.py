@@ -0,0 +1,67 @@
+import pytest
+
+from graphicalSortLib.algorithms.randomized_sort import (
+    bogobogosort,
+    bogosort,
+    bozosort,
+    distinct_permutations,
+    expected_attempts,
+)
+from graphicalSortLib.core import sort
+
+SORTS = [bogosort, bozosort, bogobogosort]
+
+
+def test_expected_attempts():
+    assert distinct_permutations([3, 1, 2]) == 6
+    assert distinct_permutations([1, 1, 2, 2]) == 6
+    assert expected_attempts([4, 3, 2, 1]) == 23
+    assert expected_attempts([]) == 0
+
+
+@pytest.mark.parametrize("run", SORTS)
+def test_sorts_small_input(run):
+    values = [4, 1, 3, 2, 2]
+    report = run(values, seed=7)
+    assert report.sorted
+    assert values == [1, 2, 2, 3, 4]
+    assert report.attempts > 0
+
+
+@pytest.mark.parametrize("run", SORTS)
+def test_same_seed_same_run(run):
+    first = [5, 2, 4, 1, 3]
+    second = list(first)
+    assert run(first, seed=12).attempts == run(second, seed=12).attempts
+    assert first == second
+
+
+@pytest.mark.parametrize("run", SORTS)
+def test_sorted_input_takes_no_attempts(run):
+    values = [1, 2, 3]
+    report = run(values, seed=1)
+    assert report.sorted and report.attempts == 0
+
+
+@pytest.mark.parametrize("run", SORTS)
+def test_attempt_budget(run):
+    values = list(range(30, 0, -1))
+    report = run(values, seed=3, max_attempts=25)
+    assert not report.sorted
+    assert report.attempts == 25
+    assert sorted(values) == list(range(1, 31))
+
+
+@pytest.mark.parametrize("run", SORTS)
+def test_time_budget(run):
+    report = run(list(range(40, 0, -1)), seed=3, max_attempts=None, time_budget=0.01)
+    assert not report.sorted
+    assert report.elapsed < 1.0
+
+
+@pytest.mark.parametrize("name", ["Bogo Sort", "Bozo Sort", "Bogobogo Sort"])
+def test_core_sort_passes_seed(name):
+    runs = [sort([3, 1, 4, 1, 5, 2], name, seed=99) for _ in range(2)]
+    assert runs[0].result == runs[1].result._replace(elapsed=runs[0].result.elapsed)
+    assert runs[0].steps == runs[1].steps
+    assert runs[0].values == [1, 1, 2, 3, 4, 5]
@@ -0,0 +1,109 @@
+import importlib.metadata
+import sys
+
+import pytest
+
+from graphicalSortLib import core, registry
+from graphicalSortLib.registry import SEARCH, SORT, AlgorithmInfo
+
+GNOME_SORT = '''
+from graphicalSortLib.algorithms.events import COMPARE, SWAP
+
+
+def gnome_sort_steps(array):
+    i = 1
+    while i < len(array):
+        yield COMPARE, i, i - 1, 0
+        if i and array[i] < array[i - 1]:
+            array[i], array[i - 1] = array[i - 1], array[i]
+            yield SWAP, i, i - 1, 0
+            i -= 1
+        else:
+            i += 1
+'''
+
+
+class _EntryPoint:
+    def __init__(self, name, load):
+        self.name = name
+        self.load = load
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_registry", {})
+    monkeypatch.setattr(registry, "_loaded_steps", {})
+    monkeypatch.setattr(registry, "_discovered", False)
+    return monkeypatch
+
+
+def _plugins(monkeypatch, *entry_points):
+    def fake_entry_points(group):
+        assert group == registry.ENTRY_POINT_GROUP
+        return list(entry_points)
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", fake_entry_points)
+
+
+def test_builtins_are_listed_without_importing_them():
+    names = registry.algorithm_names(SORT)
+    assert {"Quick Sort", "Merge Sort", "Counting Sort"} <= set(names)
+    assert registry.algorithm_names(SEARCH) == ["Linear Search", "Binary Search"]
+    assert registry.algorithm_info("Merge Sort").describe().startswith("best n log n")
+
+
+def test_unknown_algorithm():
+    with pytest.raises(KeyError):
+        registry.algorithm_info("Sleep Sort")
+    with pytest.raises(KeyError):
+        core.sort([2, 1], "Binary Search")
+
+
+def test_every_builtin_loads_and_sorts():
+    for name in registry.algorithm_names(SORT):
+        if registry.algorithm_info(name).randomized:
+            continue
+        assert list(core.sort([3, 1, 2, 5, 4], name).values) == [1, 2, 3, 4, 5], name
+
+
+def test_estimate_steps_grows():
+    for name in registry.algorithm_names():
+        assert registry.estimate_steps(name, 0) == 0
+        assert 0 < registry.estimate_steps(name, 100) <= registry.estimate_steps(name, 10_000)
+
+
+def test_entry_point_plugin(fresh_registry, tmp_path):
+    (tmp_path / "gnome_plugin.py").write_text(GNOME_SORT)
+    fresh_registry.syspath_prepend(str(tmp_path))
+    fresh_registry.delitem(sys.modules, "gnome_plugin", raising=False)
+    info = AlgorithmInfo("Gnome Sort", SORT, "gnome_plugin:gnome_sort_steps", "n", "n^2", "n^2", True, True)
+    _plugins(fresh_registry, _EntryPoint("gnome", lambda: info))
+
+    assert registry.algorithm_names(SORT)[-1] == "Gnome Sort"
+    assert "gnome_plugin" not in sys.modules
+    stats = core.sort([4, 2, 3, 1], "Gnome Sort")
+    assert stats.values == [1, 2, 3, 4] and stats.swaps == 5
+
+
+def test_entry_point_with_several_algorithms(fresh_registry):
+    infos = [AlgorithmInfo(name, SORT, "x:y", "n", "n", "n") for name in ("A Sort", "B Sort")]
+    _plugins(fresh_registry, _EntryPoint("pair", lambda: infos))
+    assert registry.algorithm_names(SORT)[-2:] == ["A Sort", "B Sort"]
+
+
+def test_broken_plugins_are_skipped(fresh_registry):
+    def broken():
+        raise ImportError("no such module")
+
+    duplicate = AlgorithmInfo("Quick Sort", SORT, "x:y", "n", "n", "n")
+    _plugins(fresh_registry, _EntryPoint("broken", broken), _EntryPoint("duplicate", lambda: duplicate))
+    with pytest.warns(RuntimeWarning) as caught:
+        names = registry.algorithm_names()
+    assert ["broken" in str(w.message) for w in caught] == [True, False]
+    assert names.count("Quick Sort") == 1
+    assert registry.algorithm_info("Quick Sort").steps != "x:y"
+
+
+def test_register_rejects_unknown_kind(fresh_registry):
+    with pytest.raises(ValueError):
+        registry.register(AlgorithmInfo("X", "shuffle", "x:y", "n", "n", "n"))
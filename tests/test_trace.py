@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from graphicalSortLib.algorithms.events import StepSink, drive
+from graphicalSortLib.algorithms.quick_sort import quick_sort_steps
+from graphicalSortLib.replay import TraceReplay
+from graphicalSortLib.trace import TraceFormatError, TraceReader, decode_events, encode_events, record
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(5)
+    return [rng.randrange(1, 500) for _ in range(400)]
+
+
+def _events(values):
+    events = []
+
+    class Recorder(StepSink):
+        def on_step(self, kind, a, b, c):
+            events.append((kind, a, b, c))
+
+    drive(quick_sort_steps(list(values)), Recorder(list(values)))
+    return events
+
+
+def test_events_round_trip(values):
+    events = _events(values)
+    assert list(decode_events(encode_events(events))) == events
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_record_and_read(tmp_path, values, compress):
+    reader = record(tmp_path / "quick.gstrace", "Quick Sort", values, compress=compress, chunk_events=256)
+    assert reader.complete
+    assert reader.initial_array == values
+    assert reader.total_steps == len(list(reader.iter_events())) > 0
+
+
+def test_search_trace_keeps_result(tmp_path):
+    values = list(range(0, 200, 2))
+    reader = record(tmp_path / "search.gstrace", "Binary Search", values, target=42)
+    assert reader.result == 21
+
+
+def test_keyframe_seek_matches_replay_from_start(tmp_path, values):
+    path = tmp_path / "quick.gstrace"
+    record(path, "Quick Sort", values, chunk_events=128, keyframe_interval=500)
+    forward = TraceReplay.open(path)
+    assert len(forward._keyframe_steps) > 2
+    seeking = TraceReplay.open(path)
+    for step in (forward.total_steps // 3, 1, forward.total_steps, forward.total_steps // 2, 0):
+        forward.seek(0)
+        while forward.position < step:
+            forward.step(1)
+        seeking.seek(step)
+        assert seeking.array == forward.array
+        assert seeking.sink.states == forward.sink.states
+    seeking.seek(seeking.total_steps)
+    assert seeking.array == sorted(values)
+
+
+def test_truncated_trace_replays_whole_chunks(tmp_path, values):
+    path = tmp_path / "quick.gstrace"
+    full = record(path, "Quick Sort", values, chunk_events=256)
+    data = path.read_bytes()
+    for cut in (len(data) // 2, len(data) - 5):
+        cut_path = tmp_path / f"cut{cut}.gstrace"
+        cut_path.write_bytes(data[:cut])
+        replay = TraceReplay.open(cut_path)
+        assert not replay.reader.complete
+        assert 0 < replay.total_steps <= full.total_steps
+        replay.seek(replay.total_steps)
+        replay.seek(replay.total_steps // 2)
+        assert sorted(replay.array) == sorted(values)
+
+
+@pytest.mark.parametrize("cut", [0, 5, 20, 200])
+def test_unreadable_trace_raises_format_error(tmp_path, values, cut):
+    path = tmp_path / "quick.gstrace"
+    record(path, "Quick Sort", values)
+    cut_path = tmp_path / "cut.gstrace"
+    cut_path.write_bytes(path.read_bytes()[:cut])
+    with pytest.raises(TraceFormatError):
+        TraceReader(cut_path)
+
+
+def test_corrupt_chunk_raises_format_error(tmp_path, values):
+    path = tmp_path / "quick.gstrace"
+    reader = record(path, "Quick Sort", values)
+    data = bytearray(path.read_bytes())
+    _kind, _first, _count, offset, size = reader.event_chunks[0]
+    data[offset:offset + size] = bytes(size)
+    path.write_bytes(bytes(data))
+    with pytest.raises(TraceFormatError):
+        TraceReader(path).read_events(reader.event_chunks[0])
+
+
+def test_reverse_playback_matches_forward(tmp_path, values):
+    path = tmp_path / "merge.gstrace"
+    record(path, "Merge Sort", values[:120], chunk_events=64, keyframe_interval=300)
+    forward = TraceReplay.open(path)
+    snapshots = {}
+    while not forward.at_end:
+        snapshots[forward.position] = (list(forward.array), bytes(forward.sink.states), forward.sink.highlight)
+        forward.step(7)
+    snapshots[forward.position] = (list(forward.array), bytes(forward.sink.states), forward.sink.highlight)
+
+    backward = TraceReplay.open(path)
+    backward.seek(backward.total_steps)
+    for position in sorted(snapshots, reverse=True):
+        backward.seek(position)
+        assert (list(backward.array), bytes(backward.sink.states), backward.sink.highlight) == snapshots[position]
+    assert backward.array == values[:120]